@@ -1,33 +1,38 @@
-from pathlib import Path
+import functools
 
-file_name = Path("input.txt")
+from aoc.inputs import iter_chunk_spans
+from aoc.parallel import map_file_chunks
+from aoc.topk import TopK
 
+TOP_ELVES = 1
+# bytes parsed at once, big enough for the split to be cheap & small enough for the cache
+READ_SIZE = 1 << 20
 
-def main():
-    with open(file_name) as f:
-        answer = process_file(f)
-    print(f"THE ANSWER IS: {answer}")
 
+def main(file_name):
+    top_calories = get_top_calories_of_file(file_name, TOP_ELVES)
+    answer = max(top_calories.largest(), default=0)
+    print(f"THE ANSWER IS: {answer}")
 
-def process_file(f):
-    max_calories = 0
-    current_elf_calories = 0
 
-    for line in f.readlines():
-        line = line.replace("\n", "")
-        # empty line is an elf separator
-        if not line:
-            max_calories = max(max_calories, current_elf_calories)
-            current_elf_calories = 0
-            continue
+def get_top_calories_of_file(file_name, k):
+    # the chunks end at a blank line, so every elf is counted in exactly one of them
+    top_calories = TopK(k)
+    get_top_calories_of_chunk = functools.partial(get_top_calories, k=k)
+    for chunk_top_calories in map_file_chunks(get_top_calories_of_chunk, file_name):
+        top_calories.merge(chunk_top_calories)
+    return top_calories
 
-        line_calorie = int(line)
-        current_elf_calories += line_calorie
 
-    # the file might not end with an empty line
-    max_calories = max(max_calories, current_elf_calories)
-    return max_calories
+def get_top_calories(data, start, end, k):
+    top_calories = TopK(k)
+    for read_start, read_end in iter_chunk_spans(data, READ_SIZE, start=start, end=end):
+        # empty line is an elf separator
+        for elf in data[read_start:read_end].split(b"\n\n"):
+            if snacks := elf.split():
+                top_calories.push(sum(map(int, snacks)))
+    return top_calories
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
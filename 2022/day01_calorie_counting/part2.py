@@ -1,45 +1,37 @@
-from pathlib import Path
+import functools
 
-file_name = Path("input.txt")
+from aoc.inputs import iter_chunk_spans
+from aoc.parallel import map_file_chunks
+from aoc.topk import TopK
 
-
-def main():
-    with open(file_name) as f:
-        answer = process_file(f)
-    print(f"THE ANSWER IS: {answer}")
+TOP_ELVES = 3
+# bytes parsed at once, big enough for the split to be cheap & small enough for the cache
+READ_SIZE = 1 << 20
 
 
-def process_file(f):
-    top3_calories = list()
-    current_elf_calories = 0
-
-    for line in f.readlines():
-        line = line.replace("\n", "")
-        # empty line is an elf separator
-        if not line:
-            top3_calories = update_max_calories(top3_calories, current_elf_calories)
-            current_elf_calories = 0
-            continue
-
-        line_calorie = int(line)
-        current_elf_calories += line_calorie
+def main(file_name):
+    answer = sum(get_top_calories_of_file(file_name, TOP_ELVES).largest())
+    print(f"THE ANSWER IS: {answer}")
 
-    # the file might not end with an empty line
-    top3_calories = update_max_calories(top3_calories, current_elf_calories)
-    return sum(top3_calories)
 
+def get_top_calories_of_file(file_name, k):
+    # the chunks end at a blank line, so every elf is counted in exactly one of them
+    top_calories = TopK(k)
+    get_top_calories_of_chunk = functools.partial(get_top_calories, k=k)
+    for chunk_top_calories in map_file_chunks(get_top_calories_of_chunk, file_name):
+        top_calories.merge(chunk_top_calories)
+    return top_calories
 
-def update_max_calories(top3_calories, current_elf_calories):
-    if len(top3_calories) < 3:
-        top3_calories.append(current_elf_calories)
-        return top3_calories
 
-    min_top_calories = min(top3_calories)
-    if current_elf_calories > min_top_calories:
-        top3_calories.remove(min_top_calories)
-        top3_calories.append(current_elf_calories)
-    return top3_calories
+def get_top_calories(data, start, end, k):
+    top_calories = TopK(k)
+    for read_start, read_end in iter_chunk_spans(data, READ_SIZE, start=start, end=end):
+        # empty line is an elf separator
+        for elf in data[read_start:read_end].split(b"\n\n"):
+            if snacks := elf.split():
+                top_calories.push(sum(map(int, snacks)))
+    return top_calories
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -1,6 +1,12 @@
 import enum
+import functools
+import itertools
 
-FILE_NAME = "input.txt"
+from aoc.inputs import iter_chunk_spans
+from aoc.parallel import map_file_chunks
+
+# bytes counted at once
+READ_SIZE = 1 << 20
 
 
 @enum.unique
@@ -17,24 +23,46 @@ class Result(enum.Enum):
     LOSS = 0
 
 
-def main():
-    with open(FILE_NAME) as f:
-        answer = process_file(f)
+def main(file_name):
+    # the rounds are independent, so every chunk of whole lines is scored on its own
+    answer = sum(map_file_chunks(score_rounds, file_name, separator=b"\n"))
     print(f"THE ANSWER IS: {answer}")
 
 
-def process_file(f):
+def score_rounds(data, start, end):
+    """
+    Counts how often each of the nine possible rounds occurs, instead of translating the
+    rounds one by one, and weighs the counts with their scores
+    """
+    round_scores = get_round_scores()
     total = 0
+    for read_start, read_end in iter_chunk_spans(data, READ_SIZE, b"\n", start, end):
+        rounds = data[read_start:read_end]
+        if b"\r" in rounds:
+            # Windows line breaks
+            rounds = rounds.replace(b"\r\n", b"\n")
+        counts = {round_: rounds.count(round_) for round_ in round_scores}
+        num_rounds = sum(counts.values())
+        # every line is a round of 3 bytes & a line break, which only the last may lack
+        if (
+            len(rounds) not in (4 * num_rounds, 4 * num_rounds - 1)
+            or rounds[3::4].count(b"\n") != len(rounds) // 4
+        ):
+            raise ValueError(f"Received unexpected rounds in {bytes(rounds[:32])!r}")
+        total += sum(round_scores[round_] * count for round_, count in counts.items())
+    return total
+
 
-    for line in f.readlines():
-        opponent_char, my_char = line.split()
+@functools.cache
+def get_round_scores():
+    """The score of every possible round, e.g. `b"A Y"`"""
+    scores = {}
+    for opponent_char, my_char in itertools.product("ABC", "XYZ"):
         opponent_action = translate_input(opponent_char)
         my_action = translate_input(my_char)
-
         result = determine_winner(opponent_action, my_action)
-
-        total += result.value + my_action.value
-    return total
+        scores[f"{opponent_char} {my_char}".encode()] = result.value + my_action.value
+    return scores
 
 
 def determine_winner(opponent_action, my_action):
@@ -64,4 +92,4 @@ def translate_input(char):
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
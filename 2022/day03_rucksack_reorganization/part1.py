@@ -1,24 +1,43 @@
 import string
 
-PRIOS = {letter: index + 1 for index, letter in enumerate(string.ascii_letters)}
+from aoc.inputs import iter_chunk_spans
+from aoc.parallel import map_file_chunks
 
+INVALID = 255
 
-def main():
-    with open("input.txt") as f:
-        answer = process_file(f)
+
+def make_item_codes():
+    """Twice the priority of every item, 0 for line breaks & 255 for other bytes"""
+    codes = bytearray([INVALID]) * 256
+    for priority, item in enumerate(string.ascii_letters.encode(), 1):
+        codes[item] = 2 * priority
+    codes[ord("\n")] = codes[ord("\r")] = 0
+    return bytes(codes)
+
+
+ITEM_CODES = make_item_codes()
+# the codes of all priorities, in order, with one byte of a mask each
+CODES = bytes(range(2, 2 * len(string.ascii_letters) + 1, 2))
+# the lowest bit of every byte of a mask
+MASK_BITS = int.from_bytes(b"\x01" * len(CODES), "little")
+# bytes parsed at once
+READ_SIZE = 1 << 20
+
+
+def main(file_name):
+    # the rucksacks are independent, so every chunk of whole lines is summed on its own
+    answer = sum(map_file_chunks(process_chunk, file_name, separator=b"\n"))
     print(f"THE ANSWER IS: {answer}")
 
 
-def process_file(f):
+def process_chunk(data, start, end):
     total = 0
 
-    for line in f.readlines():
-        line = line.strip()
-
-        items1, items2 = split_items(line)
-        common_item = get_common_item(items1, items2)
-        priority = determine_priority(common_item)
-        total += priority
+    for read_start, read_end in iter_chunk_spans(data, READ_SIZE, b"\n", start, end):
+        codes = translate_items(data, read_start, read_end)
+        for line in filter(None, codes.split(b"\0")):
+            items1, items2 = split_items(line)
+            total += get_common_priority(items1, items2)
 
     return total
 
@@ -29,15 +48,29 @@ def split_items(items):
     return items[:middle], items[middle:]
 
 
-def get_common_item(items1, items2):
-    commons = set(items1) & set(items2)
-    assert len(commons) == 1
-    return list(commons)[0]
+def get_common_priority(items1, items2):
+    # the only bit both masks have is the common item's
+    common = get_mask(items1) & get_mask(items2)
+    assert common.bit_count() == 1
+    return (common.bit_length() + 7) // 8
+
+
+def get_mask(items):
+    """
+    The priorities of the item codes as bits, at `8 * (priority - 1)`: the codes of the
+    items are translated to 1, and the others stay even
+    """
+    marked = CODES.translate(bytes.maketrans(items, b"\x01" * len(items)))
+    return int.from_bytes(marked, "little") & MASK_BITS
 
 
-def determine_priority(item):
-    return PRIOS[item]
+def translate_items(data, start, end):
+    """The item codes of the lines, which are split at the 0s"""
+    codes = data[start:end].translate(ITEM_CODES)
+    if (position := codes.find(INVALID)) >= 0:
+        raise ValueError(f"Received unexpected item {chr(data[start + position])!r}")
+    return codes
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -0,0 +1,35 @@
+"""
+Overlaps across all section assignments instead of within each pair, for capacity
+planning: which assignments overlap, and how many elves clean the same section at most.
+"""
+import itertools
+import re
+
+from aoc.intervals import IntervalIndex
+
+# the dashes separate the sections, they aren't signs
+SECTION_ID = re.compile(r"\d+")
+
+
+def main(file_name):
+    with open(file_name) as f:
+        assignments = parse_file(f)
+
+    index = IntervalIndex(assignments)
+    num_overlapping_pairs = sum(1 for _ in index.overlapping_pairs())
+    print(f"{len(index)} assignments, {num_overlapping_pairs} overlapping pairs")
+
+    deepest = index.max_depth()
+    if deepest is not None:
+        assert len(index.stab(deepest.section)) == deepest.depth
+        print(f"{deepest.depth} elves clean section {deepest.section}, the most")
+
+
+def parse_file(f):
+    """All assignments as (first section, last section), two per line"""
+    section_ids = map(int, SECTION_ID.findall(f.read()))
+    return list(itertools.batched(section_ids, 2))
+
+
+if __name__ == "__main__":
+    main("input.txt")
@@ -1,5 +1,5 @@
-def main():
-    with open("input.txt") as f:
+def main(file_name):
+    with open(file_name) as f:
         answer = process_file(f)
     print(f"THE ANSWER IS: {answer}")
 
@@ -32,4 +32,4 @@ def process_file(f):
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -23,28 +23,31 @@ CRATES = {
 }
 
 
-def main():
-    with open("input.txt") as f:
-        process_file(f)
+def main(file_name):
+    with open(file_name) as f:
+        crates = process_file(f)
 
-    answer = generate_message()
+    answer = generate_message(crates)
     print(f"THE ANSWER IS: {answer}")
 
 
 def process_file(f):
+    # the initial stacks stay untouched, so they can be used for several inputs
+    crates = {slot: list(stack) for slot, stack in CRATES.items()}
     for idx, line in enumerate(f.readlines()):
         amount, source, target = map(int, line.split()[1::2])
-        crates_to_move = CRATES[source][-amount:]
-        CRATES[target] += crates_to_move
-        del CRATES[source][-amount:]
+        crates_to_move = crates[source][-amount:]
+        crates[target] += crates_to_move
+        del crates[source][-amount:]
+    return crates
 
 
-def generate_message():
+def generate_message(crates):
     message = ""
-    for slot in CRATES.values():
+    for slot in crates.values():
         message += slot[-1]
     return message
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -1,5 +1,5 @@
-def main():
-    with open("input.txt") as f:
+def main(file_name):
+    with open(file_name) as f:
         buffer = f.read().strip()
 
     idx = 0
@@ -15,4 +15,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -35,23 +35,21 @@ class File:
     size: int
 
 
-DIRECTORIES = list()
-
-
-def main():
-    with open("input.txt") as f:
+def main(file_name):
+    with open(file_name) as f:
         answer = process_file(f)
     print(f"THE ANSWER IS: {answer}")
 
 
 def process_file(f):
-    build_file_system(f)
-    return compute_answer()
+    directories = build_file_system(f)
+    return compute_answer(directories)
 
 
 def build_file_system(f):
     root = Directory(name="/", parent_directory=None)
-    DIRECTORIES.append(root)
+    # all directories, starting with the root
+    directories = [root]
 
     current_directory = root
     for line in f.readlines():
@@ -80,7 +78,7 @@ def build_file_system(f):
             name = part2
             sub_dir = Directory(name=name, parent_directory=current_directory)
             current_directory.directories[name] = sub_dir
-            DIRECTORIES.append(sub_dir)
+            directories.append(sub_dir)
         else:
             size, name = part1, part2
             # entry is a file
@@ -92,14 +90,15 @@ def build_file_system(f):
 
             file_ = File(name=name, size=size)
             current_directory.files.add(file_)
+    return directories
 
 
-def compute_answer():
+def compute_answer(directories):
     limit = 100_000
-    dirs_and_sizes = [(dir_, dir_.get_size()) for dir_ in DIRECTORIES]
+    dirs_and_sizes = [(dir_, dir_.get_size()) for dir_ in directories]
     small_dir_sizes = [size for (dir_, size) in dirs_and_sizes if size <= limit]
     return sum(small_dir_sizes)
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -35,23 +35,21 @@ class File:
     size: int
 
 
-DIRECTORIES = list()
-
-
-def main():
-    with open("input.txt") as f:
+def main(file_name):
+    with open(file_name) as f:
         answer = process_file(f)
     print(f"THE ANSWER IS: {answer}")
 
 
 def process_file(f):
-    root = build_file_system(f)
-    return compute_answer(root)
+    directories = build_file_system(f)
+    return compute_answer(directories)
 
 
 def build_file_system(f):
     root = Directory(name="/", parent_directory=None)
-    DIRECTORIES.append(root)
+    # all directories, starting with the root
+    directories = [root]
 
     current_directory = root
     for line in f.readlines():
@@ -80,7 +78,7 @@ def build_file_system(f):
             name = part2
             sub_dir = Directory(name=name, parent_directory=current_directory)
             current_directory.directories[name] = sub_dir
-            DIRECTORIES.append(sub_dir)
+            directories.append(sub_dir)
         else:
             size, name = part1, part2
             # entry is a file
@@ -92,10 +90,11 @@ def build_file_system(f):
 
             file_ = File(name=name, size=size)
             current_directory.files.add(file_)
-    return root
+    return directories
 
 
-def compute_answer(root):
+def compute_answer(directories):
+    root = directories[0]
     total_space = 70_000_000
     update_space = 30_000_000
     total_used_space = root.get_size()
@@ -103,7 +102,7 @@ def compute_answer(root):
     needed_space = update_space - currently_unused_space
     assert needed_space > 0
 
-    dirs_and_sizes = [(dir_, dir_.get_size()) for dir_ in DIRECTORIES]
+    dirs_and_sizes = [(dir_, dir_.get_size()) for dir_ in directories]
     sorted_dirs_and_sizes = sorted(dirs_and_sizes, key=lambda x: x[1])
     for dir_, size in sorted_dirs_and_sizes:
         if size >= needed_space:
@@ -112,4 +111,4 @@ def compute_answer(root):
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -2,20 +2,20 @@ Location = tuple[int, int]
 Matrix = list[list[int]]
 
 
-def main():
-    matrix = parse_file()
+def main(file_name):
+    with open(file_name) as f:
+        matrix = parse_file(f)
     horizontal_visibles = process_horizontally(matrix, transposed=False)
     vertical_visibles = process_horizontally(matrix, transposed=True)
     answer = len(horizontal_visibles | vertical_visibles)
     print(f"THE ANSWER IS: {answer}")
 
 
-def parse_file() -> Matrix:
+def parse_file(f) -> Matrix:
     matrix = list()
-    with open("input.txt") as f:
-        for line in f.readlines():
-            heights = [int(char) for char in line.strip()]
-            matrix.append(heights)
+    for line in f.readlines():
+        heights = [int(char) for char in line.strip()]
+        matrix.append(heights)
     return matrix
 
 
@@ -57,4 +57,4 @@ def check_horizontally(
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -3,8 +3,9 @@ ScoreMapping = dict[Location, int]
 Matrix = list[list[int]]
 
 
-def main():
-    matrix = parse_file()
+def main(file_name):
+    with open(file_name) as f:
+        matrix = parse_file(f)
     horizontal_scores = process_horizontally(matrix, transposed=False)
     vertical_scores = process_horizontally(matrix, transposed=True)
     scores = merge_scores(horizontal_scores, vertical_scores)
@@ -12,12 +13,11 @@ def main():
     print(f"THE ANSWER IS: {answer}")
 
 
-def parse_file() -> Matrix:
+def parse_file(f) -> Matrix:
     matrix = list()
-    with open("input.txt") as f:
-        for line in f.readlines():
-            heights = [int(char) for char in line.strip()]
-            matrix.append(heights)
+    for line in f.readlines():
+        heights = [int(char) for char in line.strip()]
+        matrix.append(heights)
     return matrix
 
 
@@ -74,4 +74,4 @@ def merge_scores(scores1: ScoreMapping, scores2: ScoreMapping) -> ScoreMapping:
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -66,8 +66,8 @@ class Rope:
         return self.tail_x, self.tail_y
 
 
-def main():
-    with open("input.txt") as f:
+def main(file_name):
+    with open(file_name) as f:
         answer = process_file(f)
     print(f"THE ANSWER IS: {answer}")
 
@@ -86,4 +86,4 @@ def process_file(f) -> int:
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -50,8 +50,8 @@ class Knot:
         return self.x, self.y
 
 
-def main():
-    with open("input.txt") as f:
+def main(file_name):
+    with open(file_name) as f:
         answer = process_file(f)
     print(f"THE ANSWER IS: {answer}")
 
@@ -71,4 +71,4 @@ def process_file(f) -> int:
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
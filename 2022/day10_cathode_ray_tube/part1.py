@@ -24,8 +24,8 @@ class Register:
             self.signal_strengths.append(signal_strength)
 
 
-def main():
-    with open("input.txt") as f:
+def main(file_name):
+    with open(file_name) as f:
         answer = process_file(f)
     print(f"THE ANSWER IS: {answer}")
 
@@ -46,4 +46,4 @@ def process_file(f) -> int:
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
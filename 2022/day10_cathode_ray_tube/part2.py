@@ -1,7 +1,6 @@
+import itertools
 from dataclasses import dataclass, field
 
-from setuptools._vendor.more_itertools import chunked
-
 
 @dataclass
 class Register:
@@ -27,11 +26,11 @@ class Register:
             self.outputs.append(".")
 
 
-def main():
-    with open("input.txt") as f:
+def main(file_name):
+    with open(file_name) as f:
         outputs = process_file(f)
 
-    for output_line in chunked(outputs, 40):
+    for output_line in itertools.batched(outputs, 40):
         print("".join(output_line))
 
 
@@ -51,4 +50,4 @@ def process_file(f) -> list[str]:
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -1,3 +1,4 @@
+import copy
 from collections.abc import Callable
 from dataclasses import dataclass
 
@@ -89,13 +90,13 @@ MONKEYS = [
         if_false_monkey=5,
     ),
 ]
-MONKEYS_BY_ID = {m.id: m for m in MONKEYS}
-
-
 def main():
-    inspection_counter = {m.id: 0 for m in MONKEYS}
+    # the monkeys pass their items around, so they're copied for repeated runs
+    monkeys = copy.deepcopy(MONKEYS)
+    monkeys_by_id = {m.id: m for m in monkeys}
+    inspection_counter = {m.id: 0 for m in monkeys}
     for i in range(20):
-        for monkey in MONKEYS:
+        for monkey in monkeys:
             for idx, item in enumerate(monkey.items):
                 inspection_counter[monkey.id] += 1
 
@@ -103,7 +104,7 @@ def main():
                 inspected_item //= 3
 
                 next_monkey_id = monkey.get_next_monkey_id(inspected_item)
-                next_monkey = MONKEYS_BY_ID[next_monkey_id]
+                next_monkey = monkeys_by_id[next_monkey_id]
 
                 next_monkey.items.append(inspected_item)
 
@@ -1,3 +1,4 @@
+import copy
 import math
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -87,19 +88,19 @@ MONKEYS = [
         if_false_monkey=5,
     ),
 ]
-MONKEYS_BY_ID = {m.id: m for m in MONKEYS}
-
-
 def main():
-    inspection_counter = {m.id: 0 for m in MONKEYS}
+    # the monkeys pass their items around, so they're copied for repeated runs
+    monkeys = copy.deepcopy(MONKEYS)
+    monkeys_by_id = {m.id: m for m in monkeys}
+    inspection_counter = {m.id: 0 for m in monkeys}
 
     # need a divisor that doesn't influence the remainders in all monkey's test's
     # -> use modulo of item value with the least common multiple of all monkey divisor
     # (since all monkey divisors are prime, that's just the multiple of all divisors)
-    factor = math.lcm(*[monkey.test_divisor for monkey in MONKEYS])
+    factor = math.lcm(*[monkey.test_divisor for monkey in monkeys])
 
     for i in range(10000):
-        for monkey in MONKEYS:
+        for monkey in monkeys:
             for item in monkey.items:
                 inspection_counter[monkey.id] += 1
 
@@ -107,7 +108,7 @@ def main():
                 inspected_item = inspected_item % factor
 
                 next_monkey_id = monkey.get_next_monkey_id(inspected_item)
-                next_monkey = MONKEYS_BY_ID[next_monkey_id]
+                next_monkey = monkeys_by_id[next_monkey_id]
 
                 next_monkey.items.append(inspected_item)
 
@@ -2,8 +2,8 @@ import ast
 import itertools
 
 
-def main():
-    with open("input.txt") as f:
+def main(file_name):
+    with open(file_name) as f:
         answer = process_file(f)
     print(f"THE ANSWER IS: {answer}")
 
@@ -63,4 +63,4 @@ def _is_ordered(val1, val2):
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -3,8 +3,8 @@ import functools
 import itertools
 
 
-def main():
-    with open("input.txt") as f:
+def main(file_name):
+    with open(file_name) as f:
         packets = parse_file(f)
 
     # add extra packets
@@ -68,4 +68,4 @@ def _is_ordered(val1, val2):
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -1,10 +1,16 @@
 import itertools
 
+from aoc.grid import Grid
+
 Point = tuple[int, int]
 
+AIR = ord(".")
+ROCK = ord("#")
+SAND = ord("o")
+
 
-def main():
-    with open("input.txt") as f:
+def main(file_name):
+    with open(file_name) as f:
         rock_points = parse_file(f)
 
     answer = simulate_sand_flow(rock_points)
@@ -52,59 +58,58 @@ def pairwise(iterable):
     return zip(a, b)
 
 
+def build_cave(
+    rock_points: set[Point], sand_source: Point, height: int
+) -> tuple[Grid, int]:
+    """
+    The cave with rows for y & cols for x, shifted so that sand can't leave it sideways:
+    falling sand moves at most one col per row, i.e. it stays within a triangle
+    """
+    source_x, _ = sand_source
+    min_x = min(source_x - height, *(point[0] for point in rock_points))
+    max_x = max(source_x + height, *(point[0] for point in rock_points))
+
+    grid = Grid(height, max_x - min_x + 1, fill=AIR)
+    for x, y in rock_points:
+        grid[grid.index(y, x - min_x)] = ROCK
+    return grid, min_x
+
+
 def simulate_sand_flow(rock_points: set[Point]) -> int:
     max_rock_y = max([point[1] for point in rock_points])
-    sand_source = (500, 0)
+    # one more row, which sand falls into when it has passed all rocks
+    grid, min_x = build_cave(rock_points, (500, 0), height=max_rock_y + 2)
+    sand_source = grid.index(0, 500 - min_x)
+    abyss = grid.index(max_rock_y + 1, 0)
 
-    sand_rest_points: set[Point] = set()
     current_sand = sand_source
-    while current_sand[1] <= max_rock_y:
-        blocked_points = rock_points | sand_rest_points
-        if (current_sand[0], current_sand[1] + 1) not in blocked_points:
+    while current_sand < abyss:
+        below = current_sand + grid.down
+        if grid[below] == AIR:
             # straight down
-            current_sand = (current_sand[0], current_sand[1] + 1)
-        elif (current_sand[0] - 1, current_sand[1] + 1) not in blocked_points:
+            current_sand = below
+        elif grid[below + grid.left] == AIR:
             # diagonally down left
-            current_sand = (current_sand[0] - 1, current_sand[1] + 1)
-        elif (current_sand[0] + 1, current_sand[1] + 1) not in blocked_points:
+            current_sand = below + grid.left
+        elif grid[below + grid.right] == AIR:
             # diagonally down right
-            current_sand = (current_sand[0] + 1, current_sand[1] + 1)
+            current_sand = below + grid.right
         else:
             # sand can't move, so it comes to a rest
-            sand_rest_points.add(current_sand)
+            grid[current_sand] = SAND
             current_sand = sand_source
 
-    visualise(rock_points, sand_rest_points)
-    return len(sand_rest_points)
-
-
-def visualise(rock_points, sand_rest_points):
-    blocked_points = rock_points | sand_rest_points
-    x_coordinates = [p[0] for p in blocked_points]
-    y_coordinates = [p[1] for p in blocked_points]
-    min_x, max_x = min(x_coordinates), max(x_coordinates)
-    min_y, max_y = min(y_coordinates), max(y_coordinates)
-
-    chars = ""
-    for y_offset, x_offset in itertools.product(
-        range(max_y - min_y + 1),
-        range(max_x - min_x + 1),
-    ):
-        x = min_x + x_offset
-        y = min_y + y_offset
-        point = (x, y)
-        if point in rock_points:
-            chars += "#"
-        elif point in sand_rest_points:
-            chars += "o"
-        else:
-            chars += "."
+    visualise(grid)
+    return grid.count(SAND)
+
 
-    line_length = max_x - min_x + 1
-    lines = [chars[i : i + line_length] for i in range(0, len(chars), line_length)]
+def visualise(grid):
+    lines = [line for line in grid.to_lines() if line.strip(".")]
+    min_col = min(len(line) - len(line.lstrip(".")) for line in lines)
+    max_col = max(len(line.rstrip(".")) for line in lines)
     for line in lines:
-        print(line)
+        print(line[min_col:max_col])
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -1,13 +1,19 @@
 import itertools
 from collections import namedtuple
 
+from aoc.grid import Grid
+
 Point = namedtuple("Point", ["x", "y"])
 
 SAND_SOURCE = Point(500, 0)
 
+AIR = ord(".")
+ROCK = ord("#")
+SAND = ord("o")
+
 
-def main():
-    with open("input.txt") as f:
+def main(file_name):
+    with open(file_name) as f:
         rock_points = parse_file(f)
 
     answer = simulate_sand_flow(rock_points)
@@ -48,76 +54,59 @@ def points_from_path(path_coordinates: list[Point]) -> set[Point]:
     return points
 
 
+def build_cave(rock_points: set[Point], height: int) -> tuple[Grid, int]:
+    """
+    The cave with rows for y & cols for x, shifted so that sand can't leave it sideways:
+    falling sand moves at most one col per row, i.e. it stays within a triangle
+    """
+    min_x = min(SAND_SOURCE.x - height, *(point.x for point in rock_points))
+    max_x = max(SAND_SOURCE.x + height, *(point.x for point in rock_points))
+
+    grid = Grid(height, max_x - min_x + 1, fill=AIR)
+    for point in rock_points:
+        grid[grid.index(point.y, point.x - min_x)] = ROCK
+    return grid, min_x
+
+
 def simulate_sand_flow(rock_points: set[Point]) -> int:
     max_rock_y = max([point.y for point in rock_points])
     bottom_y = max_rock_y + 2
-    num_rocks = len(rock_points)
 
-    blocked_points = rock_points.copy()
-    current_sand = SAND_SOURCE
-    while SAND_SOURCE not in blocked_points:
-        if not is_blocked(
-            temp := Point(current_sand.x, current_sand.y + 1), blocked_points, bottom_y
-        ):
+    grid, min_x = build_cave(rock_points, height=bottom_y + 1)
+    # the floor is infinitely wide, but sand can't reach beyond the grid anyway
+    for col in range(grid.width):
+        grid[grid.index(bottom_y, col)] = ROCK
+    sand_source = grid.index(SAND_SOURCE.y, SAND_SOURCE.x - min_x)
+
+    current_sand = sand_source
+    while grid[sand_source] == AIR:
+        below = current_sand + grid.down
+        if grid[below] == AIR:
             # straight down
-            current_sand = temp
-        elif not is_blocked(
-            temp := Point(current_sand.x - 1, current_sand.y + 1),
-            blocked_points,
-            bottom_y,
-        ):
+            current_sand = below
+        elif grid[below + grid.left] == AIR:
             # diagonally down left
-            current_sand = temp
-        elif not is_blocked(
-            temp := Point(current_sand.x + 1, current_sand.y + 1),
-            blocked_points,
-            bottom_y,
-        ):
+            current_sand = below + grid.left
+        elif grid[below + grid.right] == AIR:
             # diagonally down right
-            current_sand = temp
+            current_sand = below + grid.right
         else:
             # sand can't move, so it comes to a rest
-            blocked_points.add(current_sand)
-            current_sand = SAND_SOURCE
-    # visualise(rock_points, blocked_points)
-    return len(blocked_points) - num_rocks
-
-
-def is_blocked(point, blocked_points, bottom_y):
-    return (point in blocked_points) or (point.y >= bottom_y)
-
-
-def visualise(rock_points, blocked_points):
-    sand_rest_points = blocked_points - rock_points
-    all_points = blocked_points | {SAND_SOURCE}
-
-    x_coordinates = [p.x for p in all_points]
-    y_coordinates = [p.y for p in all_points]
-    min_x, max_x = min(x_coordinates), max(x_coordinates)
-    min_y, max_y = min(y_coordinates), max(y_coordinates)
-
-    chars = ""
-    for y_offset, x_offset in itertools.product(
-        range(max_y - min_y + 1),
-        range(max_x - min_x + 1),
-    ):
-        x = min_x + x_offset
-        y = min_y + y_offset
-        point = (x, y)
-        if point in rock_points:
-            chars += "#"
-        elif point in sand_rest_points:
-            chars += "o"
-        elif point == SAND_SOURCE:
-            chars += "+"
-        else:
-            chars += "."
-
-    line_length = max_x - min_x + 1
-    lines = [chars[i : i + line_length] for i in range(0, len(chars), line_length)]
+            grid[current_sand] = SAND
+            current_sand = sand_source
+    # visualise(grid, sand_source)
+    return grid.count(SAND)
+
+
+def visualise(grid, sand_source):
+    grid = grid.copy()
+    grid[sand_source] = ord("+")
+    lines = [line for line in grid.to_lines() if line.strip(".")]
+    min_col = min(len(line) - len(line.lstrip(".")) for line in lines[:-1])
+    max_col = max(len(line.rstrip(".")) for line in lines[:-1])
     for line in lines:
-        print(line)
+        print(line[min_col:max_col])
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
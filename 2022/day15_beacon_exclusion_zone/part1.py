@@ -1,11 +1,12 @@
-import re
 from collections import namedtuple
 
+from aoc.parsing import int_rows
+
 Point = namedtuple("Point", ["x", "y"])
 
 
-def main():
-    with open("input.txt") as f:
+def main(file_name):
+    with open(file_name) as f:
         sensor_distances, beacon_points = parse_file(f)
     answer = covered_points(sensor_distances, beacon_points)
     print(f"THE ANSWER IS: {answer}")
@@ -14,13 +15,8 @@ def main():
 def parse_file(f) -> tuple[dict[Point, int], set[Point]]:
     beacon_points: set[Point] = set()
     sensor_distances: dict[Point, int] = dict()
-    for line in f.readlines():
-        line = line.strip()
-
-        groups = re.match(
-            r".+x=(-?\d+), y=(-?\d+).+x=(-?\d+), y=(-?\d+)", line
-        ).groups()
-        sensor_x, sensor_y, beacon_x, beacon_y = map(int, groups)
+    # every line has the coordinates of a sensor & its beacon
+    for sensor_x, sensor_y, beacon_x, beacon_y in int_rows(f.read(), 4):
         sensor = Point(sensor_x, sensor_y)
         beacon = Point(beacon_x, beacon_y)
         sensor_distances[sensor] = manhattan_distance(sensor, beacon)
@@ -42,7 +38,6 @@ def covered_points(
 
     start_x = min_x - max_distance
     end_x = max_x + max_distance
-    print(start_x, end_x)
 
     counter = 0
     y = 2_000_000
@@ -61,4 +56,4 @@ def covered_points(
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
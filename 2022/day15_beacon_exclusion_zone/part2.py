@@ -1,11 +1,13 @@
-import re
 from collections import namedtuple
 
+from aoc import telemetry
+from aoc.parsing import int_rows
+
 Point = namedtuple("Point", ["x", "y"])
 
 
-def main():
-    with open("input.txt") as f:
+def main(file_name):
+    with open(file_name) as f:
         sensor_distances, beacon_points = parse_file(f)
     point = find_distress_beacon(sensor_distances, beacon_points)
 
@@ -16,13 +18,8 @@ def main():
 def parse_file(f) -> tuple[dict[Point, int], set[Point]]:
     beacon_points: set[Point] = set()
     sensor_distances: dict[Point, int] = dict()
-    for line in f.readlines():
-        line = line.strip()
-
-        groups = re.match(
-            r".+x=(-?\d+), y=(-?\d+).+x=(-?\d+), y=(-?\d+)", line
-        ).groups()
-        sensor_x, sensor_y, beacon_x, beacon_y = map(int, groups)
+    # every line has the coordinates of a sensor & its beacon
+    for sensor_x, sensor_y, beacon_x, beacon_y in int_rows(f.read(), 4):
         sensor = Point(sensor_x, sensor_y)
         beacon = Point(beacon_x, beacon_y)
         sensor_distances[sensor] = manhattan_distance(sensor, beacon)
@@ -37,11 +34,13 @@ def manhattan_distance(p1: Point, p2: Point) -> int:
 def find_distress_beacon(
     sensor_distances: dict[Point, int], beacon_points: set[Point]
 ) -> Point:
+    progress = telemetry.Channel("2022/day15 perimeter points")
     relevant_points = set()
     for sensor, reach in sensor_distances.items():
         perimeter_points(sensor, reach + 1, relevant_points)
-        print("Number of relevant points in frame:", len(relevant_points))
-        print("*" * 100)
+        progress.count("sensors")
+        progress.gauge("relevant_points", len(relevant_points))
+    progress.emit("done")
 
     for point in relevant_points:
         if point in beacon_points:
@@ -59,7 +58,6 @@ def find_distress_beacon(
 
 
 def perimeter_points(point: Point, radius: int, points: set[Point]):
-    print(point, "with radius:", radius)
     for x_offset, y_offset in zip(range(radius + 1), range(radius + 1)):
         north1 = Point(point.x - radius + x_offset, point.y - y_offset)
         if is_in_frame(north1):
@@ -83,4 +81,4 @@ def is_in_frame(point: Point) -> bool:
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -18,26 +18,32 @@ Now for every sub path, find all other *distinct* sub paths and add their pressu
 The maximum of these sums is the result.
 
 UPDATE: The number of all sub-paths is so big that computing all combinations among them is
-    too heavy. Therefore we first search for the best permutation of the nodes in the sub-path
-    beforehand.
+    too heavy. Therefore we only keep the best permutation of the nodes in the sub-path, by
+    storing the sub-paths as bitmasks of their opened valves.
 """
 
 import itertools
-import re
 from collections import deque
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 
+from aoc import telemetry
+from aoc.bits import Layout, iter_bits, set_bit, width_for
+from aoc.parsing import RecordParser
+from aoc.search import SearchStats, bidirectional_bfs
 
-def main():
-    with open("input.txt") as f:
+TIME_LIMIT = 26
+START_VALVE_ID = "AA"
+
+
+def main(file_name):
+    with open(file_name) as f:
         valves = parse_file(f)
 
     shortest_distances = find_shortest_distances(valves)
     sub_path_pressures = find_best_pressure_release_for_sub_paths(
         valves, shortest_distances
     )
-    sub_path_pressures_ordered = find_best_permutation_of_sub_paths(sub_path_pressures)
-    answer = find_best_combinations(sub_path_pressures_ordered)
+    answer = find_best_combinations(sub_path_pressures)
     print(f"THE ANSWER IS: {answer}")
 
 
@@ -56,134 +62,163 @@ DistanceMapping = dict[tuple[str, str], int]
 
 
 @dataclass(frozen=True)
-class State:
-    current_valve_id: str
-    minutes_passed: int = 0
-    opened_valves: list[str] = field(default_factory=list)
-    released_pressure: int = 0
+class Tunnels:
+    """The valves worth opening by index, followed by the start valve"""
+
+    valve_ids: list[str]
+    flow_rates: list[int]
+    # busy_minutes[from][to]: minutes to walk to a valve & open it
+    busy_minutes: list[list[int]]
+    # packs the search states into ints, with the opened valves as a bitmask
+    layout: Layout
+
+    @property
+    def start(self) -> int:
+        return len(self.valve_ids) - 1
+
+    @property
+    def all_valves(self) -> int:
+        return (1 << self.start) - 1
+
+
+def index_valves(valves: ValveMapping, shortest_distances: DistanceMapping) -> Tunnels:
+    relevant_valve_ids = [valve.id for valve in valves.values() if valve.flow_rate > 0]
+    valve_ids = [*relevant_valve_ids, START_VALVE_ID]
+    flow_rates = [valves[valve_id].flow_rate for valve_id in valve_ids]
+    # opening the valve itself takes 1 minute as well
+    busy_minutes = [
+        [shortest_distances.get((valve1_id, valve2_id), 0) + 1 for valve2_id in valve_ids]
+        for valve1_id in valve_ids
+    ]
+    layout = Layout(
+        valve=width_for(len(relevant_valve_ids)),
+        minutes_passed=width_for(TIME_LIMIT),
+        opened_valves=max(len(relevant_valve_ids), 1),
+        pressure_release_per_minute=width_for(sum(flow_rates)),
+        released_pressure=None,
+    )
+    return Tunnels(valve_ids, flow_rates, busy_minutes, layout)
 
-    _time_limit: int = field(init=False, default=26)
 
-    def minutes_remaining(self) -> int:
-        return self._time_limit - self.minutes_passed
+def make_valve(valve_id: str, flow_rate: str, connected_valves: str) -> Valve:
+    return Valve(
+        id=valve_id,
+        flow_rate=int(flow_rate),
+        connected_valves=set(connected_valves.split(", ")),
+    )
 
-    def pressure_release_per_minute(self, valves: ValveMapping) -> int:
-        return sum(valves[valve_id].flow_rate for valve_id in self.opened_valves)
 
+# a single tunnel is described as "tunnel leads to valve"
+VALVES = RecordParser(
+    r"Valve ([A-Z]+) has flow rate=(\d+); tunnels? leads? to valves? (.+)", make_valve
+)
 
-def parse_file(f) -> ValveMapping:
-    valves: ValveMapping = dict()
-    for line in f.readlines():
-        line = line.strip()
 
-        pattern = r"Valve ([A-Z]+) has flow rate=(\d+); tunnels lead to valves (.+)"
-        valve_id, flow_rate, connected_valves = re.match(pattern, line).groups()
-
-        valve = Valve(
-            id=valve_id,
-            flow_rate=int(flow_rate),
-            connected_valves=set(connected_valves.split(", ")),
-        )
-        valves[valve_id] = valve
-    return valves
+def parse_file(f) -> ValveMapping:
+    return {valve.id: valve for valve in VALVES.parse(f.read())}
 
 
 def find_shortest_distances(valves: ValveMapping) -> DistanceMapping:
+    # the search works on ints, so the valves are referred to by their index
+    valve_ids = list(valves)
+    valve_indexes = {valve_id: index for index, valve_id in enumerate(valve_ids)}
+    connections = [
+        [valve_indexes[other_id] for other_id in valves[valve_id].connected_valves]
+        for valve_id in valve_ids
+    ]
     return {
         (valve1_id, valve2_id): get_shortest_valve_distance(
-            valve1_id, valve2_id, valves
+            valve_indexes[valve1_id], valve_indexes[valve2_id], connections
         )
-        for valve1_id, valve2_id in itertools.permutations(valves.keys(), 2)
+        for valve1_id, valve2_id in itertools.permutations(valve_ids, 2)
     }
 
 
 def get_shortest_valve_distance(
-    start_id: str, end_id: str, valves: ValveMapping
+    start: int, end: int, connections: list[list[int]]
 ) -> int:
-    """Use breath-first search to find the shortest route from start to end"""
-    queue = deque([(start_id, 0)])
-
-    while queue:
-        valve_id, minutes_passed = queue.popleft()
-        valve = valves[valve_id]
-
-        minutes_passed += 1
-        for next_valve in valve.connected_valves:
-            if next_valve == end_id:
-                return minutes_passed
-
-            queue.append((next_valve, minutes_passed))
-    raise ValueError(f"Couldn't find a path connecting '{start_id}' and '{end_id}'.")
+    """Use breath-first search from both ends to find the shortest route"""
+    # the tunnels can be used in both directions
+    result = bidirectional_bfs(start, end, connections.__getitem__)
+    if not result.found:
+        raise ValueError(f"Couldn't find a path connecting {start} and {end}.")
+    return result.cost
 
 
 def find_best_pressure_release_for_sub_paths(
-    valves: ValveMapping, shortest_distances: DistanceMapping
-) -> dict[tuple[str, ...], int]:
-    relevant_valves = {valve.id for valve in valves.values() if valve.flow_rate > 0}
-
-    start_state = State(current_valve_id="AA")
+    valves: ValveMapping,
+    shortest_distances: DistanceMapping,
+    stats: SearchStats | None = None,
+) -> dict[int, int]:
+    """The best pressure release by the bitmask of the opened valves"""
+    progress = telemetry.Channel("2022/day16 search")
+    stats = stats or SearchStats()
+    tunnels = index_valves(valves, shortest_distances)
+    state_layout = tunnels.layout
+
+    start_state = state_layout.pack(tunnels.start, 0, 0, 0, 0)
     queue = deque([start_state])
+    stats.pushed += 1
 
-    bests: dict[tuple[str, ...], int] = dict()
+    bests: dict[int, int] = dict()
     while queue:
-        state = queue.popleft()
-        pressure_release_per_minute = state.pressure_release_per_minute(valves)
+        stats.track_frontier(len(queue))
+        (
+            valve,
+            minutes_passed,
+            opened_valves,
+            pressure_release_per_minute,
+            released_pressure,
+        ) = state_layout.unpack(queue.popleft())
+        stats.expanded += 1
+        minutes_remaining = TIME_LIMIT - minutes_passed
 
         remaining_valves = remaining_reachable_valves(
-            state, relevant_valves, shortest_distances
+            tunnels, valve, opened_valves, minutes_remaining
         )
 
         # open another valve
-        for next_valve_id, busy_minutes in remaining_valves:
+        for next_valve, busy_minutes in remaining_valves:
             pressure_released_while_traveling = (
                 busy_minutes * pressure_release_per_minute
             )
-            new_state = State(
-                current_valve_id=next_valve_id,
-                minutes_passed=state.minutes_passed + busy_minutes,
-                opened_valves=state.opened_valves + [next_valve_id],
-                released_pressure=state.released_pressure
-                + pressure_released_while_traveling,
+            new_state = state_layout.pack(
+                next_valve,
+                minutes_passed + busy_minutes,
+                set_bit(opened_valves, next_valve),
+                pressure_release_per_minute + tunnels.flow_rates[next_valve],
+                released_pressure + pressure_released_while_traveling,
             )
             queue.append(new_state)
+        stats.generated += len(remaining_valves)
+        stats.pushed += len(remaining_valves)
 
         # also simulate that no other valve is being opened
         total_pressure_released = (
-            state.released_pressure
-            + state.minutes_remaining() * pressure_release_per_minute
+            released_pressure + minutes_remaining * pressure_release_per_minute
         )
-        bests[tuple(state.opened_valves)] = total_pressure_released
+        # only the best order of opening the same valves matters
+        bests[opened_valves] = max(
+            bests.get(opened_valves, 0), total_pressure_released
+        )
+    progress.emit("done", sub_paths=len(bests), **asdict(stats))
     return bests
 
 
 def remaining_reachable_valves(
-    state: State, relevant_valves: set[str], shortest_distances: DistanceMapping
-) -> list[tuple[str, int]]:
-    remaining_valves = relevant_valves - set(state.opened_valves)
-
-    res: list[tuple[str, int]] = list()
-    for next_valve_id in remaining_valves:
-        key = (state.current_valve_id, next_valve_id)
-        distance = shortest_distances[key]
-
-        # opening the valve itself takes 1 minute as well
-        busy_minutes = distance + 1
-        if busy_minutes <= state.minutes_remaining():
-            res.append((next_valve_id, busy_minutes))
+    tunnels: Tunnels, valve: int, opened_valves: int, minutes_remaining: int
+) -> list[tuple[int, int]]:
+    remaining_valves = tunnels.all_valves & ~opened_valves
+
+    res: list[tuple[int, int]] = list()
+    for next_valve in iter_bits(remaining_valves):
+        busy_minutes = tunnels.busy_minutes[valve][next_valve]
+        if busy_minutes <= minutes_remaining:
+            res.append((next_valve, busy_minutes))
     return res
 
 
-def find_best_permutation_of_sub_paths(
-    sub_path_pressures: dict[tuple[str, ...], int]
-) -> dict[frozenset[str, ...], int]:
-    bests: dict[frozenset[str, ...], int] = dict()
-    for sub_path, pressure in sub_path_pressures.items():
-        key = frozenset(sub_path)
-        bests[key] = max(bests.get(key, 0), pressure)
-    return bests
-
-
-def find_best_combinations(sub_path_pressures: dict[frozenset[str, ...], int]) -> int:
+def find_best_combinations(sub_path_pressures: dict[int, int]) -> int:
     best = 0
 
     print(len(sub_path_pressures))
@@ -200,4 +235,4 @@ def find_best_combinations(sub_path_pressures: dict[frozenset[str, ...], int]) -
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -98,8 +98,8 @@ ROCKS = [
 ]
 
 
-def main():
-    with open("input.txt") as f:
+def main(file_name):
+    with open(file_name) as f:
         pushes = f.read().strip()
 
     answer = simulate(pushes)
@@ -152,4 +152,4 @@ def visualise(chamber):
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
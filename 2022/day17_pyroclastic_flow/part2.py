@@ -4,6 +4,8 @@ from collections.abc import Iterator
 from dataclasses import dataclass, field
 from typing import Optional
 
+from aoc.cycles import find_cycle
+
 Point = namedtuple("Point", ["x", "y"])
 
 
@@ -21,13 +23,17 @@ class Chamber:
     width: int = field(default=7, init=False)
     solid_pieces: set[Point] = field(default_factory=set)
     max_y: int = field(default=0, init=False)
+    num_rocks: int = field(default=0, init=False)
+    num_pushes: int = field(default=0, init=False)
 
     def spawn_new_rock(self):
         self.active_rock = next(self.endless_rocks)
+        self.num_rocks += 1
         self.active_rock_anchor = Point(3, self.max_y + 4)
 
     def try_shift_active_rock_sideways(self) -> bool:
         direction = next(self.endless_pushes)
+        self.num_pushes += 1
         x_shift = -1 if direction == "<" else 1
         return self._shift_active_rock(x_shift, y_shift=0)
 
@@ -102,86 +108,78 @@ ROCKS = [
 ]
 
 
-def main():
-    with open("input.txt") as f:
+def main(file_name):
+    with open(file_name) as f:
         pushes = f.read().strip()
 
-    target_rocks = 10**12
-    # answer = simulate(pushes, num_rocks=target_rocks)
-    # print(f"THE SIMULATED ANSWER IS: {answer}")
-
-    # The row is completely filled periodically again. Based on some trials (that can be
-    # seen in the extra prints in the 'simulate' function) I found that after an initial
-    # offset of 216 rocks / y = 325, the height difference is identical after alternating
-    # 1130 & 585 rocks (and 1750 & 863 height). With that I can compute the height after
-    # 10^12 rocks:
-    offset_rocks = 216
-    offset_height = 325
-    offset_pushes = 1250
-    period_rocks = 1130 + 585  # 1715
-    period_height = 1750 + 863  # 2613
-
-    remainder_rocks = (target_rocks - offset_rocks) % period_rocks
-    full_cycles = (target_rocks - offset_rocks) // period_rocks
-
-    # now we need to calculate how much additional height is created by that offset
-    # to do this accurately, we also need to consider the offset/remainder for the next
-    # rock to spawn and which air pushes come next
-    remainder_height = simulate(
-        pushes,
-        num_rocks=remainder_rocks,
-        offset_rocks=offset_rocks,
-        offset_pushes=offset_pushes,
-    )
-
-    answer = offset_height + (full_cycles * period_height) + remainder_height
+    answer = get_tower_height(pushes, num_rocks=10**12)
     print(f"THE CALCULATED ANSWER IS: {answer}")
 
 
-def simulate(pushes, num_rocks, offset_rocks=0, offset_pushes=0) -> int:
-    endless_rocks = itertools.cycle(ROCKS)
-    endless_pushes = itertools.cycle(pushes)
-    for _ in range(offset_rocks % len(ROCKS)):
-        next(endless_rocks)
-    for _ in range(offset_pushes % len(pushes)):
-        next(endless_pushes)
+def get_tower_height(pushes, num_rocks, max_rocks=None) -> int:
+    """Raises a ValueError if the surface doesn't repeat within `max_rocks` rocks"""
+    # the chamber's surface, the next rock & the next push repeat after a while, from
+    # then on the height grows by the same amount in every period
+    cycle = find_cycle(
+        create_chamber(pushes),
+        drop_rock,
+        fingerprint=lambda chamber: (
+            chamber.num_rocks % len(ROCKS),
+            chamber.num_pushes % len(pushes),
+            get_surface(chamber),
+        ),
+        value=lambda chamber: chamber.max_y,
+        max_steps=max_rocks,
+    )
+    return cycle.extrapolate(num_rocks)
+
 
-    chamber = Chamber(
-        endless_rocks=endless_rocks,
-        endless_pushes=endless_pushes,
+def create_chamber(pushes) -> Chamber:
+    return Chamber(
+        endless_rocks=itertools.cycle(ROCKS),
+        endless_pushes=itertools.cycle(pushes),
     )
-    # prev__row_filled = 0
-    # prev__height = 0
-    # push_counter = 0
-    # prev__push_counter = 0
-    for rock_counter in range(num_rocks):
-        # # HOW I DETERMINED OFFSET & CYCLE SIZE
-        # is_row_filled = all(
-        #     Point(x, chamber.max_y) in chamber.solid_pieces
-        #     for x in range(1, chamber.width + 1)
-        # )
-        # if is_row_filled:
-        #     diff__counter = rock_counter - prev__row_filled
-        #     print("ROCK COUNTER", rock_counter, "--- DIFF ---", diff__counter)
-        #     diff__height = chamber.max_y - prev__height
-        #     print("HEIGHT", chamber.max_y, "--- DIFF ---", diff__height)
-        #     diff__push = push_counter - prev__push_counter
-        #     print("PUSH", push_counter, "--- DIFF ---", diff__push)
-        #     print("*" * 50)
-        #     prev__row_filled = rock_counter
-        #     prev__height = chamber.max_y
-        #     prev__push_counter = push_counter
-        chamber.spawn_new_rock()
-
-        while chamber.active_rock:
-            chamber.try_shift_active_rock_sideways()
-            # push_counter += 1
-            has_moved = chamber.try_shift_active_rock_down()
-            if not has_moved:
-                chamber.make_rock_solid()
+
+
+def simulate(pushes, num_rocks) -> int:
+    chamber = create_chamber(pushes)
+    for _ in range(num_rocks):
+        drop_rock(chamber)
     return chamber.max_y
 
 
+def drop_rock(chamber: Chamber) -> Chamber:
+    """Let the next rock fall until it comes to rest, changes the chamber in place"""
+    chamber.spawn_new_rock()
+    while chamber.active_rock:
+        chamber.try_shift_active_rock_sideways()
+        has_moved = chamber.try_shift_active_rock_down()
+        if not has_moved:
+            chamber.make_rock_solid()
+    return chamber
+
+
+def get_surface(chamber: Chamber) -> frozenset[Point]:
+    """
+    The air that falling rocks can reach, relative to the highest rock. Rocks only move
+    sideways & down, so that's all that determines where the next rocks come to rest.
+    """
+    top_y = chamber.max_y + 1
+    stack = [Point(x, top_y) for x in range(1, chamber.width + 1)]
+    reachable = set(stack)
+    while stack:
+        point = stack.pop()
+        for neighbour in (
+            Point(point.x - 1, point.y),
+            Point(point.x + 1, point.y),
+            Point(point.x, point.y - 1),
+        ):
+            if neighbour not in reachable and chamber._can_be_placed(neighbour):
+                reachable.add(neighbour)
+                stack.append(neighbour)
+    return frozenset(Point(point.x, point.y - top_y) for point in reachable)
+
+
 def visualise(chamber):
     active_rock_points = set(chamber.get_active_rock_points())
 
@@ -210,4 +208,4 @@ def visualise(chamber):
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -3,8 +3,8 @@ from collections import namedtuple
 Point = namedtuple("Point", ["x", "y", "z"])
 
 
-def main():
-    with open("input.txt") as f:
+def main(file_name):
+    with open(file_name) as f:
         lava_points = parse_file(f)
 
     answer = get_surface_area(lava_points)
@@ -47,4 +47,4 @@ def direct_neighbours(point):
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
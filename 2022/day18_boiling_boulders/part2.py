@@ -3,8 +3,8 @@ from collections import deque, namedtuple
 Point = namedtuple("Point", ["x", "y", "z"])
 
 
-def main():
-    with open("input.txt") as f:
+def main(file_name):
+    with open(file_name) as f:
         lava_points = parse_file(f)
 
     answer = get_surface_area(lava_points)
@@ -82,4 +82,4 @@ def is_enclosed(point, lava_points):
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
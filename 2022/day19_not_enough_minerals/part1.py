@@ -1,9 +1,17 @@
-import copy
 import enum
-import re
-from dataclasses import dataclass, field
+import functools
+import typing
+from dataclasses import asdict, dataclass
 
-INPUT_FILE = "input.txt"
+from aoc import telemetry
+from aoc.anytime import AnytimeResult, Budget, default_budget
+from aoc.bits import Layout, width_for
+from aoc.checkpoint import Checkpoints
+from aoc.parallel import parallel_map
+from aoc.parsing import int_rows
+from aoc.search import SearchStats
+
+MAX_MINUTES = 24
 
 
 @dataclass
@@ -22,25 +30,6 @@ class BluePrint:
     price_geode_robot: Price
 
 
-@dataclass
-class Wallet:
-    ore: int = 0
-    clay: int = 0
-    obsidian: int = 0
-    geode: int = 0
-
-    def harvest(self, garage):
-        self.ore += garage.ore_robots
-        self.clay += garage.clay_robots
-        self.obsidian += garage.obsidian_robots
-        self.geode += garage.geode_robots
-
-    def pay(self, price):
-        self.ore -= price.ore
-        self.clay -= price.clay
-        self.obsidian -= price.obsidian
-
-
 @enum.unique
 class Action(enum.Enum):
     BUILD_NOTHING = "build_nothing"
@@ -50,69 +39,46 @@ class Action(enum.Enum):
     BUILD_GEODE_ROBOT = "build_geode_robot"
 
 
-@dataclass
-class Garage:
+class State(typing.NamedTuple):
+    minutes_passed: int = 0
+    # the garage
     ore_robots: int = 1
     clay_robots: int = 0
     obsidian_robots: int = 0
     geode_robots: int = 0
-
-    def add_robot(self, action):
-        if action == Action.BUILD_ORE_ROBOT:
-            self.ore_robots += 1
-        elif action == Action.BUILD_CLAY_ROBOT:
-            self.clay_robots += 1
-        elif action == Action.BUILD_OBSIDIAN_ROBOT:
-            self.obsidian_robots += 1
-        elif action == Action.BUILD_GEODE_ROBOT:
-            self.geode_robots += 1
-
-
-@dataclass
-class State:
-    blueprint: BluePrint
-    minutes_passed: int = 0
-    wallet: Wallet = field(default_factory=Wallet)
-    garage: Garage = field(default_factory=Garage)
-
-    max_minutes: int = field(default=24, init=False)
+    # the wallet
+    ore: int = 0
+    clay: int = 0
+    obsidian: int = 0
+    geode: int = 0
 
     def minutes_remaining(self):
-        return self.max_minutes - self.minutes_passed
+        return MAX_MINUTES - self.minutes_passed
 
     def time_is_up(self):
-        return self.minutes_passed >= self.max_minutes
-
-    def get_actions(self):
-        blueprint = self.blueprint
-        prices = [
-            blueprint.price_geode_robot,
-            blueprint.price_obsidian_robot,
-            blueprint.price_clay_robot,
-            blueprint.price_ore_robot,
-        ]
-        max_ore_price = max([price.ore for price in prices])
+        return self.minutes_passed >= MAX_MINUTES
 
+    def get_actions(self, blueprint, max_ore_price):
         if self.can_pay(price := blueprint.price_geode_robot):
             # If you can buy a geode robot, you should do so
             return [(Action.BUILD_GEODE_ROBOT, price)]
 
-        if self.minutes_passed == self.max_minutes - 1:
+        if self.minutes_passed == MAX_MINUTES - 1:
             # if there's just one minute left, then only building
             # geode robots makes a difference
-            return [(Action.BUILD_NOTHING, Price())]
+            return [(Action.BUILD_NOTHING, NOTHING)]
 
         if self.can_pay(price := blueprint.price_obsidian_robot):
             # If you can buy a geode robot, you should do so
             return [(Action.BUILD_OBSIDIAN_ROBOT, price)]
 
-        actions = [(Action.BUILD_NOTHING, Price())]
+        actions = [(Action.BUILD_NOTHING, NOTHING)]
 
         ore_robot_price = blueprint.price_ore_robot
         if (
             # since we can only buy one robot at a time, there's no point
             # in producing more ore than any robot requires
-            self.garage.ore_robots < max_ore_price and self.can_pay(ore_robot_price)
+            self.ore_robots < max_ore_price and self.can_pay(ore_robot_price)
         ):
             actions.append((Action.BUILD_ORE_ROBOT, ore_robot_price))
 
@@ -122,36 +88,66 @@ class State:
 
     def can_pay(self, price):
         return (
-            self.wallet.ore >= price.ore
-            and self.wallet.clay >= price.clay
-            and self.wallet.obsidian >= price.obsidian
+            self.ore >= price.ore
+            and self.clay >= price.clay
+            and self.obsidian >= price.obsidian
+        )
+
+    def next_minute(self, action, price):
+        """Harvest with the current robots, pay & add the new robot"""
+        return State(
+            minutes_passed=self.minutes_passed + 1,
+            ore_robots=self.ore_robots + (action == Action.BUILD_ORE_ROBOT),
+            clay_robots=self.clay_robots + (action == Action.BUILD_CLAY_ROBOT),
+            obsidian_robots=self.obsidian_robots
+            + (action == Action.BUILD_OBSIDIAN_ROBOT),
+            geode_robots=self.geode_robots + (action == Action.BUILD_GEODE_ROBOT),
+            ore=self.ore + self.ore_robots - price.ore,
+            clay=self.clay + self.clay_robots - price.clay,
+            obsidian=self.obsidian + self.obsidian_robots - price.obsidian,
+            geode=self.geode + self.geode_robots,
         )
 
 
-def main():
-    with open(INPUT_FILE) as f:
+NOTHING = Price()
+# at most one robot is built per minute, which bounds the robots & the resources
+MAX_ROBOTS = width_for(MAX_MINUTES + 1)
+MAX_RESOURCES = width_for(MAX_MINUTES * (MAX_MINUTES + 1) // 2)
+STATE = Layout(
+    minutes_passed=width_for(MAX_MINUTES),
+    ore_robots=MAX_ROBOTS,
+    clay_robots=MAX_ROBOTS,
+    obsidian_robots=MAX_ROBOTS,
+    geode_robots=MAX_ROBOTS,
+    ore=MAX_RESOURCES,
+    clay=MAX_RESOURCES,
+    obsidian=MAX_RESOURCES,
+    geode=None,
+)
+
+
+def main(file_name):
+    with open(file_name) as f:
         blueprints = parse_file(f)
 
-    answer = get_quality_levels(blueprints)
+    result = get_quality_levels(blueprints)
+    # with the bound, if the budget ran out
+    answer = result.best if result.complete else result
     print(f"THE ANSWER IS: {answer}")
 
 
 def parse_file(f):
     blueprints = list()
-    for line in f.readlines():
-        line = line.strip()
-
-        pattern = r"Blueprint (\d+): Each ore robot costs (\d+) ore. Each clay robot costs (\d+) ore. Each obsidian robot costs (\d+) ore and (\d+) clay. Each geode robot costs (\d+) ore and (\d+) obsidian."
-        groups = re.match(pattern, line).groups()
-        (
-            blueprint_id,
-            ore_robot_price_ore,
-            clay_robot_price_ore,
-            obsidian_robot_price_ore,
-            obsidian_robot_price_clay,
-            geode_robot_price_ore,
-            geode_robot_price_obsidian,
-        ) = map(int, groups)
+    # the id & the 6 prices of a blueprint per line
+    for (
+        blueprint_id,
+        ore_robot_price_ore,
+        clay_robot_price_ore,
+        obsidian_robot_price_ore,
+        obsidian_robot_price_clay,
+        geode_robot_price_ore,
+        geode_robot_price_obsidian,
+    ) in int_rows(f.read(), 7):
         blueprint = BluePrint(
             id=blueprint_id,
             price_ore_robot=Price(ore=ore_robot_price_ore),
@@ -167,49 +163,93 @@ def parse_file(f):
     return blueprints
 
 
-def get_quality_levels(blueprints):
-    answer = 0
-    for blueprint in blueprints:
+def get_quality_levels(blueprints) -> AnytimeResult:
+    answer = bound = 0
+    search = functools.partial(search_max_geode_score, budget=default_budget())
+    results = parallel_map(search, blueprints)
+    for blueprint, result in zip(blueprints, results):
         print("BLUEPRINT:", blueprint.id)
-        num_geode = get_max_geode_score(blueprint)
-        quality_level = blueprint.id * num_geode
+        quality_level = blueprint.id * result.best
         print("\tquality_level:", quality_level)
         answer += quality_level
-    return answer
+        bound += blueprint.id * result.bound
+    return AnytimeResult(answer, bound, all(result.complete for result in results))
 
 
-def get_max_geode_score(blueprint):
+def get_max_geode_score(blueprint, stats: SearchStats | None = None):
+    return search_max_geode_score(blueprint, stats=stats).best
+
+
+def search_max_geode_score(
+    blueprint, budget: Budget | None = None, stats: SearchStats | None = None
+) -> AnytimeResult:
+    """
+    Depth-first branch & bound. If the budget runs out, the highest upper bound of the
+    states still in the queue bounds the score. The queue & the incumbent are saved
+    periodically, so that the search can be resumed.
+    """
+    progress = telemetry.Channel("2022/day19 search")
+    stats = stats or SearchStats()
+    deadline = budget.start() if budget else None
+    get_upper_bound = stats.timed(get_upper_bound_geode_harvesting)
+    prices = [
+        blueprint.price_geode_robot,
+        blueprint.price_obsidian_robot,
+        blueprint.price_clay_robot,
+        blueprint.price_ore_robot,
+    ]
+    max_ore_price = max([price.ore for price in prices])
     max_geode = 0
-    start = State(blueprint=blueprint)
 
-    queue = [start]
+    checkpoints = Checkpoints(__file__, key=repr(blueprint))
+    if (snapshot := checkpoints.load()) is not None:
+        queue, seen, max_geode, saved_stats = snapshot
+        vars(stats).update(vars(saved_stats))
+    else:
+        # the states are packed into ints, so that the ones seen before are cheap to skip
+        queue = [STATE.pack(*State())]
+        seen = set(queue)
+        stats.pushed += 1
     while queue:
-        state = queue.pop()
+        if deadline and deadline.exceeded(stats.expanded):
+            upper_bound = max(
+                get_upper_bound(State(*STATE.unpack(packed_state)))
+                for packed_state in queue
+            )
+            progress.emit("stopped", blueprint=blueprint.id, max_geode=max_geode)
+            return AnytimeResult(max_geode, max(max_geode, upper_bound), complete=False)
 
-        for action, price in state.get_actions():
-            new_wallet = copy.deepcopy(state.wallet)
-            new_wallet.harvest(state.garage)
-            new_wallet.pay(price)
+        if checkpoints.due(stats.expanded):
+            checkpoints.save((queue, seen, max_geode, stats))
 
-            new_garage = copy.deepcopy(state.garage)
-            new_garage.add_robot(action)
+        stats.track_frontier(len(queue))
+        state = State(*STATE.unpack(queue.pop()))
+        stats.expanded += 1
 
-            new_state = State(
-                blueprint=state.blueprint,
-                minutes_passed=state.minutes_passed + 1,
-                wallet=new_wallet,
-                garage=new_garage,
-            )
+        for action, price in state.get_actions(blueprint, max_ore_price):
+            stats.generated += 1
+            new_state = state.next_minute(action, price)
             if new_state.time_is_up():
-                max_geode = max(max_geode, new_state.wallet.geode)
+                max_geode = max(max_geode, new_state.geode)
+                continue
+
+            packed_state = STATE.pack(*new_state)
+            if packed_state in seen:
+                # already pushed, or pruned with a lower best score
+                stats.deduplicated += 1
                 continue
+            seen.add(packed_state)
 
-            upper_bound = get_upper_bound_geode_harvesting(new_state)
+            upper_bound = get_upper_bound(new_state)
             if upper_bound < max_geode:
+                stats.pruned += 1
                 continue
 
-            queue.append(new_state)
-    return max_geode
+            queue.append(packed_state)
+            stats.pushed += 1
+    checkpoints.clear()
+    progress.emit("done", blueprint=blueprint.id, max_geode=max_geode, **asdict(stats))
+    return AnytimeResult(max_geode, max_geode, complete=True)
 
 
 def get_upper_bound_geode_harvesting(state):
@@ -217,8 +257,8 @@ def get_upper_bound_geode_harvesting(state):
     How much geode could still be harvested, assuming we get a new geode robot
     every minute for all the remaining time
     """
-    upper_bound = state.wallet.geode
-    geode_production = state.garage.geode_robots
+    upper_bound = state.geode
+    geode_production = state.geode_robots
     for _ in range(state.minutes_remaining()):
         upper_bound += geode_production
         geode_production += 1
@@ -226,4 +266,4 @@ def get_upper_bound_geode_harvesting(state):
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
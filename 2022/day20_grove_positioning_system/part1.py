@@ -1,8 +1,5 @@
-INPUT_FILE = "input.txt"
-
-
-def main():
-    with open(INPUT_FILE) as f:
+def main(file_name):
+    with open(file_name) as f:
         numbers = parse_file(f)
 
     decrypted_numbers = decrypt(numbers)
@@ -44,4 +41,4 @@ def get_grove_coordinates(numbers):
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -6,11 +6,10 @@ OPERATIONS = {
     "*": operator.mul,
     "/": operator.truediv,
 }
-INPUT_FILE = "input.txt"
 
 
-def main():
-    with open(INPUT_FILE) as f:
+def main(file_name):
+    with open(file_name) as f:
         raw_jobs = parse_file(f)
 
     answer = get_result(raw_jobs, monkey_id="root")
@@ -38,4 +37,4 @@ def get_result(raw_jobs: dict[str, str], monkey_id: str) -> int:
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
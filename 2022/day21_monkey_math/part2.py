@@ -13,11 +13,10 @@ INVERSE_OPERATORS = {
     "*": operator.truediv,
     "/": operator.mul,
 }
-INPUT_FILE = "input.txt"
 
 
-def main():
-    with open(INPUT_FILE) as f:
+def main(file_name):
+    with open(file_name) as f:
         raw_jobs = parse_file(f)
 
     answer = solve_riddle(raw_jobs)
@@ -107,4 +106,4 @@ def get_new_result_needed(val1, val2, result_needed, operator_raw):
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
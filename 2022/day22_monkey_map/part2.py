@@ -1,9 +1,9 @@
 import enum
+import os
 from collections import namedtuple
 from dataclasses import dataclass
 from typing import Union
 
-INPUT_FILE = "input.txt"
 EDGE_LENGTH = 50
 
 Location = namedtuple("Location", ["row", "col"])
@@ -58,10 +58,10 @@ def get_next_direction(direction: Direction, orientation: Orientation) -> Direct
     return directions[new_index]
 
 
-def main():
-    with open(INPUT_FILE) as f:
+def main(file_name):
+    with open(file_name) as f:
         nodes = parse_file(f)
-        instructions = parse_instructions()
+        instructions = parse_instructions(file_name)
 
     final_node, direction = walk_path(nodes, instructions)
     answer = final_node.row * 1_000 + final_node.col * 4 + direction.value
@@ -85,8 +85,8 @@ def parse_file(f) -> NodeMap:
     return nodes
 
 
-def parse_instructions() -> list[Union[int, Orientation]]:
-    if INPUT_FILE == "example_input.txt":
+def parse_instructions(file_name) -> list[Union[int, Orientation]]:
+    if os.path.basename(file_name) == "example_input.txt":
         raw_instructions = "10R5L5R10L4R5L5"
     else:
         raw_instructions = "10R1L2R16R6R13R6L41R41R9L3R33L39R30R22L25L32R15R47L39L17L1R37R4L49R40L8R18R12R45L25R23L42R37L12L24L40R30L21L17L50L34L4R31L30L30L19R47L2R10L39L1L5R16L22R33L13R35L18R18R31L34R9L28L13R44L36R1R24R37L35L25L19L25R24L37R31L24L11L8L8L11R36L22R50R48R28L28R37R17R39L5L5L37R22R32L46R7L32L22R34R19R21R1R50L37R16R30L46R7L10R43L41R2R30L45R33L17L22L43R33L49L50L42L13L2L15R19R41L2R26L17R17L50L13R21L49L5L41L11L12R45L12L3R43R42R47R28L18R20R40L7L32R2L18R2R16L37L47R45R7R5L22L35R40L26L49R23L41R5R11L28L20R13L23R20R1L17L12R7R3L27R38R47R6R25L46R40L34R6L17R16L8L11L23R24R1R13L35L31L39R24R33L4L7L42R47L44L48L26R29R35R41L28L12L20R45R18R25R30L43R39L13L22L24R18R19R16R50L5L16L45L37L2R25R28L2L37R43R31L27R13L19R28L14L1R29R10L6L31R7R15R32L43R14R39R18L18R29R34L28R47R12L50L3R23L42L10L44R44R30L4R19L23R28L17L30R41L14R41L13R13L33R18R21R39L16R42L25L10L11L2R7R16R20L28R46L31L9R3R8R44L23L23L34L10R34L27L21L46R12R49L26L32R26L12L46R4L9R32R42R14L38L25R9L22L21R36R37L50L26L27R37R46L16L13R10L21R36R3R14R25L47L11R23R3R3R15L50L24L29R21L42L8R30R28L24L13L6L50R46R21L29R16R1R7R36R10L35R28R36R12L7R9L8L1R43R29R38R28R42L16L11R32L42L23L48L6L45L49R10R18L45L50L13R22L6R50R5L18L14L31R47R45L13L32L41R44R41L9L44R7R17L8L10L17L39R46R8L42R17L35L13R22R13R18L22R31R18L3L22L27L20R24L5R43R13L20L49L40R5R50L20R28L39L29R37L27R3R46L2L30R46R16L48R13R17R3R49R46R6R2R45R48R37L20R3R27L20R41L14R48R37R49L5R29L32R20R50R3R38R1L31L17L25L41R27R46R44R20L46L27L41R47L47R3L32L38L23R48R12R26L24R35R49R35R47L7R39R2L16L26L3L46R1L7R15R28L25L39L5L13R1R48R7L34L29R33R26R5R50L38L21L43R17R34L13L23L35R30L43R2R26L28R44R30R35R19L45R4R31L34L40R20L26L13R29R34R47R18R39L22L25R37R39L37R34R18R34L29R41R10L47L49L35R19L44R37R45L22L20R46L7L30L50L46R8R39R14R1R50L9L42L38L37L25R29L34R38R33L27L3L28R37R21L35R1L27L25L15L12R16R49R46R10R21R27L46R17L43R45R27R35L21R19L38R1L15L13R7L43R46L14R18R21R36L6R24L47L44R26L26R40R44L23R27L33L1R8L23R34L5L1R20L4L41R44L48L20R16R5R1R4L8L24R26R31L19L35L39R28R42L34R47R10R46R19L30L48L29R33L43R42L27R28L44R49R45R27R43L46R47L18L28L27L19R15L23L8L13R16L7R18L48L28L48R2R44L6L11R21R8R25L4L20R21R30L11L35R31L8R28L11L28L34L15L32L20R6R29L39L48L24L8L50R32L41L18R32R28L18R47L33R27R19R22L7R48L21L2R6R16L28L26L15L21L28L20R32L38R13L31L24R3R14L49L29L5L28R10R50L8R45L11R18R16L17L30L30R19R35L33L45R36R6L27R31R37L9L13R29L43L14L37R1L20L31L45L49R36R3R6R44L30R20R5R8L5L48L40R40R23L2L1L4L23R24L4R20L12R30L15L17R24R9R42L45L23L1R10L30R25R34L26L17R1L41L5L49R11R44R13R11R47R41R26R40L29R35L36R11R36L48L47L48L22R5R7R20R12R21R11L6R40R49L20R19R29R34R21L21R26L22R46R4R22R5R18L19L27L25L1L37R49R6R1R14L29R7R4R1L5L17L42L39L22R10R7R46L28R44R19R24L17R38R21L39R33L48L48L31L13L41R26L44L2L26L14R35R46R24R14L3R1R15L2R41R41L47R35R46L27L30R6L28L49R47R14L38L28R48L40L13R29L30L49R2R25R9L10R21L4L38R2R29R9L20L37R47L28R1L50R43L4R29L23L34R7R27R21L21L4R50L15L41L40L45L44R36L12L3R1R32R3R33L39L18L26L13L48R24R8R38L30R23L16R22L7L45L39L18R38R19R50L12L8R31R33L4L15L16R14L33R4L12R7R39R49L24R42L9R10R15L5L13R29L28L13R24L13L5L15R16L16R48L48R21R40R1R19L22L43R9L2L44L19R29L3R38R11L39L50L22R48L22R49R10L33L17L40L34R45R47L33L42L17L3L43R15R6L3R7L50R50L46R33R49R18R32L24L31L24L42L18L3L38R28L9R34R33L37R25R37R5R1R7R10L37R47L23R30R23L4L32R27R27R50R36R3R47R16L34L17L42L2R28R30L7R2R24R23L3L10R10R36L3R23R2R17L45R35R14R40R46L47L2R42R21R26L7R25L46L3R26L40L10R48L23L17L4L47R8R16R2L26L8L30L25R23L40L41R27R31R30R28R37R7L1R18R39R15R17R45R20L34L31L42L22R2L20L35L29L31L9L39L23L5R17L17L19L24R15L3R50L48R44L9L10L22L13R46L6L9L33R4L34L23R40R30L35R21L30R40L30L10R40R49L21R17L45L48L42R12R25R44R34R49R19L19R21L31L48L40L48L29R3L24R14L26L40R9L2R2R2R21L5R30L10L44L39L21R50L8L19L18R8R7R36R11L47R14R40L25R42L49R27L18L46L33R14R19L8R24L10R4L13R8L22R33L31R36R7R5L44L45L13R49R47R38L49R44R7R37R17L13R10L42R42R40L19R9L41R39L27L14R37L27R35R36L50L25L27L30L47R2R5R17R11L39R39R1R15L35L34L40R25R46L16R37L44L49L30R34L47R45L2R34R18L6L8L33L2R12R11R24L46L6R6R8R19L10L22R47L45R47L44L24L7L9R5R12R12L16R24R11R32L26R50L31L23L19R25L13R43L45R20L16L34R13L2L46L23R41L13L5L4L25R31R41R40L19R48L16R42L19R31R39R9L39L41R39L3R4R32R31R4R25L21L27L35L11R35R39L6L13L16R30R15R32R20L6L7L44L46L49R46L50L21L10L32L47R16L34R38R40R39R5L19R28L18L30L17L45L47L25L39R47R35R11L11R27L38R22L36L24R2L47R18L24R27R8R35R23R1R5R9L43L43L46R10R33L34L3R20R36L7L28L22R23L6R3R14L19L39L20L2L15L2R41L12L13R26R30L35R21R49R30R27R20R17R4R3R22L41L30R32L15R50R34L44R1L34R8R20L32L49L9L32R37R7L16L26R33L37L11R50L2R31L20R22L39R7L26R38L33R16L31R36L23R29R27L6R4R48R24L45R24R23R39R37R40L13L41R6L1L27R19R24R27L2L27L48R10L41R23L4R34L4R36R19L18R33L33L6R21L19L12R37R30L9R28L46L31R20R10R10L45R35R3L18R15R19L12L3L30R9R3L32R6L41L39R42L45R8R33R31R16L36R12R49L9L32R49R5R12L9L43R32R40R2L19L11L7R25R22R4R36R44R18R50R34L42L3R20R26R1L35L21L50R48L39R24R8L34R33R41R32R42L1R44L39R18L50L21R43L2R35R33L28R21R16R2R21R4R29L18R2L10L9R38R20R20R25L45R36L30L29R37R50L16R12L46L36L30R1L26R13R23R16L37R47R24L18R29R5L16L46R8L46L50L35R50R7L42R35R42R2R23R32L15R15L32L14R27R24L15R5L8L4R32L36L48R21L13R41L13L40L36R3R44R29R28R14R28R33R17L39L18L17L40R21L40L1R27L5L44L28R9L36R4L18R24R49R13L19R13L50L30L45L28R24L34L14L34R37L5L39L45L50R35L2R20L11L32L10L18R9L12L42R6R38L24L5R43L38R31R23R15L12L22R11R16R39L47R42L44L27R49R20R30R23R9L17R20L14R38R38R11L2R2R37R15R20R26R5R43L21L14L4L35R17R27R21R41R9R12L2R31L28L44R22L43R17L24R47L32L15R21R50L15R4L5L22L32L7L8L49R9R16R49R25R39R6L20L29L40R23R39L43R45R25L39L5R5L16L2R4L16R14R9R18L30R30L12R23R21L8L9R31R44R23L28L36L26L21L23R14L34L13L6L17R2R7L5L14R24L24L43L36R39R21R7L26R37R6L48L25L12L42L26R31L13R18L42L50L34R11L19L30R29R18L1L19R34R10R9L18L1R4R17L4L34L24L23R28R4R43L26L27L8R33L42R17R6L9R34R25R43R46L36R29R25L21L27R3L8R10R47R6R45R46R30R19R12L14L4R34R11R33R10L3L5L12L13R42L9R1L14R3L6L8R39L47R47L46R26R47L47R35R39R48L2R42L44R45R50R21R35L39L22L44"
@@ -268,4 +268,4 @@ def section(location: Location, horizontally: bool) -> int:
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -1,10 +1,14 @@
 import enum
 import itertools
 from collections import Counter
-from collections.abc import Iterator
-from dataclasses import dataclass
 
-INPUT_FILE = "input.txt"
+from aoc.grid import Grid
+
+ELF = ord("#")
+EMPTY = ord(".")
+# the empty space around the elves. they spread out by at most one field per round, so
+# the grid only needs to be re-centered once in a while
+MARGIN = 16
 
 
 @enum.unique
@@ -15,143 +19,105 @@ class Direction(enum.Enum):
     EAST = "E"
 
 
-@dataclass(frozen=True)
-class Location:
-    row: int
-    col: int
-
-    def get_neighbour_elves(self, elf_locations) -> set["Location"]:
-        neighbours = set()
-        for location in self._adjacent_locations():
-            if location in elf_locations:
-                neighbours.add(location)
-        return neighbours
-
-    def north(self):
-        return Location(self.row - 1, self.col)
-
-    def north_west(self):
-        return Location(self.row - 1, self.col - 1)
-
-    def north_east(self):
-        return Location(self.row - 1, self.col + 1)
-
-    def west(self):
-        return Location(self.row, self.col - 1)
-
-    def east(self):
-        return Location(self.row, self.col + 1)
-
-    def south_east(self):
-        return Location(self.row + 1, self.col + 1)
-
-    def south(self):
-        return Location(self.row + 1, self.col)
-
-    def south_west(self):
-        return Location(self.row + 1, self.col - 1)
-
-    def _adjacent_locations(self) -> Iterator["Location"]:
-        yield self.north_west()
-        yield self.north()
-        yield self.north_east()
-        yield self.east()
-        yield self.south_east()
-        yield self.south()
-        yield self.south_west()
-        yield self.west()
-
-    def proposals(
-        self, start_direction: Direction
-    ) -> Iterator[tuple["Location", tuple["Location", "Location"]]]:
-        endless_directions = itertools.cycle(Direction)
-
-        # move iterator to start_direction
-        start_index = list(Direction).index(start_direction)
-        for i in range(start_index):
-            next(endless_directions)
+# the offsets for the proposed step and the two fields next to it
+ProposalOffsets = tuple[int, int, int]
 
-        mapping = self._proposal_mapping()
-        for _ in range(len(Direction)):
-            direction = next(endless_directions)
-            yield mapping[direction]
 
-    def _proposal_mapping(
-        self
-    ) -> dict[Direction, tuple["Location", tuple["Location", "Location"]]]:
-        return {
-            Direction.NORTH: (self.north(), (self.north_west(), self.north_east())),
-            Direction.SOUTH: (self.south(), (self.south_west(), self.south_east())),
-            Direction.WEST: (self.west(), (self.north_west(), self.south_west())),
-            Direction.EAST: (self.east(), (self.north_east(), self.south_east())),
-        }
-
-
-ElfLocations = set[Location]
-
-
-def main():
-    with open(INPUT_FILE) as f:
-        locations = parse_file(f)
+def main(file_name):
+    with open(file_name) as f:
+        grid = parse_file(f)
 
     endless_directions = itertools.cycle(Direction)
     for round_num in itertools.count(start=1):
         direction = next(endless_directions)
-        new_locations = simulate_round(locations, direction)
+        grid, moved = simulate_round(grid, direction)
 
-        if locations == new_locations:
+        if not moved:
             break
 
-        locations = new_locations
-
     print(f"THE ANSWER IS: {round_num}")
 
 
-def parse_file(f) -> ElfLocations:
-    locations: ElfLocations = set()
-    for row, line in enumerate(f.readlines()):
-        line = line.strip()
-        for col, char in enumerate(line):
-            if char != "#":
-                continue
+def parse_file(f) -> Grid:
+    return Grid.from_lines(f.read().strip().splitlines(), padding=MARGIN, border=EMPTY)
+
+
+def get_proposal_offsets(
+    grid: Grid, start_direction: Direction
+) -> list[ProposalOffsets]:
+    mapping = {
+        Direction.NORTH: (grid.up, grid.up + grid.left, grid.up + grid.right),
+        Direction.SOUTH: (grid.down, grid.down + grid.left, grid.down + grid.right),
+        Direction.WEST: (grid.left, grid.up + grid.left, grid.down + grid.left),
+        Direction.EAST: (grid.right, grid.up + grid.right, grid.down + grid.right),
+    }
+    directions = list(Direction)
+    start_index = directions.index(start_direction)
+    return [
+        mapping[direction]
+        for direction in directions[start_index:] + directions[:start_index]
+    ]
 
-            locations.add(Location(row=row, col=col))
-    return locations
 
+def simulate_round(grid: Grid, direction: Direction) -> tuple[Grid, bool]:
+    """Moves the elves in place, unless the grid needed to grow first"""
+    if touches_edge(grid):
+        grid = shrink_to_fit(grid, padding=MARGIN)
 
-def simulate_round(locations: ElfLocations, direction: Direction) -> ElfLocations:
     # proposals
-    proposals: dict[Location, Location] = dict()
-    for location in locations:
-        neighbours = location.get_neighbour_elves(locations)
-        if not neighbours:
+    proposal_offsets = get_proposal_offsets(grid, direction)
+    proposals: dict[int, int] = dict()
+    for location in grid.find_all(ELF):
+        if all(grid[location + offset] != ELF for offset in grid.adjacent_offsets):
             continue
 
-        for proposal, (adjacent1, adjacent2) in location.proposals(direction):
-            intersection = {proposal, adjacent1, adjacent2} & neighbours
-            if not intersection:
-                proposals[location] = proposal
+        for step, adjacent1, adjacent2 in proposal_offsets:
+            if (
+                grid[location + step] != ELF
+                and grid[location + adjacent1] != ELF
+                and grid[location + adjacent2] != ELF
+            ):
+                proposals[location] = location + step
                 break
 
     # move
     proposal_counter = Counter(proposals.values())
-    distinct_proposals = {
-        proposal for (proposal, count) in proposal_counter.items() if count == 1
-    }
-
-    new_locations: ElfLocations = set()
-    for original_location in locations:
-        if original_location not in proposals:
-            new_locations.add(original_location)
-            continue
-
-        proposal = proposals[original_location]
-        if proposal in distinct_proposals:
-            new_locations.add(proposal)
-        else:
-            new_locations.add(original_location)
-    return new_locations
+    moved = False
+    for original_location, proposal in proposals.items():
+        if proposal_counter[proposal] == 1:
+            grid[original_location] = EMPTY
+            grid[proposal] = ELF
+            moved = True
+    return grid, moved
+
+
+def touches_edge(grid: Grid) -> bool:
+    """Whether an elf is at the outermost fields, where neighbours would wrap around"""
+    cells, stride = grid.cells, grid.stride
+    return (
+        ELF in cells[:stride]
+        or ELF in cells[-stride:]
+        or ELF in cells[::stride]
+        or ELF in cells[stride - 1 :: stride]
+    )
+
+
+def shrink_to_fit(grid: Grid, padding: int) -> Grid:
+    """The smallest rectangle containing all elves, with the given empty padding"""
+    positions = [grid.position(location) for location in grid.find_all(ELF)]
+    min_row = min(row for row, _ in positions)
+    max_row = max(row for row, _ in positions)
+    min_col = min(col for _, col in positions)
+    max_col = max(col for _, col in positions)
+    return grid.crop(
+        min_row,
+        min_col,
+        max_row - min_row + 1,
+        max_col - min_col + 1,
+        padding=padding,
+        border=EMPTY,
+    )
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -1,16 +1,22 @@
 import enum
 import itertools
-from collections import deque, namedtuple
+import math
+from collections import namedtuple
 from collections.abc import Iterator
-from dataclasses import dataclass
-from functools import cache
+from dataclasses import asdict, dataclass
+
+from aoc import telemetry
+from aoc.memo import memoize
+from aoc.search import SearchStats, bfs
 
 Location = namedtuple("Location", ["row", "col"])
-State = namedtuple("State", ["location", "minute"])
+
+# minutes are requested in ascending order, so only the latest ones are needed
+BLIZZARD_CACHE_SIZE = 8
 
 
-def main():
-    blizzards, start, target = parse_file("input.txt")
+def main(file_name):
+    blizzards, start, target = parse_file(file_name)
 
     answer = walk_valley(blizzards, start, target)
     print(f"THE ANSWER IS: {answer}")
@@ -116,34 +122,41 @@ def _parse_dimensions(f):
 
 
 def walk_valley(
-    initial_blizzards: tuple[Blizzard, ...], start: Location, target: Location
+    initial_blizzards: tuple[Blizzard, ...],
+    start: Location,
+    target: Location,
+    stats: SearchStats | None = None,
 ) -> int:
-    # walk valley with depth-first search
-    queue = deque([State(location=start, minute=0)])
-    seen: set[tuple[Location, tuple[Blizzard, ...]]] = set()
-
     max_blizzard_row = target.row - 1
     max_blizzard_col = target.col
 
-    i = 0
-    while queue:
-        i += 1
-
-        state = queue.popleft()
-        next_minute = state.minute + 1
-
-        next_blizzards = get_current_blizzards(
-            initial_blizzards,
-            minute=next_minute,
-        )
-        blizzard_locations = {blizzard.get_location() for blizzard in next_blizzards}
-
-        # new states
-        for new_location in neighbour_locations(state.location, blizzard_locations):
-            if new_location == target:
-                return next_minute
-
-            if state.location != start and new_location == start:
+    # the blizzards are back at their initial locations after this many minutes, so
+    # states are encoded as `(minute % period) * num_locations + location_index`
+    period = math.lcm(max_blizzard_row, max_blizzard_col)
+    width = max_blizzard_col + 2
+    num_locations = (max_blizzard_row + 2) * width
+    target_index = target.row * width + target.col
+
+    blizzard_locations_by_minute: dict[int, set[Location]] = {}
+    progress = telemetry.Channel("2022/day24 valley")
+
+    def get_blizzard_locations(minute: int) -> set[Location]:
+        if minute not in blizzard_locations_by_minute:
+            blizzards = get_current_blizzards(initial_blizzards, minute=minute)
+            blizzard_locations_by_minute[minute] = {
+                blizzard.get_location() for blizzard in blizzards
+            }
+        return blizzard_locations_by_minute[minute]
+
+    def next_states(state: int) -> Iterator[int]:
+        minute, location_index = divmod(state, num_locations)
+        progress.count("expanded_states")
+        location = Location(*divmod(location_index, width))
+        next_minute = (minute + 1) % period
+
+        blizzard_locations = get_blizzard_locations(next_minute)
+        for new_location in neighbour_locations(location, blizzard_locations):
+            if location != start and new_location == start:
                 # disallow moving back to the start
                 # the same can be achieved by staying at the start from the beginning on,
                 # so this is a redundant strategy
@@ -155,20 +168,24 @@ def walk_valley(
                 or new_location.col < 1
                 or new_location.col > max_blizzard_col
             )
-            if out_of_valley and new_location != start:
+            if out_of_valley and new_location not in (start, target):
                 continue
 
-            key = (new_location, next_blizzards)
-            if key in seen:
-                continue
-            seen.add(key)
-
-            new_state = State(new_location, minute=next_minute)
-            queue.append(new_state)
+            new_index = new_location.row * width + new_location.col
+            yield next_minute * num_locations + new_index
 
-        if i % 500 == 0:
-            print(state.minute, len(queue))
-    raise ValueError("Couldn't find a route through the valley")
+    # walk valley with breadth-first search
+    result = bfs(
+        [start.row * width + start.col],
+        next_states,
+        is_goal=lambda state: state % num_locations == target_index,
+        num_states=period * num_locations,
+        stats=stats,
+    )
+    if not result.found:
+        raise ValueError("Couldn't find a route through the valley")
+    progress.emit("found", minutes=result.cost, **asdict(result.stats))
+    return result.cost
 
 
 def neighbour_locations(location, blizzard_locations) -> Iterator[Location]:
@@ -184,7 +201,7 @@ def neighbour_locations(location, blizzard_locations) -> Iterator[Location]:
     return (loc for loc in locations if loc not in blizzard_locations)
 
 
-@cache
+@memoize(max_size=BLIZZARD_CACHE_SIZE, per_input=True)
 def get_current_blizzards(
     initial_blizzards: tuple[Blizzard, ...],
     minute: int,
@@ -216,4 +233,4 @@ def get_current_blizzards(
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -1,5 +1,5 @@
-def main():
-    with open("input.txt") as f:
+def main(file_name):
+    with open(file_name) as f:
         answer = process_file(f)
     print(f"THE ANSWER IS: {answer}")
 
@@ -42,4 +42,4 @@ def to_snafu(quotient: int) -> str:
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
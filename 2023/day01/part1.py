@@ -1,9 +1,4 @@
-from pathlib import Path
-
-file_name = Path("input.txt")
-
-
-def main() -> None:
+def main(file_name: str) -> None:
     with open(file_name) as f:
         answer = process_file(f)
     print(f"THE ANSWER IS: {answer}")
@@ -22,4 +17,4 @@ def process_file(f) -> int:
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -1,7 +1,4 @@
 import typing
-from pathlib import Path
-
-file_name = Path("input.txt")
 
 DigitChar = typing.Literal["1", "2", "3", "4", "5", "6", "7", "8", "9"]
 SPELLED_DIGITS: dict[str, DigitChar] = {
@@ -18,7 +15,7 @@ SPELLED_DIGITS: dict[str, DigitChar] = {
 SPELLED_DIGITS_REVERSED = {k[::-1]: v for (k, v) in SPELLED_DIGITS.items()}
 
 
-def main() -> None:
+def main(file_name: str) -> None:
     with open(file_name) as f:
         answer = process_file(f)
     print(f"THE ANSWER IS: {answer}")
@@ -51,4 +48,4 @@ def get_first_digit(text: str, reverse: bool = False) -> DigitChar:
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
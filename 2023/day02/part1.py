@@ -1,6 +1,7 @@
-from pathlib import Path
+import re
+import typing
 
-file_name = Path("input.txt")
+from aoc.parsing import RecordParser
 
 COLOUR_LIMITS = {
     "red": 12,
@@ -9,37 +10,42 @@ COLOUR_LIMITS = {
 }
 
 
-def main() -> None:
+def main(file_name: str) -> None:
     with open(file_name) as f:
         answer = process_file(f)
     print(f"THE ANSWER IS: {answer}")
 
 
+CUBE_DRAW = re.compile(r"(\d+) (red|green|blue)")
+
+
+class Game(typing.NamedTuple):
+    id: int
+    # the count & colour of all cube draws, of all game draws
+    cube_draws: list[tuple[int, str]]
+
+
+def make_game(game_id: str, game_info: str) -> Game:
+    cube_draws = [(int(num), colour) for num, colour in CUBE_DRAW.findall(game_info)]
+    return Game(int(game_id), cube_draws)
+
+
+GAMES = RecordParser(r"Game (\d+): (.*)", make_game)
+
+
 def process_file(f) -> int:
     summed = 0
-    for line in f.readlines():
-        game_id_part, game_info = line.split(": ")
-        if not is_possible(game_info):
+    for game in GAMES.parse(f.read()):
+        if not is_possible(game):
             continue
 
-        game_id = int(game_id_part.replace("Game ", "").strip())
-        summed += game_id
+        summed += game.id
     return summed
 
 
-def is_possible(game_info: str) -> bool:
-    for game_draw in game_info.split("; "):
-        for cube_draw in game_draw.split(", "):
-            for colour, limit in COLOUR_LIMITS.items():
-                try:
-                    num = int(cube_draw.replace(colour, "").strip())
-                except ValueError:
-                    continue
-
-                if num > limit:
-                    return False
-    return True
+def is_possible(game: Game) -> bool:
+    return all(num <= COLOUR_LIMITS[colour] for num, colour in game.cube_draws)
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
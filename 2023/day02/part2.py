@@ -1,7 +1,9 @@
 import functools
-from pathlib import Path
+import re
+import typing
 
-file_name = Path("input.txt")
+from aoc import telemetry
+from aoc.parsing import RecordParser
 
 COLOURS = [
     "red",
@@ -10,36 +12,46 @@ COLOURS = [
 ]
 
 
-def main() -> None:
+def main(file_name: str) -> None:
     with open(file_name) as f:
         answer = process_file(f)
     print(f"THE ANSWER IS: {answer}")
 
 
+CUBE_DRAW = re.compile(r"(\d+) (red|green|blue)")
+
+
+class Game(typing.NamedTuple):
+    id: int
+    # the count & colour of all cube draws, of all game draws
+    cube_draws: list[tuple[int, str]]
+
+
+def make_game(game_id: str, game_info: str) -> Game:
+    cube_draws = [(int(num), colour) for num, colour in CUBE_DRAW.findall(game_info)]
+    return Game(int(game_id), cube_draws)
+
+
+GAMES = RecordParser(r"Game (\d+): (.*)", make_game)
+
+
 def process_file(f) -> int:
+    progress = telemetry.Channel("2023/day02 powers", telemetry.Level.DEBUG)
     summed = 0
-    for line in f.readlines():
-        game_id_part, game_info = line.split(": ")
-        summed += get_power(game_info)
+    for game in GAMES.parse(f.read()):
+        summed += get_power(game, progress)
     return summed
 
 
-def get_power(game_info: str) -> int:
+def get_power(game: Game, progress: telemetry.Channel) -> int:
     min_cube_counts = dict.fromkeys(COLOURS, 0)
-    for game_draw in game_info.split("; "):
-        for cube_draw in game_draw.split(", "):
-            for colour in COLOURS:
-                try:
-                    cube_count = int(cube_draw.replace(colour, "").strip())
-                except ValueError:
-                    continue
-
-                min_cube_counts[colour] = max(min_cube_counts[colour], cube_count)
-    print(min_cube_counts)
+    for cube_count, colour in game.cube_draws:
+        min_cube_counts[colour] = max(min_cube_counts[colour], cube_count)
     power = functools.reduce(lambda x, y: x * y, min_cube_counts.values())
-    print(power)
+    progress.count("games")
+    progress.gauge("power", power)
     return power
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -1,97 +1,60 @@
 import typing
-from pathlib import Path
 
-FILE_NAME = Path("input.txt")
+from aoc.grid import Grid
 
+EMPTY = ord(".")
+GEAR = ord("*")
+DIGITS = frozenset(b"0123456789")
 
-class Position(typing.NamedTuple):
-    row: int
-    col: int
 
+def main(file_name: str) -> None:
+    with open(file_name) as f:
+        grid = parse_file(f)
 
-class Number(typing.NamedTuple):
-    id: int
-    value: int
+    answer = get_gear_ratio_sum(grid)
+    print(f"THE ANSWER IS: {answer}")
 
 
-NumberPositions = dict[Position, Number]
-NumberMapping = dict[int, Number]
-SymbolPositions = list[Position]
+def parse_file(f) -> Grid:
+    # the padding ends numbers at the line-breaks
+    return Grid.from_lines(f.read().strip().splitlines(), padding=1, border=EMPTY)
 
 
-def main() -> None:
-    with open(FILE_NAME) as f:
-        number_positions, gear_positions = parse_file(f)
+def get_gear_ratio_sum(grid: Grid) -> int:
+    return sum(get_gear_ratio(grid, gear_index) for gear_index in grid.find_all(GEAR))
 
-    answer = get_gear_ratio_sum(number_positions, gear_positions)
-    print(f"THE ANSWER IS: {answer}")
 
+def get_gear_ratio(grid: Grid, gear_index: int) -> int:
+    # a number is identified by the index of its first digit
+    number_starts = {
+        get_number_start(grid, index)
+        for index in get_adjacent_indexes(grid, gear_index)
+        if grid[index] in DIGITS
+    }
 
-def parse_file(f) -> tuple[NumberPositions, SymbolPositions]:
-    number_str = ""
-    number_positions_temp: list[Position] = []
-    number_positions = {}
-    gear_positions = []
-    number_id = 0
-    for row_index, line_raw in enumerate(f.readlines()):
-        line = line_raw.strip()
-        for col_index, char in enumerate(line):
-            # col_index == 0 check as a number can also end on line-breaks
-            if number_str and (not char.isdigit() or (col_index == 0)):
-                number = Number(id=number_id, value=int(number_str))
-                for position_temp in number_positions_temp:
-                    number_positions[position_temp] = number
-                number_str = ""
-                number_positions_temp = []
-                number_id += 1
-
-            if char.isdigit():
-                number_str += char
-                number_positions_temp.append(Position(row_index, col_index))
-            elif char == "*":
-                gear_positions.append(Position(row_index, col_index))
-
-    if number_str:
-        # not needed with my data - so for simplicity it's skipped
-        msg = "data ends with a number that still needs to be added to the mappings"
-        raise ValueError(msg)
-    return number_positions, gear_positions
-
-
-def get_gear_ratio_sum(
-    number_positions: NumberPositions, gear_positions: SymbolPositions
-) -> int:
-    return sum(
-        get_gear_ratio(symbol_position, number_positions)
-        for symbol_position in gear_positions
-    )
-
-
-def get_gear_ratio(symbol_position: Position, number_positions: NumberPositions) -> int:
-    adjacent_numbers = set()
-    for position in get_adjacent_positions(symbol_position):
-        number = number_positions.get(position)
-        if number:
-            adjacent_numbers.add(number)
-
-    if len(adjacent_numbers) != 2:
+    if len(number_starts) != 2:
         return 0
 
-    first_number, second_number = list(adjacent_numbers)
-    return first_number.value * second_number.value
+    first_start, second_start = number_starts
+    return read_number(grid, first_start) * read_number(grid, second_start)
+
+
+def get_adjacent_indexes(grid: Grid, index: int) -> typing.Iterable[int]:
+    return (index + offset for offset in grid.adjacent_offsets)
+
+
+def get_number_start(grid: Grid, index: int) -> int:
+    while grid[index - 1] in DIGITS:
+        index -= 1
+    return index
 
 
-def get_adjacent_positions(position: Position) -> typing.Iterable[Position]:
-    # going clockwise, starting at 12
-    yield Position(position.row - 1, position.col)
-    yield Position(position.row - 1, position.col + 1)
-    yield Position(position.row, position.col + 1)
-    yield Position(position.row + 1, position.col + 1)
-    yield Position(position.row + 1, position.col)
-    yield Position(position.row + 1, position.col - 1)
-    yield Position(position.row, position.col - 1)
-    yield Position(position.row - 1, position.col - 1)
+def read_number(grid: Grid, start: int) -> int:
+    end = start
+    while grid[end] in DIGITS:
+        end += 1
+    return int(grid.cells[start:end])
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -1,12 +1,11 @@
 import collections
 import itertools
-from pathlib import Path
 
-FILE_NAME = Path("input.txt")
+from aoc.parsing import word_rows
 
 
-def main() -> None:
-    with open(FILE_NAME) as f:
+def main(file_name: str) -> None:
+    with open(file_name) as f:
         answer = process_file(f)
     print(f"THE ANSWER IS: {answer}")
 
@@ -14,12 +13,11 @@ def main() -> None:
 def process_file(f) -> int:
     total_num_cards = 0
     copies: collections.deque[int] = collections.deque([])
-    for line in f.readlines():
+    for num_matching_numbers in get_numbers_of_matching_numbers(f.read()):
         num_card_copies = copies.popleft() if copies else 0
         num_cards = 1 + num_card_copies
         total_num_cards += num_cards
 
-        num_matching_numbers = get_number_of_matching_numbers(line)
         extra_copies = [num_cards] * num_matching_numbers
         copies_temp = []
         for num_copies, num_extra_copies in itertools.zip_longest(
@@ -30,13 +28,25 @@ def process_file(f) -> int:
     return total_num_cards
 
 
-def get_number_of_matching_numbers(line: str) -> int:
-    _, number_part = line.split(": ")
-    winning_numbers_part, my_numbers_part = number_part.split(" | ")
-    winning_numbers = set(winning_numbers_part.strip().split())
-    my_numbers = set(my_numbers_part.strip().split())
-    return len(winning_numbers & my_numbers)
+def get_numbers_of_matching_numbers(text: str) -> list[int]:
+    """
+    All cards have as many numbers as the first, so the words of all cards are split at
+    once, in rows of "Card", the id, the winning numbers, "|" & my numbers. Comparing
+    the numbers as words spares converting them.
+    """
+    winning_part, my_part = text.partition("\n")[0].split(":")[1].split("|")
+    winning_end = 2 + len(winning_part.split())
+    row_length = winning_end + 1 + len(my_part.split())
+    numbers_of_matching_numbers = []
+    for row in word_rows(text, row_length):
+        # otherwise the numbers of this card differ, and all rows after it are shifted
+        if row[winning_end] != "|":
+            raise ValueError(f"Not as many numbers as the first card: {' '.join(row)}")
+        numbers_of_matching_numbers.append(
+            len(set(row[2:winning_end]).intersection(row[winning_end + 1 :]))
+        )
+    return numbers_of_matching_numbers
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -1,7 +1,4 @@
 import dataclasses
-from pathlib import Path
-
-FILE_NAME = Path("input.txt")
 
 
 @dataclasses.dataclass
@@ -28,8 +25,8 @@ class MappingGroup:
         return value
 
 
-def main() -> None:
-    with open(FILE_NAME) as f:
+def main(file_name: str) -> None:
+    with open(file_name) as f:
         seeds, mapping_groups = parse_file(f)
 
     mapped_values = seeds.copy()
@@ -57,4 +54,4 @@ def parse_file(f) -> tuple[list[int], list[MappingGroup]]:
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -1,12 +1,14 @@
 """
 Ugly bruteforce solution. But the code is simple and correct. Took ~6hours
+
+The progress is saved every minute, so an interrupted run picks up again with
+`AOC_RESUME=1`, see `aoc.checkpoint`.
 """
 import dataclasses
+import io
 import itertools
-import time
-from pathlib import Path
 
-FILE_NAME = Path("input.txt")
+from aoc.checkpoint import Checkpoints
 
 
 @dataclasses.dataclass
@@ -33,21 +35,31 @@ class MappingGroup:
         return value
 
 
-def main() -> None:
-    with open(FILE_NAME) as f:
-        seed_blocks, mapping_groups = parse_file(f)
+def main(file_name: str) -> None:
+    with open(file_name) as f:
+        text = f.read()
+    seed_blocks, mapping_groups = parse_file(io.StringIO(text))
 
-    lowest_location = None
-    for seed_block_start, seed_block_range in seed_blocks:
+    checkpoints = Checkpoints(__file__, key=text)
+    first_block, first_seed, lowest_location = checkpoints.load() or (0, None, None)
+    for block_index in range(first_block, len(seed_blocks)):
+        seed_block_start, seed_block_range = seed_blocks[block_index]
+        seed_block_end = seed_block_start + seed_block_range
         print("processing", (seed_block_start, seed_block_range))
-        for seed in range(seed_block_start, seed_block_start + seed_block_range):
+        if first_seed is None:
+            first_seed = seed_block_start
+        for seed in range(first_seed, seed_block_end):
             mapped_value = seed
             for mapping_group in mapping_groups:
                 mapped_value = mapping_group.map(mapped_value)
 
-            if lowest_location is None or mapped_value < lowest_location:  # type: ignore[unreachable]
+            if lowest_location is None or mapped_value < lowest_location:
                 lowest_location = mapped_value
+            if checkpoints.due(seed):
+                checkpoints.save((block_index, seed + 1, lowest_location))
+        first_seed = None
         print(lowest_location)
+    checkpoints.clear()
     print(f"THE ANSWER IS: {lowest_location}")
 
 
@@ -72,6 +84,4 @@ def parse_file(f) -> tuple[list[tuple[int, int]], list[MappingGroup]]:
 
 
 if __name__ == "__main__":
-    start = time.monotonic()
-    main()
-    print("elapsed", time.monotonic() - start)
+    main("input.txt")
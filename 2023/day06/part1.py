@@ -1,8 +1,5 @@
 import math
 import typing
-from pathlib import Path
-
-FILE_NAME = Path("example_input.txt")
 
 
 class Race(typing.NamedTuple):
@@ -10,8 +7,8 @@ class Race(typing.NamedTuple):
     distance: int
 
 
-def main() -> None:
-    with open(FILE_NAME) as f:
+def main(file_name: str) -> None:
+    with open(file_name) as f:
         races = parse_file(f)
 
     answer = math.prod([get_number_of_winning_strategies(race) for race in races])
@@ -39,4 +36,4 @@ def get_number_of_winning_strategies(race: Race) -> int:
 
 
 if __name__ == "__main__":
-    main()
+    main("example_input.txt")
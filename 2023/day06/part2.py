@@ -1,7 +1,4 @@
 import typing
-from pathlib import Path
-
-FILE_NAME = Path("input.txt")
 
 
 class Race(typing.NamedTuple):
@@ -9,8 +6,8 @@ class Race(typing.NamedTuple):
     distance: int
 
 
-def main() -> None:
-    with open(FILE_NAME) as f:
+def main(file_name: str) -> None:
+    with open(file_name) as f:
         race = parse_file(f)
 
     answer = get_number_of_winning_strategies(race)
@@ -39,4 +36,4 @@ def get_number_of_winning_strategies(race: Race) -> int:
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -1,8 +1,5 @@
 import collections
 import dataclasses
-from pathlib import Path
-
-FILE_NAME = Path("input.txt")
 
 CardValuesType = tuple[int, int, int, int, int]
 HandTuplesType = tuple[int, int, int, int, int, int]
@@ -58,8 +55,8 @@ class Hand:
         return tuple(CARD_VALUES[symbol] for symbol in hand)  # type: ignore[return-value]
 
 
-def main() -> None:
-    with open(FILE_NAME) as f:
+def main(file_name: str) -> None:
+    with open(file_name) as f:
         hand_bids = parse_file(f)
 
     answer = 0
@@ -88,4 +85,4 @@ if __name__ == "__main__":
     assert Hand.from_symbols("A23A4").type_value == 2
     assert Hand.from_symbols("23456").type_value == 1
 
-    main()
+    main("input.txt")
@@ -1,8 +1,5 @@
 import collections
 import dataclasses
-from pathlib import Path
-
-FILE_NAME = Path("input.txt")
 
 CardValuesType = tuple[int, int, int, int, int]
 HandTuplesType = tuple[int, int, int, int, int, int]
@@ -87,8 +84,8 @@ class Hand:
         return tuple(SYMBOL_VALUES[symbol] for symbol in hand)  # type: ignore[return-value]
 
 
-def main() -> None:
-    with open(FILE_NAME) as f:
+def main(file_name: str) -> None:
+    with open(file_name) as f:
         hand_bids = parse_file(f)
 
     answer = 0
@@ -128,4 +125,4 @@ if __name__ == "__main__":
     assert Hand.from_symbols("22222") > Hand.from_symbols("2222J")
     assert Hand.from_symbols("32222") < Hand.from_symbols("JJJJ2")
 
-    main()
+    main("input.txt")
@@ -1,9 +1,6 @@
 import dataclasses
 import itertools
 import typing
-from pathlib import Path
-
-FILE_NAME = Path("input.txt")
 
 
 @dataclasses.dataclass
@@ -13,8 +10,8 @@ class Node:
     right: str
 
 
-def main() -> None:
-    with open(FILE_NAME) as f:
+def main(file_name: str) -> None:
+    with open(file_name) as f:
         instructions, nodes = parse_file(f)
 
     num_steps = walk(instructions, nodes)
@@ -47,4 +44,4 @@ def walk(instructions: typing.Iterable[str], nodes: dict[str, Node]) -> int:
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -1,10 +1,9 @@
 import dataclasses
+import functools
 import itertools
 import math
-import typing
-from pathlib import Path
 
-FILE_NAME = Path("input.txt")
+from aoc.parallel import parallel_map
 
 
 @dataclasses.dataclass
@@ -14,15 +13,15 @@ class Node:
     right: str
 
 
-def main() -> None:
-    with open(FILE_NAME) as f:
+def main(file_name: str) -> None:
+    with open(file_name) as f:
         instructions, nodes = parse_file(f)
 
     num_steps = walk(instructions, nodes)
     print(f"THE ANSWER IS: {num_steps}")
 
 
-def parse_file(f) -> tuple[typing.Iterable[str], dict[str, Node]]:
+def parse_file(f) -> tuple[str, dict[str, Node]]:
     instructions, nodes_part = f.read().strip().split("\n\n")
 
     nodes = {}
@@ -30,25 +29,24 @@ def parse_file(f) -> tuple[typing.Iterable[str], dict[str, Node]]:
         node_id, neighbours_part = line.split(" = ")
         left_node_id, right_node_id = neighbours_part.strip(" ()").split(", ")
         nodes[node_id] = Node(id=node_id, left=left_node_id, right=right_node_id)
-    return itertools.cycle(instructions), nodes
+    return instructions, nodes
 
 
-def walk(instructions: typing.Iterable[str], nodes: dict[str, Node]) -> int:
-    _num_steps = 0
+def walk(instructions: str, nodes: dict[str, Node]) -> int:
     starting_nodes = [node_id for node_id in nodes if node_id.endswith("A")]
-    individual_min_steps = [
-        walk_single_node(instructions, starting_node, nodes)
-        for starting_node in starting_nodes
-    ]
+    # every ghost walks on its own, so they can be spread over processes
+    individual_min_steps = parallel_map(
+        functools.partial(walk_single_node, instructions, nodes=nodes), starting_nodes
+    )
     return math.lcm(*individual_min_steps)
 
 
 def walk_single_node(
-    instructions: typing.Iterable[str], starting_node: str, nodes: dict[str, Node]
+    instructions: str, starting_node: str, nodes: dict[str, Node]
 ) -> int:
     _num_steps = 0
     current_node = starting_node
-    for _num_steps, instruction in enumerate(instructions, start=1):
+    for _num_steps, instruction in enumerate(itertools.cycle(instructions), start=1):
         if instruction == "L":
             current_node = nodes[current_node].left
         else:
@@ -60,4 +58,4 @@ def walk_single_node(
 
 
 if __name__ == "__main__":
-    main()
+    main("input.txt")
@@ -1,11 +1,8 @@
 import itertools
-from pathlib import Path
 
-FILE_NAME = Path("input.txt")
 
-
-def main() -> None:
-    with open(FILE_NAME) as f:
+def main(file_name: str) -> None:
+    with open(file_name) as f:
         histories = parse_file(f)
     answer = sum(extrapolate_value(values) for values in histories)
     print(f"THE ANSWER IS: {answer}")
@@ -32,4 +29,4 @@ if __name__ == "__main__":
     assert get_diffs([0, 3, 6, 9, 12, 15]) == [3, 3, 3, 3, 3]
     assert extrapolate_value([0, 3, 6, 9, 12, 15]) == 18
 
-    main()
+    main("input.txt")
@@ -1,88 +1,68 @@
-import typing
+from aoc.grid import Grid
 
+GROUND = ord(".")
+START = ord("S")
 
-class Location(typing.NamedTuple):
-    row: int
-    col: int
-
-
-LocationMap = dict[Location, list[Location]]
+PipeOffsets = dict[int, tuple[int, ...]]
 
 
 def main(file_name: str) -> None:
     with open(file_name) as f:
-        location_map, start = parse_file(f)
+        grid, start = parse_file(f)
 
-    answer = walk(location_map, start)
+    answer = walk(grid, start)
     print(f"THE ANSWER IS: {answer}")
 
 
-def parse_file(f) -> tuple[LocationMap, Location]:
-    location_map: LocationMap = {}
-    start_location = None
-    for row_index, line in enumerate(f.readlines()):
-        for col_index, symbol in enumerate(line.strip()):
-            location = Location(row_index, col_index)
-            if symbol == "S":
-                start_location = location
-            location_map[location] = get_neighbour_candidates(location, symbol)
-
-    if not start_location:
-        raise ValueError("Didn't find start location")
-    return location_map, start_location
-
-
-def get_neighbour_candidates(location: Location, symbol: str) -> list[Location]:  # noqa: PLR0911
-    row, col = location
-
-    if symbol == ".":
-        return []
-    elif symbol == "|":
-        return [Location(row - 1, col), Location(row + 1, col)]
-    elif symbol == "-":
-        return [Location(row, col - 1), Location(row, col + 1)]
-    elif symbol == "L":
-        return [Location(row - 1, col), Location(row, col + 1)]
-    elif symbol == "J":
-        return [Location(row, col - 1), Location(row - 1, col)]
-    elif symbol == "7":
-        return [Location(row, col - 1), Location(row + 1, col)]
-    elif symbol == "F":
-        return [Location(row, col + 1), Location(row + 1, col)]
-    elif symbol == "S":
-        return [
-            # going clockwise, starting at 12
-            Location(row - 1, col),
-            Location(row, col + 1),
-            Location(row + 1, col),
-            Location(row, col - 1),
-        ]
-    raise ValueError(f"Unexpected symbol: {symbol}")
-
-
-def walk(location_map: LocationMap, start: Location) -> int:
+def parse_file(f) -> tuple[Grid, int]:
+    grid = Grid.from_lines(f.read().strip().splitlines(), padding=1, border=GROUND)
+    try:
+        start = grid.find(START)
+    except ValueError:
+        raise ValueError("Didn't find start location") from None
+    return grid, start
+
+
+def get_pipe_offsets(grid: Grid) -> PipeOffsets:
+    """The offsets to the neighbours each symbol could be connected to"""
+    return {
+        ord("."): (),
+        ord("|"): (grid.up, grid.down),
+        ord("-"): (grid.left, grid.right),
+        ord("L"): (grid.up, grid.right),
+        ord("J"): (grid.left, grid.up),
+        ord("7"): (grid.left, grid.down),
+        ord("F"): (grid.right, grid.down),
+        START: grid.orthogonal_offsets,
+    }
+
+
+def walk(grid: Grid, start: int) -> int:
+    pipe_offsets = get_pipe_offsets(grid)
     current_location = start
     visited = {start}
-    while len(visited) == 1 or current_location != start:
-        neighbours = get_neighbours(current_location, location_map)
+    while True:
+        neighbours = get_neighbours(current_location, grid, pipe_offsets)
         unseen_neighbours = neighbours - visited
         if not unseen_neighbours:
             break
 
         # choose next location
-        for neighbour in unseen_neighbours:
-            current_location = neighbour
-            visited.add(neighbour)
-            break
+        current_location = unseen_neighbours.pop()
+        visited.add(current_location)
     return len(visited) // 2
 
 
-def get_neighbours(location: Location, location_map: LocationMap) -> set[Location]:
-    neighbour_candidates = location_map[location]
+def get_neighbours(location: int, grid: Grid, pipe_offsets: PipeOffsets) -> set[int]:
+    """The neighbours which are connected to the location in both directions"""
+    try:
+        offsets = pipe_offsets[grid[location]]
+    except KeyError:
+        raise ValueError(f"Unexpected symbol: {chr(grid[location])}") from None
     return {
-        candidate
-        for candidate in neighbour_candidates
-        if location in location_map.get(candidate, [])
+        location + offset
+        for offset in offsets
+        if -offset in pipe_offsets.get(grid[location + offset], ())
     }
 
 
@@ -6,89 +6,102 @@ have a connection to the outside by squeezing between the pipes.
 
 Afterwards, we can count the inner points via BFS or DFS.
 """
-import collections
 import typing
 
+from aoc.grid import Grid
+from aoc.search import bfs
 
-class Location(typing.NamedTuple):
-    row: float
-    col: float
+GROUND = ord(".")
+START = ord("S")
 
-
-LocationMap = dict[Location, str]
+PipeOffsets = dict[int, tuple[int, ...]]
 
 
 def main(file_name: str) -> None:
     with open(file_name) as f:
-        location_map, start = parse_file(f)
+        grid, start = parse_file(f)
 
-    loop_locations = walk(location_map, start)
-    remove_irrelevant_symbols(location_map, loop_locations)
-    enclosed_locations = get_enclosed_locations(location_map, loop_locations)
+    loop_locations = walk(grid, start)
+    enclosed_locations = get_enclosed_locations(grid, loop_locations)
     # only consider the locations from the original grid resolution
     answer = len(
         [
             loc
             for loc in enclosed_locations
-            if loc.row.is_integer() and loc.col.is_integer()
+            if all(coordinate % 2 == 0 for coordinate in grid.position(loc))
         ]
     )
     print(f"THE ANSWER IS: {answer}")
 
 
-def parse_file(f) -> tuple[LocationMap, Location]:
-    location_map: LocationMap = {}
+def parse_file(f) -> tuple[Grid, int]:
+    """
+    The grid in double resolution, i.e. location (row, col) of the input is stored at
+    (2 * row, 2 * col) and the odd rows & cols are the half-way points
+    """
+    lines = f.read().strip().splitlines()
+    # the padding of 2 covers the neighbours of start in the original resolution
+    grid = Grid(2 * len(lines), 2 * len(lines[0]), fill=GROUND, padding=2)
     start = None
-    for row_index, line in enumerate(f.readlines()):
-        for col_index, symbol in enumerate(line.strip()):
-            location = Location(row_index, col_index)
+    for row_index, line in enumerate(lines):
+        for col_index, symbol in enumerate(line):
+            location = grid.index(2 * row_index, 2 * col_index)
             if symbol == "S":
                 start = location
-            location_map[location] = symbol
+            grid[location] = ord(symbol)
 
             # add half-way points. the symbols of these intermediate points just extend
             # the pipe symbol they originate from
             # special handling for 'S' is below (outside the loops)
             # note that this also adds points outside the grid - but we don't mind
-            horizontal_halfway_location = Location(location.row, location.col + 0.5)
             horizontal_halfway_symbol = "-" if symbol in "F-L" else "|"
-            location_map[horizontal_halfway_location] = horizontal_halfway_symbol
+            grid[location + grid.right] = ord(horizontal_halfway_symbol)
 
-            vertical_halfway_location = Location(location.row + 0.5, location.col)
             vertical_halfway_symbol = "|" if symbol in "F|7" else "-"
-            location_map[vertical_halfway_location] = vertical_halfway_symbol
+            grid[location + grid.down] = ord(vertical_halfway_symbol)
 
-    if not start:
+    if start is None:
         raise ValueError("Didn't find start location")
 
     # special handling for start neighbours
     # the half-way points next to the start have to connect start to its neighbours
     # therefore we need to check the int neighbours of start and construct the half-way
     # points accordingly
-    north_of_start = Location(start.row - 1, start.col)
-    north_symbol = "|" if location_map.get(north_of_start, ".") in "F|7" else "-"
-    location_map[Location(start.row - 0.5, start.col)] = north_symbol
+    north_symbol = "|" if chr(grid[start + 2 * grid.up]) in "F|7" else "-"
+    grid[start + grid.up] = ord(north_symbol)
+
+    east_symbol = "-" if chr(grid[start + 2 * grid.right]) in "J-7" else "|"
+    grid[start + grid.right] = ord(east_symbol)
+
+    south_symbol = "|" if chr(grid[start + 2 * grid.down]) in "LJ|" else "-"
+    grid[start + grid.down] = ord(south_symbol)
 
-    east_of_start = Location(start.row, start.col + 1)
-    east_symbol = "-" if location_map.get(east_of_start, ".") in "J-7" else "|"
-    location_map[Location(start.row, start.col + 0.5)] = east_symbol
+    west_symbol = "-" if chr(grid[start + 2 * grid.left]) in "-FL" else "|"
+    grid[start + grid.left] = ord(west_symbol)
 
-    south_of_start = Location(start.row + 1, start.col)
-    south_symbol = "|" if location_map.get(south_of_start, ".") in "LJ|" else "-"
-    location_map[Location(start.row + 0.5, start.col)] = south_symbol
+    return grid, start
 
-    west_of_start = Location(start.row, start.col - 1)
-    west_symbol = "-" if location_map.get(west_of_start, ".") in "-FL" else "|"
-    location_map[Location(start.row, start.col - 0.5)] = west_symbol
 
-    return location_map, start
+def get_pipe_offsets(grid: Grid) -> PipeOffsets:
+    """The offsets to the neighbours each symbol could be connected to"""
+    return {
+        GROUND: (),
+        ord("|"): (grid.up, grid.down),
+        ord("-"): (grid.left, grid.right),
+        ord("L"): (grid.up, grid.right),
+        ord("J"): (grid.left, grid.up),
+        ord("7"): (grid.left, grid.down),
+        ord("F"): (grid.right, grid.down),
+        START: grid.orthogonal_offsets,
+    }
 
 
-def walk(location_map: LocationMap, start: Location) -> set[Location]:
+def walk(grid: Grid, start: int) -> set[int]:
+    pipe_offsets = get_pipe_offsets(grid)
     current_location = start
     visited = {start}
-    while len(visited) == 1 or current_location != start:
-        neighbours = get_connected_neighbours(current_location, location_map)
+    while True:
+        neighbours = get_connected_neighbours(current_location, grid, pipe_offsets)
         unseen_neighbours = neighbours - visited
         if not unseen_neighbours:
             # implies that we arrived back at start (which we've already seen)
@@ -96,90 +109,49 @@ def walk(location_map: LocationMap, start: Location) -> set[Location]:
             break
 
         # choose next location
-        for neighbour in unseen_neighbours:
-            current_location = neighbour
-            visited.add(neighbour)
-            break
+        current_location = unseen_neighbours.pop()
+        visited.add(current_location)
     return visited
 
 
 def get_connected_neighbours(
-    location: Location, location_map: LocationMap
-) -> set[Location]:
-    neighbour_candidates = get_connected_neighbour_candidates(location, location_map)
+    location: int, grid: Grid, pipe_offsets: PipeOffsets
+) -> set[int]:
+    try:
+        offsets = pipe_offsets[grid[location]]
+    except KeyError:
+        raise ValueError(f"Unexpected symbol: {chr(grid[location])}") from None
     return {
-        candidate
-        for candidate in neighbour_candidates
-        if location in get_connected_neighbour_candidates(candidate, location_map)
+        location + offset
+        for offset in offsets
+        if -offset in pipe_offsets.get(grid[location + offset], ())
     }
 
 
-def get_connected_neighbour_candidates(  # noqa: PLR0911
-    location: Location, location_map: LocationMap
-) -> list[Location]:
-    symbol = location_map.get(location, ".")
-    row, col = location
-
-    if symbol == ".":
-        return []
-    elif symbol == "|":
-        return [Location(row - 0.5, col), Location(row + 0.5, col)]
-    elif symbol == "-":
-        return [Location(row, col - 0.5), Location(row, col + 0.5)]
-    elif symbol == "L":
-        return [Location(row - 0.5, col), Location(row, col + 0.5)]
-    elif symbol == "J":
-        return [Location(row, col - 0.5), Location(row - 0.5, col)]
-    elif symbol == "7":
-        return [Location(row, col - 0.5), Location(row + 0.5, col)]
-    elif symbol == "F":
-        return [Location(row, col + 0.5), Location(row + 0.5, col)]
-    elif symbol == "S":
-        return [
-            # going clockwise, starting at 12
-            Location(row - 0.5, col),
-            Location(row, col + 0.5),
-            Location(row + 0.5, col),
-            Location(row, col - 0.5),
-        ]
-    raise ValueError(f"Unexpected symbol: {symbol}")
-
-
-def remove_irrelevant_symbols(
-    location_map: LocationMap, loop_locations: set[Location]
-) -> None:
-    for key in location_map.keys():  # noqa: SIM118
-        if key not in loop_locations:
-            location_map[key] = "."
+def get_enclosed_locations(grid: Grid, loop_locations: set[int]) -> set[int]:
+    loop_adjacent_locations = get_locations_adjacent_to_loop(grid, loop_locations)
 
-
-def get_enclosed_locations(
-    location_map: LocationMap, loop_locations: set[Location]
-) -> set[Location]:
-    # TODO: refactor code to make these available after parsing the input
-    max_row = int(max(loc.row for loc in location_map))
-    max_col = int(max(loc.col for loc in location_map))
-    loop_adjacent_locations = get_locations_adjacent_to_loop(loop_locations)
-
-    enclosed_locations: set[Location] = set()
-    seen_locations: set[Location] = set()
+    enclosed_locations: set[int] = set()
+    outside_locations: set[int] = set()
     for loc in loop_adjacent_locations:
-        if loc in seen_locations:
+        if loc in enclosed_locations or loc in outside_locations:
             continue
 
         enclosed, connected_locations = is_enclosed(
-            loc, loop_locations, max_row, max_col
+            grid, loc, loop_locations, outside_locations
         )
-        seen_locations |= connected_locations
         if enclosed:
             enclosed_locations |= connected_locations
+        else:
+            outside_locations |= connected_locations
     return enclosed_locations
 
 
-def get_locations_adjacent_to_loop(loop_locations: set[Location]) -> set[Location]:
-    adjacent_locations: set[Location] = set()
+def get_locations_adjacent_to_loop(grid: Grid, loop_locations: set[int]) -> set[int]:
+    adjacent_locations: set[int] = set()
     for loop_location in loop_locations:
-        for adjacent_location in get_adjacent_locations(loop_location):
+        for offset in grid.orthogonal_offsets:
+            adjacent_location = loop_location + offset
             if adjacent_location in loop_locations:
                 continue
 
@@ -187,37 +159,26 @@ def get_locations_adjacent_to_loop(loop_locations: set[Location]) -> set[Locatio
     return adjacent_locations
 
 
-def get_adjacent_locations(location: Location) -> typing.Iterable[Location]:
-    # going clockwise starting at 12
-    yield Location(location.row - 0.5, location.col)
-    yield Location(location.row, location.col + 0.5)
-    yield Location(location.row + 0.5, location.col)
-    yield Location(location.row, location.col - 0.5)
-
-
 def is_enclosed(
-    start: Location, loop_locations: set[Location], max_row: int, max_col: int
-) -> tuple[bool, set[Location]]:
-    """Run depth-first search to see if there's a path to the edges of the map"""
-    seen: set[Location] = set()
-    queue = collections.deque([start])
-    while queue:
-        location = queue.popleft()
-        seen.add(location)
-
-        for neighbour in get_adjacent_locations(location):
-            if (neighbour in loop_locations) or (neighbour in seen):
-                continue
-
-            if is_off_grid(neighbour, max_row, max_col):
-                return False, seen
-
-            queue.appendleft(neighbour)
-    return True, seen
-
-
-def is_off_grid(location: Location, max_row: int, max_col: int) -> bool:
-    return not (0 < location.row < max_row and 0 < location.col < max_col)
+    grid: Grid, start: int, loop_locations: set[int], outside_locations: set[int]
+) -> tuple[bool, set[int]]:
+    """
+    Run breadth-first search to see if there's a path to the edges of the map, or to
+    a location which is already known to be outside of the loop
+    """
+
+    def get_neighbours(location: int) -> typing.Iterator[int]:
+        for offset in grid.orthogonal_offsets:
+            if (neighbour := location + offset) not in loop_locations:
+                yield neighbour
+
+    def is_outside(location: int) -> bool:
+        return location in outside_locations or not grid.is_inside(location)
+
+    result = bfs([start], get_neighbours, is_goal=is_outside)
+    # without a bitmap, the visited states are a set
+    assert isinstance(result.visited, set)
+    return not result.found, result.visited
 
 
 if __name__ == "__main__":
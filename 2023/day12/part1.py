@@ -1,5 +1,6 @@
 import collections
-import time
+
+from aoc.parallel import parallel_map
 
 PLACEHOLDER = "?"
 
@@ -11,13 +12,16 @@ def main(file_name: str) -> None:
 
 
 def parse_file(f) -> int:
-    summed = 0
+    all_symbols: list[str] = []
+    all_counts: list[list[int]] = []
     for line in f.readlines():
         symbols, counts_part = line.strip().split()
         counts = [int(val) for val in counts_part.split(",")]
 
-        summed += get_num_solutions(symbols, counts)
-    return summed
+        all_symbols.append(symbols)
+        all_counts.append(counts)
+    # the rows are independent of each other
+    return sum(parallel_map(get_num_solutions, all_symbols, all_counts))
 
 
 def get_num_solutions(input_symbols: str, target_counts: list[int]) -> int:
@@ -49,6 +53,4 @@ if __name__ == "__main__":
     assert get_num_solutions(".??..??...?##.", [1, 1, 3]) == 4
     print("all test cases succeeded")
 
-    start = time.monotonic()
     main("input.txt")
-    print("time elapsed:", round(time.monotonic() - start, 1))
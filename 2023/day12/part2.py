@@ -1,7 +1,9 @@
-import functools
-import time
+from aoc.memo import memoize
+from aoc.parallel import parallel_map
 
 PLACEHOLDER = "?"
+# the sub-problems of different rows rarely overlap, so old entries can go
+CACHE_SIZE = 2**16
 
 
 def main(file_name: str) -> None:
@@ -11,16 +13,19 @@ def main(file_name: str) -> None:
 
 
 def parse_file(f) -> int:
-    summed = 0
+    all_symbols: list[str] = []
+    all_counts: list[tuple[int, ...]] = []
     for line in f.readlines():
         symbols, counts_part = line.strip().split()
         counts = [int(val) for val in counts_part.split(",")]
 
-        summed += get_num_solutions("?".join([symbols] * 5), tuple(counts * 5))
-    return summed
+        all_symbols.append("?".join([symbols] * 5))
+        all_counts.append(tuple(counts * 5))
+    # the rows are independent of each other
+    return sum(parallel_map(get_num_solutions, all_symbols, all_counts))
 
 
-@functools.cache
+@memoize(max_size=CACHE_SIZE)
 def get_num_solutions(input_symbols: str, target_counts: tuple[int, ...]) -> int:
     if not input_symbols and not target_counts:
         return 1
@@ -159,6 +164,4 @@ if __name__ == "__main__":
 
     print("all test cases succeeded")
 
-    start = time.monotonic()
     main("input.txt")
-    print("time elapsed:", round(time.monotonic() - start, 1), "seconds")
@@ -1,15 +1,18 @@
 import itertools
+import typing
+
+from aoc.inputs import Buffer, iter_blocks, map_input
 
 
 def main(file_name: str) -> None:
-    with open(file_name) as f:
-        patterns = parse_file(f)
-    answer = sum([score(pattern) for pattern in patterns])
+    with map_input(file_name) as data:
+        answer = sum(score(pattern) for pattern in parse_file(data))
     print(f"THE ANSWER IS: {answer}")
 
 
-def parse_file(f) -> list[str]:
-    return f.read().strip().split("\n\n")
+def parse_file(data: Buffer) -> typing.Iterator[str]:
+    for block in iter_blocks(data):
+        yield str(block, "ascii")
 
 
 def score(pattern: str) -> int:
@@ -1,6 +1,9 @@
-import itertools
 import typing
 
+from aoc.cycles import find_cycle
+
+NUM_CYCLES = 10**9
+
 
 class Point(typing.NamedTuple):
     row: int
@@ -10,8 +13,7 @@ class Point(typing.NamedTuple):
 def main(file_name: str) -> None:
     with open(file_name) as f:
         block = parse_file(f)
-    cycled_block = get_block_after_one_billion_cycles(block)
-    answer = score_block(cycled_block)
+    answer = get_load_after_cycles(block, NUM_CYCLES)
     print(f"THE ANSWER IS: {answer}")
 
 
@@ -19,27 +21,10 @@ def parse_file(f) -> str:
     return f.read().strip()
 
 
-def get_block_after_one_billion_cycles(block: str) -> str:
-    target_num = int(1e9)
-
-    # using a dict, so we can look up via hashes, but still have guaranteed order
-    previous_blocks = {block: None}
-    cycle_length = 0
-    cycle_offset = 0
-    for i in itertools.count(start=1):
-        block = full_cycle(block)
-        if block in previous_blocks:
-            cycle_offset = list(previous_blocks.keys()).index(block)
-            cycle_length = i - cycle_offset
-            break
-
-        previous_blocks[block] = None
-
-    assert cycle_length
-    offset = (target_num - cycle_offset) % cycle_length
-    for _ in range(offset):
-        block = full_cycle(block)
-    return block
+def get_load_after_cycles(block: str, num_cycles: int) -> int:
+    # the blocks repeat after a while, so the load of a late block equals an early one
+    cycle = find_cycle(block, full_cycle, value=score_block)
+    return cycle.extrapolate(num_cycles)
 
 
 def full_cycle(block: str) -> str:
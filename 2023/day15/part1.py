@@ -1,7 +1,9 @@
+from aoc.inputs import iter_records, map_input
+
+
 def main(file_name: str) -> None:
-    with open(file_name) as f:
-        texts = f.read().split(",")
-    answer = sum([score_text(text) for text in texts])
+    with map_input(file_name) as data:
+        answer = sum(score_text(str(text, "ascii")) for text in iter_records(data))
     print(f"THE ANSWER IS: {answer}")
 
 
@@ -1,18 +1,21 @@
 import collections
+import typing
+
+from aoc.inputs import iter_records, map_input
 
 Boxes = collections.defaultdict[int, dict[str, int]]
 
 
 def main(file_name: str) -> None:
-    with open(file_name) as f:
-        texts = f.read().split(",")
-    filled_boxes = get_filled_boxes(texts)
+    with map_input(file_name) as data:
+        texts = (str(text, "ascii") for text in iter_records(data))
+        filled_boxes = get_filled_boxes(texts)
 
     answer = score_boxes(filled_boxes)
     print(f"THE ANSWER IS: {answer}")
 
 
-def get_filled_boxes(texts: list[str]) -> Boxes:
+def get_filled_boxes(texts: typing.Iterable[str]) -> Boxes:
     boxes: Boxes = collections.defaultdict(dict)
     for text in texts:
         label, operator, focal_length = parse_text(text)
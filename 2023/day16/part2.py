@@ -1,4 +1,8 @@
 import enum
+import functools
+
+from aoc import telemetry
+from aoc.parallel import parallel_map
 
 
 class Direction(enum.StrEnum):
@@ -27,24 +31,26 @@ def simulate_ray(grid: list[str]) -> int:
     max_row = len(grid) - 1
     max_col = len(grid[0]) - 1
 
-    max_score = 0
+    starts: list[RayPosition] = []
     for row in range(max_row + 1):
-        score_right = simulate_ray_with_start(grid, start=(row, -1, Direction.RIGHT))
-        score_left = simulate_ray_with_start(
-            grid, start=(row, max_col + 1, Direction.LEFT)
-        )
-        max_score = max(max_score, score_right, score_left)
+        starts.append((row, -1, Direction.RIGHT))
+        starts.append((row, max_col + 1, Direction.LEFT))
 
     for col in range(max_col + 1):
-        score_down = simulate_ray_with_start(grid, start=(-1, col, Direction.DOWN))
-        score_up = simulate_ray_with_start(grid, start=(max_row + 1, col, Direction.UP))
-        max_score = max(max_score, score_down, score_up)
+        starts.append((-1, col, Direction.DOWN))
+        starts.append((max_row + 1, col, Direction.UP))
 
-    return max_score
+    progress = telemetry.Channel("2023/day16 rays")
+    # every start is simulated independently, so they can be spread over processes
+    scores = parallel_map(
+        functools.partial(simulate_ray_with_start, grid, progress), starts
+    )
+    return max(scores)
 
 
-def simulate_ray_with_start(grid: list[str], start: RayPosition) -> int:
-    print(f"simulation with start '{start}'")
+def simulate_ray_with_start(
+    grid: list[str], progress: telemetry.Channel, start: RayPosition
+) -> int:
     current_ray_positions = {start}
     ray_positions = current_ray_positions.copy()
     previous_ray_positions: set[RayPosition] = set()
@@ -55,7 +61,9 @@ def simulate_ray_with_start(grid: list[str], start: RayPosition) -> int:
     activated_tiles = {(row, col) for (row, col, _) in ray_positions} - {
         (start[0], start[1])
     }
-    print(f"\tactivated tiles: {len(activated_tiles)}")
+    # worker processes count on their own copy of the channel
+    progress.count("starts")
+    progress.gauge("activated_tiles", len(activated_tiles))
     return len(activated_tiles)
 
 
@@ -1,19 +1,18 @@
-import collections
+import dataclasses
 import enum
-import functools
-import sys
-import time
 import typing
 
-from frozendict import frozendict
+from aoc import telemetry
+from aoc.anytime import AnytimeResult, Budget, default_budget
+from aoc.bits import Layout, width_for
+from aoc.checkpoint import Checkpoints
+from aoc.grid import Grid
+from aoc.search import SearchStats, a_star
 
-
-class Position(typing.NamedTuple):
-    row: int
-    col: int
-
-
-Grid = frozendict[Position, int]
+# heat losses are stored as numeric values, so 0 can mark the cells around the grid
+OFF_GRID = 0
+HEAT_LOSSES = bytes.maketrans(b"0123456789", bytes(range(10)))
+MAX_STRAIGHT_MOVES = 3
 
 
 class Direction(enum.StrEnum):
@@ -23,159 +22,137 @@ class Direction(enum.StrEnum):
     LEFT = "LEFT"
 
 
+# converted, so that mypy isn't confused
+DIRECTIONS = [Direction(direction) for direction in Direction]
+DIRECTION_INDEXES = {direction: index for index, direction in enumerate(DIRECTIONS)}
+
+
 class State(typing.NamedTuple):
-    pos: Position
+    # index into the grid
+    pos: int
     direction: Direction
     straight_counter: int
 
-    def __str__(self):
-        return f"State(pos=({self.pos.row}, {self.pos.col}), direction={self.direction}, straight_counter={self.straight_counter})"
-
 
-class heat_cache:
-    """Similar to `functools.cache`, but using a custom cache key"""
+# the position is the last field, since its width depends on the grid
+STATE = Layout(
+    straight_counter=width_for(MAX_STRAIGHT_MOVES),
+    direction=width_for(len(DIRECTIONS) - 1),
+    pos=None,
+)
 
-    def __init__(self):
-        self.cache: dict = {}
 
-    def __call__(self, func: typing.Callable) -> typing.Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            key: State = kwargs["start_state"]
-            if key in self.cache:
-                return self.cache[key]
+def encode_state(state: State) -> int:
+    direction_index = DIRECTION_INDEXES[state.direction]
+    return STATE.pack(state.straight_counter, direction_index, state.pos)
 
-            result = func(*args, **kwargs)
-            self.cache[key] = result
-            return result
 
-        return wrapper
+def decode_state(value: int) -> State:
+    straight_counter, direction_index, pos = STATE.unpack(value)
+    return State(pos, DIRECTIONS[direction_index], straight_counter)
 
 
 def main(file_name: str) -> None:
     with open(file_name) as f:
         grid = parse_file(f)
 
-    answer = find_best_route(grid)
+    result = search_best_route(grid, default_budget())
+    # with the bound, if the budget ran out
+    answer = result.best if result.complete else result
     print(f"THE ANSWER IS: {answer}")
 
 
 def parse_file(f) -> Grid:
-    return frozendict(
-        {
-            Position(row_index, col_index): int(heat_loss)
-            for row_index, row in enumerate(f.read().strip().splitlines())
-            for col_index, heat_loss in enumerate(row)
-        }
+    return Grid.from_lines(
+        f.read().strip().splitlines(), padding=1, border=OFF_GRID, table=HEAT_LOSSES
     )
 
 
-def find_best_route(grid: Grid) -> int:
-    max_row = max([pos.row for pos in grid])
-    max_col = max([pos.col for pos in grid])
-    assert max_row == max_col, "assuming quadratic grid..."
-    target = Position(max_row, max_col)
-
-    relevant_scores = []
-    for dist in range(max_row + 1):
-        for row_offset in range(dist + 1):
-            for col_offset in range(dist + 1):
-                new_pos = Position(target.row - row_offset, target.col - col_offset)
-                print(f"Finding best score from {new_pos}")
-                for _direction in Direction:
-                    direction = Direction(_direction)  # so that mypy isn't confused
-                    direction_solution = (
-                        sys.maxsize,
-                        (direction, direction, direction),
-                    )
-
-                    for straight_count in range(1, 4):
-                        temp_start_state = State(
-                            pos=new_pos,
-                            direction=direction,
-                            straight_counter=straight_count,
-                        )
-                        # the result is cached and can be reused by the next iteration
-                        if (
-                            get_num_moves_in_direction_at_start(
-                                direction_solution[1], direction
-                            )
-                            < straight_count
-                        ):
-                            solution = direction_solution
-                        else:
-                            solution = None
-                        score, moves = _find_best_route(
-                            grid=grid,
-                            start_state=temp_start_state,
-                            solution=solution,
-                        )
-                        print(f"\tscore: {score}")
-                        if score < direction_solution[0]:
-                            direction_solution = (score, moves)
-
-                        if (
-                            row_offset == max_row
-                            and col_offset == max_col
-                            and straight_count == 1
-                        ):
-                            relevant_scores.append(score)
-    return min(relevant_scores)
-
-
-@heat_cache()  # type: ignore[no-untyped-call]
-def _find_best_route(
-    grid: Grid, start_state: State, solution: None | tuple[int, tuple[Direction, ...]]
-) -> tuple[int, tuple[Direction, ...]]:
-    if solution:
-        return solution
-
-    print(f"\tFinding best route for {start_state}")
-
-    max_row = max([pos.row for pos in grid])
-    max_col = max([pos.col for pos in grid])
-    target = Position(max_row, max_col)
-
-    best_score = sys.maxsize  # a very large integer
-    best_moves: tuple[Direction, ...] = ()
-
-    queue: collections.deque[
-        tuple[State, int, tuple[Direction, ...]]
-    ] = collections.deque([(start_state, 0, ())])
-    while queue:
-        state, current_score, moves = queue.popleft()
-        new_score = current_score + grid[state.pos]
-        new_moves = (*moves, state.direction)
-        if state.pos == target and new_score < best_score:
-            best_score = new_score
-            best_moves = new_moves
-
-        for new_state in get_next_positions_sorted(state):
-            if (
-                not is_on_grid(new_state.pos, max_row, max_col)
-                or new_score + grid[new_state.pos] + distance(new_state.pos, target) - 1
-                >= best_score
-            ):
-                continue
-
-            queue.appendleft((new_state, new_score, new_moves))
-    assert best_score < sys.maxsize, f"Didn't find a route from {start_state.pos}"
-    return best_score, best_moves
-
-
-def get_next_positions_sorted(state: State) -> list[State]:
-    # reverse as _find_best_route uses .appendleft for all directions
-    # -> the order here is reversed again
-    # FYI: I tried sorting by grid[new_state.pos] as well, but it doesn't converge well
-    return list(get_next_positions(state))[::-1]
-
-
-def get_next_positions(state: State) -> typing.Iterable[State]:
+def find_best_route(grid: Grid, stats: SearchStats | None = None) -> int:
+    result = search_best_route(grid, stats=stats)
+    assert result.best is not None
+    return result.best
+
+
+def search_best_route(
+    grid: Grid, budget: Budget | None = None, stats: SearchStats | None = None
+) -> AnytimeResult:
+    """
+    A* search over the states. Every block loses at least 1 heat, so the Manhattan
+    distance to the target is a consistent heuristic.
+
+    If the budget runs out, the best known route is the zig-zag one, and the frontier's
+    lowest estimate bounds the heat loss from below.
+    """
+    progress = telemetry.Channel("2023/day17 search")
+    stats = stats or SearchStats()
+    start = grid.index(0, 0)
+    target = grid.index(grid.height - 1, grid.width - 1)
+    offsets = get_offsets(grid)
+
+    def get_neighbours(value: int) -> typing.Iterator[tuple[int, int]]:
+        for new_state in get_next_positions(decode_state(value), offsets):
+            if (heat_loss := grid[new_state.pos]) != OFF_GRID:
+                yield encode_state(new_state), heat_loss
+
+    # the start block's heat loss doesn't count, as the crucible starts there
+    result = a_star(
+        [encode_state(State(start, direction, 1)) for direction in DIRECTIONS],
+        get_neighbours,
+        is_goal=lambda value: STATE.get(value, "pos") == target,
+        heuristic=stats.timed(
+            lambda value: distance(grid, STATE.get(value, "pos"), target)
+        ),
+        num_states=encode_state(State(len(grid.cells), DIRECTIONS[0], 0)),
+        stats=stats,
+        budget=budget,
+        checkpoints=Checkpoints(__file__, key=bytes(grid.cells)),
+    )
+    if result.lower_bound is not None:
+        heat_loss = get_zig_zag_heat_loss(grid)
+        progress.emit("stopped", heat_loss=heat_loss, **dataclasses.asdict(stats))
+        return AnytimeResult(heat_loss, result.lower_bound, complete=False)
+
+    assert result.found, "Didn't find a route to the target"
+    progress.emit("found", heat_loss=result.cost, **dataclasses.asdict(stats))
+    return AnytimeResult(result.cost, result.cost, complete=True)
+
+
+def get_zig_zag_heat_loss(grid: Grid) -> int | None:
+    """
+    The heat loss of a quick but poor route, which alternates between moving right and
+    down, up to the maximum straight moves along the longer remaining side. None if the
+    grid is too oblong for that.
+    """
+    row = col = heat_loss = 0
+    moves_right = True
+    while (row, col) != (grid.height - 1, grid.width - 1):
+        remaining_right = grid.width - 1 - col
+        remaining_down = grid.height - 1 - row
+        remaining, other = remaining_right, remaining_down
+        if not moves_right:
+            remaining, other = other, remaining
+        if remaining == 0:
+            return None
+
+        num_moves = min(remaining, MAX_STRAIGHT_MOVES if remaining >= other else 1)
+        for _ in range(num_moves):
+            if moves_right:
+                col += 1
+            else:
+                row += 1
+            heat_loss += grid[grid.index(row, col)]
+        moves_right = not moves_right
+    return heat_loss
+
+
+def get_next_positions(
+    state: State, offsets: dict[Direction, int]
+) -> typing.Iterable[State]:
     for new_direction, new_straight_counter in get_move_candidates(
         state.direction, state.straight_counter
     ):
-        offset = get_offset(new_direction)
-        new_position = Position(state.pos.row + offset.row, state.pos.col + offset.col)
+        new_position = state.pos + offsets[new_direction]
         yield State(new_position, new_direction, new_straight_counter)
 
 
@@ -183,62 +160,41 @@ def get_move_candidates(
     direction: Direction, straight_counter: int
 ) -> typing.Iterable[tuple[Direction, int]]:
     if direction == Direction.RIGHT:
-        if straight_counter < 3:
+        if straight_counter < MAX_STRAIGHT_MOVES:
             yield Direction.RIGHT, straight_counter + 1
         yield Direction.DOWN, 1
         yield Direction.UP, 1
     elif direction == Direction.DOWN:
-        if straight_counter < 3:
+        if straight_counter < MAX_STRAIGHT_MOVES:
             yield Direction.DOWN, straight_counter + 1
         yield Direction.RIGHT, 1
         yield Direction.LEFT, 1
     elif direction == Direction.LEFT:
-        if straight_counter < 3:
+        if straight_counter < MAX_STRAIGHT_MOVES:
             yield Direction.LEFT, straight_counter + 1
         yield Direction.DOWN, 1
         yield Direction.UP, 1
     else:  # UP
-        if straight_counter < 3:
+        if straight_counter < MAX_STRAIGHT_MOVES:
             yield Direction.UP, straight_counter + 1
         yield Direction.RIGHT, 1
         yield Direction.LEFT, 1
 
 
-def get_offset(direction: Direction) -> Position:
-    if direction == Direction.RIGHT:
-        return Position(0, 1)
-    elif direction == Direction.DOWN:
-        return Position(1, 0)
-    elif direction == Direction.LEFT:
-        return Position(0, -1)
-    else:
-        return Position(-1, 0)
-
-
-def is_on_grid(pos: Position, max_row: int, max_col: int) -> bool:
-    return 0 <= pos.row <= max_row and 0 <= pos.col <= max_col
-
-
-def distance(pos: Position, target: Position) -> int:
-    return target.row - pos.row + target.col - pos.col
-
+def get_offsets(grid: Grid) -> dict[Direction, int]:
+    return {
+        Direction.RIGHT: grid.right,
+        Direction.DOWN: grid.down,
+        Direction.LEFT: grid.left,
+        Direction.UP: grid.up,
+    }
 
-def get_num_moves_in_direction_at_start(
-    moves: tuple[Direction, ...], direction: Direction
-) -> int:
-    moved_straight = 0
-    for move in moves:
-        if move == direction:
-            moved_straight += 1
-        else:
-            break
 
-    if moved_straight > 3:
-        raise ValueError(f"Moved too long in one direction...\n\t{moves}")
-    return moved_straight
+def distance(grid: Grid, pos: int, target: int) -> int:
+    row, col = grid.position(pos)
+    target_row, target_col = grid.position(target)
+    return target_row - row + target_col - col
 
 
 if __name__ == "__main__":
-    start = time.monotonic()
     main("example_input.txt")
-    print("time elapsed:", round(time.monotonic() - start, 1), "seconds")
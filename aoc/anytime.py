@@ -0,0 +1,105 @@
+"""
+Time & expansion budgets for the optimizing searches, which may otherwise run for hours.
+
+A solver given a `Budget` stops once it's used up, and returns the best solution it found
+so far (the incumbent) together with a proven bound of the optimum, instead of nothing:
+
+    result = search_max_geode_score(blueprint, Budget(seconds=2))
+    print(result.best, result.bound, f"{result.gap:.1%}")
+
+The bound is an upper bound for maximizing searches & a lower bound for minimizing ones,
+so the optimum lies between `best` and `bound`. A search that finished is `complete`,
+and its best solution equals the bound.
+
+The solutions' `main` gives every search the `default_budget()`, which is set with
+`aoc.runner --budget-seconds S --budget-expansions N` or with `AOC_BUDGET_SECONDS` &
+`AOC_BUDGET_EXPANSIONS`, and print the result with its bound if a search stopped early:
+
+    THE ANSWER IS: 1127 (bound 1304, gap 13.6%)
+"""
+import dataclasses
+import math
+import os
+import time
+
+SECONDS_VARIABLE = "AOC_BUDGET_SECONDS"
+EXPANSIONS_VARIABLE = "AOC_BUDGET_EXPANSIONS"
+# expansions between two looks at the clock
+CHECK_INTERVAL = 256
+
+
+@dataclasses.dataclass(frozen=True)
+class Budget:
+    # None for no limit
+    seconds: float | None = None
+    expansions: int | None = None
+
+    def start(self) -> "Deadline":
+        return Deadline(self)
+
+
+def default_budget() -> Budget | None:
+    """The budget of every search of a run, None without a limit"""
+    seconds = os.environ.get(SECONDS_VARIABLE)
+    expansions = os.environ.get(EXPANSIONS_VARIABLE)
+    if not (seconds or expansions):
+        return None
+    return Budget(
+        float(seconds) if seconds else None, int(expansions) if expansions else None
+    )
+
+
+def configure(seconds: float | None, expansions: int | None) -> None:
+    """Set the default budget of this process and the worker processes it starts"""
+    for variable, value in (
+        (SECONDS_VARIABLE, seconds),
+        (EXPANSIONS_VARIABLE, expansions),
+    ):
+        if value is None:
+            os.environ.pop(variable, None)
+        else:
+            os.environ[variable] = str(value)
+
+
+class Deadline:
+    """A budget that started to run out"""
+
+    __slots__ = ("expires", "max_expansions")
+
+    def __init__(self, budget: Budget) -> None:
+        self.expires: float | None = None
+        if budget.seconds is not None:
+            self.expires = time.monotonic() + budget.seconds
+        self.max_expansions = budget.expansions
+
+    def exceeded(self, expansions: int) -> bool:
+        if self.max_expansions is not None and expansions >= self.max_expansions:
+            return True
+        return (
+            self.expires is not None
+            and expansions % CHECK_INTERVAL == 0
+            and time.monotonic() >= self.expires
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class AnytimeResult:
+    # the value of the best solution found, None if there's none yet
+    best: int | None
+    # no solution can be better than this
+    bound: int
+    # whether the search finished, which proves the best solution optimal
+    complete: bool
+
+    @property
+    def gap(self) -> float:
+        """How far the best solution may be from the optimum, relative to the bound"""
+        if self.best is None:
+            return math.inf
+        if self.best == self.bound:
+            return 0.0
+        return abs(self.bound - self.best) / max(abs(self.bound), 1)
+
+    def __str__(self) -> str:
+        status = "optimal" if self.complete else f"gap {self.gap:.1%}"
+        return f"{self.best} (bound {self.bound}, {status})"
@@ -0,0 +1,139 @@
+"""
+Run one day's solutions over many inputs, e.g. the inputs of many users.
+
+The inputs are spread over a pool of worker processes that import the solutions once,
+so interpreter start-up, imports & module-level setup are paid per worker instead of per
+input. The caches of the solutions are cleared after every input, which keeps the memory
+of long batches flat. Results are streamed as JSON lines in the order they complete:
+
+    python -m aoc.batch --year 2023 --day 12 inputs/
+    python -m aoc.batch --year 2022 --day 19 --part 1 --manifest inputs.txt -o out.jsonl
+
+Directories are expanded to the files they contain, and manifests list one input path
+per line (relative to the manifest).
+"""
+import argparse
+import concurrent.futures
+import contextlib
+import json
+import sys
+import typing
+from pathlib import Path
+
+from aoc.checkpoint import enable_resume
+from aoc.memo import clear_all_caches
+from aoc.parallel import available_workers
+from aoc.results import ResultCache
+from aoc.runner import RunResult, Status, run_solution
+from aoc.solutions import Solution, clear_caches, discover_solutions, load_module
+
+
+def collect_inputs(paths: list[Path], manifests: list[Path]) -> list[Path]:
+    inputs = []
+    for path in paths:
+        if path.is_dir():
+            inputs.extend(sorted(p for p in path.iterdir() if p.is_file()))
+        else:
+            inputs.append(path)
+    for manifest in manifests:
+        for line in manifest.read_text().splitlines():
+            if line := line.strip():
+                inputs.append(manifest.parent / line)
+    return inputs
+
+
+def _warm_up(module_names: list[str]) -> None:
+    for module_name in module_names:
+        load_module(module_name)
+
+
+def run_input(
+    solution: Solution, input_path: Path, cache: ResultCache | None = None
+) -> RunResult:
+    """Run a solution on one input & reset its caches afterwards"""
+    try:
+        return run_solution(solution, input_path, trace_memory=False, cache=cache)
+    finally:
+        clear_caches(solution.load())
+        clear_all_caches()
+
+
+def run_batch(
+    solutions: list[Solution],
+    inputs: list[Path],
+    max_workers: int | None = None,
+    cache: ResultCache | None = None,
+) -> typing.Iterator[tuple[Path, RunResult]]:
+    """Results of all solutions on all inputs, as soon as they're done"""
+    num_workers = max_workers or available_workers()
+    module_names = [solution.module_name for solution in solutions]
+    with concurrent.futures.ProcessPoolExecutor(
+        num_workers, initializer=_warm_up, initargs=(module_names,)
+    ) as executor:
+        futures = {
+            executor.submit(run_input, solution, input_path, cache): input_path
+            for input_path in inputs
+            for solution in solutions
+        }
+        for future in concurrent.futures.as_completed(futures):
+            yield futures[future], future.result()
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--year", type=int, required=True)
+    parser.add_argument("--day", type=int, required=True)
+    parser.add_argument("--part", type=int, action="append", help="repeatable")
+    parser.add_argument(
+        "inputs", type=Path, nargs="*", help="input files or directories of inputs"
+    )
+    parser.add_argument(
+        "--manifest", type=Path, action="append", default=[], help="repeatable"
+    )
+    parser.add_argument("--workers", type=int, help="default: all available cores")
+    parser.add_argument("--cache", action="store_true", help="see aoc.results")
+    parser.add_argument("--resume", action="store_true", help="see aoc.checkpoint")
+    parser.add_argument(
+        "-o", "--output", type=Path, help="write the JSON lines here, not to stdout"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_arguments(argv)
+    solutions = discover_solutions(
+        years={args.year},
+        days={args.day},
+        parts=set(args.part) if args.part else None,
+    )
+    if not solutions:
+        raise SystemExit(f"No solutions for {args.year} day {args.day}")
+    inputs = collect_inputs(args.inputs, args.manifest)
+    if not inputs:
+        raise SystemExit("No inputs given")
+
+    if args.resume:
+        # before the workers start, which inherit it
+        enable_resume()
+
+    failed = 0
+    cache = ResultCache() if args.cache else None
+    with contextlib.ExitStack() as stack:
+        output = sys.stdout
+        if args.output:
+            output = stack.enter_context(open(args.output, "w"))
+        for input_path, result in run_batch(solutions, inputs, args.workers, cache):
+            record = {"input": str(input_path), **result.to_json()}
+            output.write(json.dumps(record) + "\n")
+            output.flush()
+            failed += result.status != Status.OK
+
+    print(
+        f"{len(inputs)} inputs, {len(solutions)} solutions, {failed} failed",
+        file=sys.stderr,
+    )
+    return int(failed > 0)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
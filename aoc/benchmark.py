@@ -0,0 +1,283 @@
+"""
+Benchmark the hot functions of the solutions and gate on regressions against a baseline.
+
+Every case is run a few times for warmup and then repeatedly with cleared caches. The
+median & p95 of the repeated runs are compared to the stored baseline:
+
+    python -m aoc.benchmark --save            # record benchmarks.json
+    python -m aoc.benchmark --threshold 0.2   # fail if a median got >20% slower
+"""
+import argparse
+import contextlib
+import dataclasses
+import io
+import json
+import math
+import statistics
+import sys
+import tempfile
+import time
+import types
+import typing
+from pathlib import Path
+
+from aoc.solutions import DEFAULT_INPUT_NAME, ROOT_DIR, clear_caches, load_module
+
+DEFAULT_BASELINE = ROOT_DIR / "benchmarks.json"
+EXAMPLE_INPUT = "example"
+
+Prepare = typing.Callable[[types.ModuleType, Path], typing.Callable[[], object]]
+
+
+@dataclasses.dataclass(frozen=True)
+class BenchmarkCase:
+    name: str
+    module_name: str
+    # parses the input and returns the call of the hot function to be timed
+    prepare: Prepare
+    example: str
+
+
+@dataclasses.dataclass
+class Measurement:
+    case: str
+    input: str
+    timings: list[float]
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.timings)
+
+    @property
+    def p95(self) -> float:
+        ordered = sorted(self.timings)
+        return ordered[math.ceil(0.95 * len(ordered)) - 1]
+
+    def to_json(self) -> dict[str, typing.Any]:
+        return {
+            "input": self.input,
+            "runs": len(self.timings),
+            "median": self.median,
+            "p95": self.p95,
+        }
+
+
+def _read(module: types.ModuleType, path: Path) -> typing.Any:
+    with open(path) as f:
+        return module.parse_file(f)
+
+
+def _prepare_num_solutions(
+    module: types.ModuleType, path: Path
+) -> typing.Callable[[], object]:
+    records = []
+    with open(path) as f:
+        for line in f:
+            symbols, counts = line.split()
+            records.append(
+                ("?".join([symbols] * 5), tuple(map(int, counts.split(","))) * 5)
+            )
+    return lambda: [module.get_num_solutions(*record) for record in records]
+
+
+def _prepare_max_geode_score(
+    module: types.ModuleType, path: Path
+) -> typing.Callable[[], object]:
+    blueprints = _read(module, path)
+    return lambda: [module.get_max_geode_score(blueprint) for blueprint in blueprints]
+
+
+def _prepare_walk_valley(
+    module: types.ModuleType, path: Path
+) -> typing.Callable[[], object]:
+    blizzards, start, target = module.parse_file(path)
+    return lambda: module.walk_valley(blizzards, start, target)
+
+
+def _prepare_simulate_ray(
+    module: types.ModuleType, path: Path
+) -> typing.Callable[[], object]:
+    grid = _read(module, path)
+    return lambda: module.simulate_ray(grid)
+
+
+CASES = [
+    BenchmarkCase(
+        name="2023/day12 part2 get_num_solutions",
+        module_name="2023.day12.part2",
+        prepare=_prepare_num_solutions,
+        example="""\
+???.### 1,1,3
+.??..??...?##. 1,1,3
+?#?#?#?#?#?#?#? 1,3,1,6
+????.#...#... 4,1,1
+????.######..#####. 1,6,5
+?###???????? 3,2,1
+""",
+    ),
+    BenchmarkCase(
+        name="2022/day19 part1 get_max_geode_score",
+        module_name="2022.day19_not_enough_minerals.part1",
+        prepare=_prepare_max_geode_score,
+        # a cheap blueprint, so that the repetitions stay short
+        example=(
+            "Blueprint 1: Each ore robot costs 3 ore. Each clay robot costs 3 ore. "
+            "Each obsidian robot costs 3 ore and 6 clay. "
+            "Each geode robot costs 2 ore and 5 obsidian.\n"
+        ),
+    ),
+    BenchmarkCase(
+        name="2022/day24 part1 walk_valley",
+        module_name="2022.day24_blizzard_basin.part1",
+        prepare=_prepare_walk_valley,
+        example="""\
+#.######
+#>>.<^<#
+#.<..<<#
+#>v.><>#
+#<^v^^>#
+######.#
+""",
+    ),
+    BenchmarkCase(
+        name="2023/day16 part2 simulate_ray",
+        module_name="2023.day16.part2",
+        prepare=_prepare_simulate_ray,
+        example=r""".|...\....
+|.-.\.....
+.....|-...
+........|.
+..........
+.........\
+..../.\\..
+.-.-/..|..
+.|....-|.\
+..//.|....
+""",
+    ),
+]
+
+
+def resolve_input(case: BenchmarkCase, input_name: str, tmp_dir: Path) -> Path:
+    """The real input next to the solution if available, the puzzle example otherwise"""
+    module_dir = ROOT_DIR.joinpath(*case.module_name.split(".")[:-1])
+    if (path := module_dir / input_name).exists():
+        return path
+
+    path = tmp_dir / f"{case.module_name}.txt"
+    path.write_text(case.example)
+    return path
+
+
+def run_case(
+    case: BenchmarkCase, input_path: Path, warmup: int, repeat: int
+) -> list[float]:
+    module = load_module(case.module_name)
+    timings = []
+    # solutions print progress, which we neither want to see nor to measure
+    with contextlib.redirect_stdout(io.StringIO()):
+        call = case.prepare(module, input_path)
+        for index in range(warmup + repeat):
+            clear_caches(module)
+            start = time.perf_counter()
+            call()
+            elapsed = time.perf_counter() - start
+            if index >= warmup:
+                timings.append(elapsed)
+    return timings
+
+
+def load_baseline(path: Path) -> dict[str, dict[str, typing.Any]]:
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(path: Path, measurements: list[Measurement]) -> None:
+    baseline = load_baseline(path)
+    baseline.update({m.case: m.to_json() for m in measurements})
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare(
+    measurement: Measurement, reference: dict[str, typing.Any] | None, threshold: float
+) -> tuple[bool, str]:
+    """Whether the measurement is a regression, and a human-readable verdict"""
+    if reference is None:
+        return False, "no baseline"
+    if reference["input"] != measurement.input:
+        return False, f"baseline was taken on {reference['input']!r}"
+
+    change = measurement.median / reference["median"] - 1
+    verdict = f"{change:+.1%} vs {reference['median']:.4f}s"
+    if change > threshold:
+        return True, f"REGRESSION {verdict}"
+    return False, verdict
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "-k", dest="pattern", default="", help="only run cases containing this"
+    )
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--input-name",
+        default=DEFAULT_INPUT_NAME,
+        help="input next to the solution, falling back to the puzzle example",
+    )
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="allowed relative slowdown of the median (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="store the results as new baseline"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_arguments(argv)
+    baseline = load_baseline(args.baseline)
+
+    measurements = []
+    regressions = 0
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for case in CASES:
+            if args.pattern not in case.name:
+                continue
+
+            input_path = resolve_input(case, args.input_name, Path(tmp_dir))
+            input_label = (
+                EXAMPLE_INPUT if input_path.is_relative_to(tmp_dir) else args.input_name
+            )
+            timings = run_case(case, input_path, args.warmup, args.repeat)
+            measurement = Measurement(case.name, input_label, timings)
+            measurements.append(measurement)
+
+            is_regression, verdict = compare(
+                measurement, baseline.get(case.name), args.threshold
+            )
+            regressions += is_regression
+            print(
+                f"{case.name:<40} {input_label:<12} median {measurement.median:.4f}s "
+                f"p95 {measurement.p95:.4f}s  {verdict}",
+                flush=True,
+            )
+
+    if args.save:
+        save_baseline(args.baseline, measurements)
+        print(f"baseline written to {args.baseline}")
+        return 0
+    return int(regressions > 0)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+Search states packed into a single int, which is cheap to hash, copy & store in sets.
+
+A `Layout` declares the fields of a state and their widths in bits, the first field in
+the lowest bits. The last field may be unbounded, e.g. an ever-growing score:
+
+    STATE = Layout(valve=4, minutes=5, opened=15, released=None)
+    state = STATE.pack(valve, minutes, opened, released)
+    valve, minutes, opened, released = STATE.unpack(state)
+
+Fields are packed in their declared order, so a NamedTuple with the same fields converts
+with `STATE.pack(*state)` & `State(*STATE.unpack(value))`. Like `collections.namedtuple`,
+a layout generates the code of its `pack` & `unpack` functions, which makes them about as
+fast as hand-written shifts. Sets of small ints, like the opened valves, fit into a field
+as a bitmask, see `has_bit`, `set_bit` & `iter_bits`.
+"""
+import keyword
+import typing
+
+Pack = typing.Callable[..., int]
+Unpack = typing.Callable[[int], tuple[int, ...]]
+
+
+class Field(typing.NamedTuple):
+    name: str
+    shift: int
+    # None for an unbounded last field
+    width: int | None
+
+    @property
+    def mask(self) -> int:
+        return -1 if self.width is None else (1 << self.width) - 1
+
+
+def width_for(max_value: int) -> int:
+    """The bits needed for the values `0..max_value`"""
+    return max(max_value.bit_length(), 1)
+
+
+class Layout:
+    """The fields of a packed state, from the lowest to the highest bits"""
+
+    __slots__ = ("fields", "names", "num_bits", "pack", "unpack")
+
+    def __init__(self, **widths: int | None) -> None:
+        fields = {}
+        shift = 0
+        for index, (name, width) in enumerate(widths.items()):
+            if keyword.iskeyword(name) or name.startswith("_"):
+                raise ValueError(f"Invalid field name: {name}")
+            if width is None and index != len(widths) - 1:
+                raise ValueError(f"Only the last field can be unbounded, not {name}")
+            if width is not None and width < 1:
+                raise ValueError(f"The width of {name} must be positive")
+            fields[name] = Field(name, shift, width)
+            shift += width or 0
+
+        self.fields = fields
+        self.names = tuple(fields)
+        # None if the last field is unbounded
+        self.num_bits = None if None in widths.values() else shift
+        self.pack, self.unpack = _compile(list(fields.values()), repr(self))
+
+    def __repr__(self) -> str:
+        widths = ", ".join(f"{f.name}={f.width}" for f in self.fields.values())
+        return f"Layout({widths})"
+
+    @property
+    def size(self) -> int | None:
+        """The number of distinct states, e.g. for a `BitSet` of visited states"""
+        return None if self.num_bits is None else 1 << self.num_bits
+
+    def get(self, state: int, name: str) -> int:
+        field = self.fields[name]
+        return (state >> field.shift) & field.mask
+
+    def replace(self, state: int, **values: int) -> int:
+        """The state with some fields set to new values"""
+        for name, value in values.items():
+            field = self.fields[name]
+            if value < 0 or value & field.mask != value:
+                raise ValueError(f"{value} doesn't fit into the field {name}")
+            state = (state & ~(field.mask << field.shift)) | (value << field.shift)
+        return state
+
+
+def _compile(fields: list[Field], description: str) -> tuple[Pack, Unpack]:
+    """
+    `pack(a, b, c)` & `unpack(state)` with the shifts & masks inlined. Shifting out the
+    width of a bounded field leaves 0 only for values that fit, -1 for negative ones.
+    """
+    names = ", ".join(field.name for field in fields)
+    overflows = " or ".join(
+        f"{f.name} < 0" if f.width is None else f"{f.name} >> {f.width}" for f in fields
+    )
+    packed = " | ".join(f"{f.name} << {f.shift}" if f.shift else f.name for f in fields)
+    unpacked = "".join(f"{_extract('state', field)}, " for field in fields)
+    source = (
+        f"def pack({names}):\n"
+        f"    if {overflows}:\n"
+        f"        raise ValueError(f'{{({names},)}} doesn\\'t fit into {description}')\n"
+        f"    return {packed}\n"
+        f"def unpack(state):\n"
+        f"    return ({unpacked})\n"
+    )
+    namespace: dict[str, typing.Any] = {}
+    exec(source, namespace)
+    return namespace["pack"], namespace["unpack"]
+
+
+def _extract(state: str, field: Field) -> str:
+    shifted = f"{state} >> {field.shift}" if field.shift else state
+    if field.width is None:
+        return f"({shifted})"
+    return f"({shifted} & {field.mask})"
+
+
+def has_bit(mask: int, index: int) -> bool:
+    return bool(mask >> index & 1)
+
+
+def set_bit(mask: int, index: int) -> int:
+    return mask | 1 << index
+
+
+def clear_bit(mask: int, index: int) -> int:
+    return mask & ~(1 << index)
+
+
+def iter_bits(mask: int) -> typing.Iterator[int]:
+    """The indexes of the set bits, from the lowest"""
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
@@ -0,0 +1,109 @@
+"""
+Periodic snapshots of long-running solvers, so that interrupted runs can pick up again.
+
+With resuming enabled, a solver saves its progress (e.g. the search frontier & the
+incumbent) whenever the interval has passed, starts from the latest snapshot instead of
+from scratch, and removes the snapshot once it's done. Otherwise, snapshots are neither
+written nor read:
+
+    checkpoints = Checkpoints(__file__, key=repr(blueprint))
+    queue, max_geode = checkpoints.load() or ([start], 0)
+    while queue:
+        expansions += 1
+        ...
+        if checkpoints.due(expansions):
+            checkpoints.save((queue, max_geode))
+    checkpoints.clear()
+
+Snapshots are pickled to `.cache/checkpoints` (or `$AOC_CHECKPOINT_DIR`), named after the
+solution & a hash of its input and source (see `aoc.results.source_hash`), so a snapshot
+of an edited solver isn't resumed. Resuming is enabled with `AOC_RESUME=1`, which worker
+processes inherit, or with `aoc.runner --resume` & `aoc.batch --resume`.
+"""
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+import typing
+from pathlib import Path
+
+from aoc.results import source_hash
+from aoc.solutions import ROOT_DIR, Solution
+
+CHECKPOINT_DIR_VARIABLE = "AOC_CHECKPOINT_DIR"
+RESUME_VARIABLE = "AOC_RESUME"
+DEFAULT_CHECKPOINT_DIR = ROOT_DIR / ".cache" / "checkpoints"
+# seconds between two snapshots
+DEFAULT_INTERVAL = 60.0
+# expansions between two looks at the clock
+CHECK_INTERVAL = 256
+
+
+def default_checkpoint_dir() -> Path:
+    return Path(os.environ.get(CHECKPOINT_DIR_VARIABLE) or DEFAULT_CHECKPOINT_DIR)
+
+
+def resume_enabled() -> bool:
+    return os.environ.get(RESUME_VARIABLE, "") not in ("", "0")
+
+
+def enable_resume() -> None:
+    """Resume in this process and the worker processes it starts afterwards"""
+    os.environ[RESUME_VARIABLE] = "1"
+
+
+class Checkpoints:
+    """The snapshots of one solver run on one input, `source` is the solution's file"""
+
+    def __init__(
+        self,
+        source: str | Path,
+        key: str | bytes,
+        interval: float = DEFAULT_INTERVAL,
+        directory: Path | None = None,
+    ) -> None:
+        self.solution = Solution.from_path(source)
+        self.key = key.encode() if isinstance(key, str) else key
+        self.directory = directory or default_checkpoint_dir()
+        self.enabled = resume_enabled()
+        self.interval = interval
+        self.next_save = time.monotonic() + interval
+
+    @functools.cached_property
+    def path(self) -> Path:
+        digest = hashlib.sha256(self.key)
+        digest.update(source_hash(self.solution).encode())
+        return self.directory / f"{self.solution.slug}-{digest.hexdigest()[:16]}.pickle"
+
+    def load(self) -> typing.Any:
+        """The latest snapshot, None if there's none or resuming is disabled"""
+        if not self.enabled:
+            return None
+        try:
+            with open(self.path, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+
+    def due(self, expansions: int) -> bool:
+        return (
+            self.enabled
+            and expansions % CHECK_INTERVAL == 0
+            and time.monotonic() >= self.next_save
+        )
+
+    def save(self, snapshot: object) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=self.path.parent, suffix=".tmp", delete=False
+        ) as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # a crash while writing leaves the previous snapshot intact
+        Path(f.name).replace(self.path)
+        self.next_save = time.monotonic() + self.interval
+
+    def clear(self) -> None:
+        if self.enabled:
+            self.path.unlink(missing_ok=True)
@@ -0,0 +1,85 @@
+"""
+Thin client of the `aoc.daemon`, which runs solutions in an already warm process.
+
+Only the standard library is imported here, so a call costs little more than the bare
+interpreter start-up:
+
+    python -m aoc.client 2022 1 1
+    python -m aoc.client 2023 12 2 path/to/input.txt --json
+
+Without an input path, the daemon uses the input next to the solution file.
+"""
+import argparse
+import json
+import os
+import socket
+import sys
+import tempfile
+import typing
+from pathlib import Path
+
+SOCKET_VARIABLE = "AOC_SOCKET"
+
+
+def default_socket_path() -> Path:
+    if path := os.environ.get(SOCKET_VARIABLE):
+        return Path(path)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return Path(runtime_dir) / f"aoc-{os.getuid()}.sock"
+
+
+def request(
+    message: dict[str, typing.Any], socket_path: Path | None = None
+) -> dict[str, typing.Any]:
+    """Send one JSON request to the daemon and wait for its JSON response"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(str(socket_path or default_socket_path()))
+        with connection.makefile("rw") as stream:
+            stream.write(json.dumps(message) + "\n")
+            stream.flush()
+            response = stream.readline()
+    if not response:
+        raise ConnectionError("The daemon closed the connection without a response")
+    return typing.cast(dict[str, typing.Any], json.loads(response))
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("year", type=int)
+    parser.add_argument("day", type=int)
+    parser.add_argument("part", type=int)
+    parser.add_argument("input", type=Path, nargs="?", help="default: input.txt")
+    parser.add_argument("--variant", default="", help="e.g. bruteforce")
+    parser.add_argument("--socket", type=Path, help="default: $AOC_SOCKET")
+    parser.add_argument("--json", action="store_true", help="print the raw response")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_arguments(argv)
+    message = {
+        "year": args.year,
+        "day": args.day,
+        "part": args.part,
+        "variant": args.variant,
+        # the daemon has its own working directory
+        "input": str(args.input.resolve()) if args.input else None,
+    }
+    try:
+        response = request(message, args.socket)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print("The daemon isn't running, start it with: python -m aoc.daemon")
+        return 2
+
+    if args.json:
+        print(json.dumps(response))
+    elif response["status"] == "ok":
+        print(response["answer"])
+        print(f"({response['wall_time']:.3f}s)", file=sys.stderr)
+    else:
+        print(f"{response['status']}: {response['error']}", file=sys.stderr)
+    return int(response["status"] != "ok")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,246 @@
+"""
+Estimate how the solutions scale by running them on generated inputs of growing size.
+
+Every solution is run on synthetic inputs of size n, 2n, 4n, ... (see `aoc.generators`
+for what the size means per day) and the exponents of time & peak memory are fitted
+on a log-log scale, which exposes accidentally quadratic code long before a real input
+is big enough to hurt:
+
+    python -m aoc.complexity --year 2022 --day 20
+    python -m aoc.complexity --steps 4 --max-exponent 1.5
+
+Solutions that use `aoc.parallel` run serially by default, since starting a process pool
+is a fixed cost per run that would flatten the exponents of the small sizes.
+"""
+import argparse
+import contextlib
+import dataclasses
+import math
+import os
+import sys
+import tempfile
+import typing
+from pathlib import Path
+
+from aoc.generators import GENERATORS, generate
+from aoc.parallel import WORKERS_VARIABLE
+from aoc.runner import RunResult, Status, run_solution
+from aoc.solutions import Solution, clear_caches, discover_solutions
+
+
+@dataclasses.dataclass(frozen=True)
+class Settings:
+    seed: int
+    # runs per size, the fastest one counts
+    repeat: int
+    trace_memory: bool
+    # don't grow the input after a run took longer than this many seconds
+    time_limit: float
+    # processes of `aoc.parallel` while measuring
+    workers: int = 1
+
+
+@dataclasses.dataclass
+class Sample:
+    size: int
+    wall_time: float
+    peak_memory: int | None
+
+
+@dataclasses.dataclass
+class ScalingResult:
+    solution: Solution
+    samples: list[Sample]
+    error: str = ""
+
+    @property
+    def time_exponent(self) -> float | None:
+        return fit_exponent([(s.size, s.wall_time) for s in self.samples])
+
+    @property
+    def memory_exponent(self) -> float | None:
+        return fit_exponent(
+            [(s.size, s.peak_memory) for s in self.samples if s.peak_memory is not None]
+        )
+
+
+def fit_exponent(points: list[tuple[int, float]]) -> float | None:
+    """Least-squares slope of log(value) over log(size), i.e. k in value ~ size^k"""
+    points = [(size, value) for size, value in points if value > 0]
+    if len({size for size, _ in points}) < 2:
+        return None
+
+    xs = [math.log(size) for size, _ in points]
+    ys = [math.log(value) for _, value in points]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys, strict=True))
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    return covariance / variance
+
+
+@contextlib.contextmanager
+def _workers(num_workers: int) -> typing.Iterator[None]:
+    previous = os.environ.get(WORKERS_VARIABLE)
+    os.environ[WORKERS_VARIABLE] = str(num_workers)
+    try:
+        yield
+    finally:
+        if previous is None:
+            del os.environ[WORKERS_VARIABLE]
+        else:
+            os.environ[WORKERS_VARIABLE] = previous
+
+
+def _run(solution: Solution, input_path: Path, trace_memory: bool) -> RunResult:
+    # functools caches would make every run after the first one look free
+    clear_caches(solution.load())
+    return run_solution(solution, input_path, trace_memory)
+
+
+def measure_scaling(
+    solution: Solution,
+    sizes: list[int],
+    settings: Settings,
+    tmp_dir: Path,
+) -> ScalingResult:
+    """Run the solution on each size until it fails or exceeds the time limit"""
+    with _workers(settings.workers):
+        return _measure_sizes(solution, sizes, settings, tmp_dir)
+
+
+def _measure_sizes(
+    solution: Solution,
+    sizes: list[int],
+    settings: Settings,
+    tmp_dir: Path,
+) -> ScalingResult:
+    result = ScalingResult(solution, [])
+    for size in sizes:
+        input_path = tmp_dir / f"{solution.year}-{solution.day:02d}-{size}.txt"
+        if not input_path.exists():
+            input_path.write_text(
+                generate(solution.year, solution.day, size, settings.seed)
+            )
+
+        timings = []
+        for _ in range(settings.repeat):
+            run = _run(solution, input_path, trace_memory=False)
+            if run.status != Status.OK:
+                result.error = f"size {size}: {run.error}"
+                return result
+            timings.append(run.wall_time)
+
+        peak_memory = None
+        if settings.trace_memory:
+            peak_memory = _run(solution, input_path, trace_memory=True).peak_memory
+
+        result.samples.append(Sample(size, min(timings), peak_memory))
+        if min(timings) > settings.time_limit:
+            break
+
+    return result
+
+
+def get_sizes(year: int, day: int, base_size: int | None, steps: int) -> list[int]:
+    generator = GENERATORS[(year, day)]
+    if base_size is None:
+        base_size = generator.default_size // 2 ** (steps - 1)
+    base_size = max(base_size, generator.min_size)
+    return [base_size * 2**step for step in range(steps)]
+
+
+def _format_exponent(exponent: float | None) -> str:
+    return "-" if exponent is None else f"O(n^{exponent:.2f})"
+
+
+def format_result(result: ScalingResult) -> str:
+    name = f"{result.solution.name}:"
+    if not result.samples:
+        return f"{name:<32} {Status.FAILED}: {result.error}"
+
+    sizes = f"n={result.samples[0].size}..{result.samples[-1].size}"
+    line = (
+        f"{name:<32} {_format_exponent(result.time_exponent):<12} "
+        f"{_format_exponent(result.memory_exponent):<12} {sizes:<16} "
+        f"{result.samples[-1].wall_time:>9.3f}s"
+    )
+    if result.error:
+        line += f"  (stopped at {result.error})"
+    return line
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--year", type=int, action="append", help="repeatable")
+    parser.add_argument("--day", type=int, action="append", help="repeatable")
+    parser.add_argument("--part", type=int, action="append", help="repeatable")
+    parser.add_argument(
+        "--size",
+        type=int,
+        help="smallest size n (default: the realistic size divided by 2^(steps-1))",
+    )
+    parser.add_argument(
+        "--steps", type=int, default=3, help="number of doublings (default: 3)"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="runs per size, the fastest counts"
+    )
+    parser.add_argument(
+        "--time-limit",
+        type=float,
+        default=10.0,
+        help="don't grow the input after a run took longer (default: %(default)ss)",
+    )
+    parser.add_argument(
+        "--no-memory", action="store_true", help="skip the tracemalloc runs"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="processes of aoc.parallel while measuring (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--max-exponent",
+        type=float,
+        help="fail if a solution's time grows faster than n^MAX_EXPONENT",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_arguments(argv)
+    if args.steps < 2:
+        raise SystemExit("At least two steps are needed to fit an exponent")
+
+    solutions = discover_solutions(
+        years=set(args.year) if args.year else None,
+        days=set(args.day) if args.day else None,
+        parts=set(args.part) if args.part else None,
+    )
+
+    settings = Settings(
+        args.seed, args.repeat, not args.no_memory, args.time_limit, args.workers
+    )
+    print(f"workers: {settings.workers}")
+    print(f"{'solution':<32} {'time':<12} {'memory':<12} {'sizes':<16} {'largest':>10}")
+    too_slow = 0
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for solution in solutions:
+            if (solution.year, solution.day) not in GENERATORS:
+                continue
+
+            sizes = get_sizes(solution.year, solution.day, args.size, args.steps)
+            result = measure_scaling(solution, sizes, settings, Path(tmp_dir))
+            print(format_result(result), flush=True)
+
+            exponent = result.time_exponent
+            if args.max_exponent is not None and exponent is not None:
+                too_slow += exponent > args.max_exponent
+
+    return int(too_slow > 0)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
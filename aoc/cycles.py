@@ -0,0 +1,146 @@
+"""
+Cycle detection for simulations whose states eventually repeat.
+
+Puzzles like "where are the rocks after 10^9 spin cycles" can't be simulated to the end,
+but the states repeat after an offset of `mu` steps with a period of `lambda` steps.
+`find_cycle` determines both from a `step` function, so any later step can be mapped back
+to an equivalent earlier one:
+
+    cycle = find_cycle(block, full_cycle, method=Method.BRENT)
+    block_after_many_cycles = advance(block, full_cycle, cycle.equivalent_step(10**9))
+
+If a `value` function is given (e.g. the height of a tower), values of later steps are
+extrapolated from its growth per period with `cycle.extrapolate(step)`.
+
+The HASH method keeps one fingerprint per step and stops at the first repeat, so `step`
+may mutate its state in place. BRENT's algorithm only keeps a constant number of states,
+but restarts from the initial state, so `step` must return new states instead.
+"""
+import dataclasses
+import enum
+import typing
+
+S = typing.TypeVar("S")
+
+Fingerprint = typing.Callable[[S], typing.Hashable]
+Value = typing.Callable[[S], int]
+
+
+class Method(enum.StrEnum):
+    HASH = "hash"
+    BRENT = "brent"
+
+
+@dataclasses.dataclass(frozen=True)
+class Cycle:
+    # steps before the first state that is part of the cycle
+    offset: int
+    period: int
+    # the value after 0, 1, ..., offset + period steps, empty without a value function
+    values: tuple[int, ...] = ()
+
+    def equivalent_step(self, step: int) -> int:
+        """A step before `offset + period`, whose state equals the one after `step`"""
+        if step < self.offset + self.period:
+            return step
+        return self.offset + (step - self.offset) % self.period
+
+    def extrapolate(self, step: int) -> int:
+        """The value after `step` steps, given that it grows by the same per period"""
+        if not self.values:
+            raise ValueError("The cycle was searched without a value function")
+        equivalent_step = self.equivalent_step(step)
+        num_periods = (step - equivalent_step) // self.period
+        growth = self.values[self.offset + self.period] - self.values[self.offset]
+        return self.values[equivalent_step] + num_periods * growth
+
+
+def advance(state: S, step: typing.Callable[[S], S], num_steps: int) -> S:
+    for _ in range(num_steps):
+        state = step(state)
+    return state
+
+
+def find_cycle(  # noqa: PLR0913
+    initial: S,
+    step: typing.Callable[[S], S],
+    fingerprint: Fingerprint[S] | None = None,
+    value: Value[S] | None = None,
+    method: Method = Method.HASH,
+    max_steps: int | None = None,
+) -> Cycle:
+    """
+    The offset & period after which the fingerprints of the states repeat, the state
+    itself by default. The fingerprint has to capture everything that determines the
+    following states. Raises a ValueError if there's no cycle within `max_steps`.
+    """
+    key: Fingerprint[S] = fingerprint or _identity
+    if method == Method.HASH:
+        return _find_cycle_hashed(initial, step, key, value, max_steps)
+    return _find_cycle_brent(initial, step, key, value, max_steps)
+
+
+def _identity(state: S) -> typing.Hashable:
+    return typing.cast(typing.Hashable, state)
+
+
+def _find_cycle_hashed(
+    state: S,
+    step: typing.Callable[[S], S],
+    fingerprint: Fingerprint[S],
+    value: Value[S] | None,
+    max_steps: int | None,
+) -> Cycle:
+    first_steps: dict[typing.Hashable, int] = {}
+    values = []
+    num_steps = 0
+    while max_steps is None or num_steps <= max_steps:
+        key = fingerprint(state)
+        if value is not None:
+            values.append(value(state))
+        if key in first_steps:
+            offset = first_steps[key]
+            return Cycle(offset, num_steps - offset, tuple(values))
+
+        first_steps[key] = num_steps
+        state = step(state)
+        num_steps += 1
+    raise ValueError(f"No cycle within {max_steps} steps")
+
+
+def _find_cycle_brent(
+    initial: S,
+    step: typing.Callable[[S], S],
+    fingerprint: Fingerprint[S],
+    value: Value[S] | None,
+    max_steps: int | None,
+) -> Cycle:
+    # the period: the hare runs ahead in powers of two, until it meets the tortoise
+    power = period = 1
+    tortoise_key = fingerprint(initial)
+    hare = step(initial)
+    while fingerprint(hare) != tortoise_key:
+        if max_steps is not None and power + period > max_steps:
+            raise ValueError(f"No cycle within {max_steps} steps")
+        if power == period:
+            tortoise_key = fingerprint(hare)
+            power *= 2
+            period = 0
+        hare = step(hare)
+        period += 1
+
+    # the offset: with a head start of one period, both meet at the start of the cycle
+    tortoise, hare = initial, advance(initial, step, period)
+    offset = 0
+    while fingerprint(tortoise) != fingerprint(hare):
+        tortoise, hare = step(tortoise), step(hare)
+        offset += 1
+
+    values: list[int] = []
+    if value is not None:
+        state = initial
+        for _ in range(offset + period):
+            values.append(value(state))
+            state = step(state)
+        values.append(value(state))
+    return Cycle(offset, period, tuple(values))
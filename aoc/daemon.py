@@ -0,0 +1,141 @@
+"""
+Long-lived process that keeps all solutions imported and runs them on request.
+
+For the fast days, interpreter start-up & imports cost more than solving the puzzle. The
+daemon imports every solution once, keeps their module-level tables & memoized results
+warm and answers JSON requests over a Unix socket, one JSON line per request & response:
+
+    python -m aoc.daemon &
+    python -m aoc.client 2022 1 1
+
+A request names the solution & optionally the input, e.g.
+`{"year": 2022, "day": 1, "part": 1, "input": "/abs/path.txt"}`, and the response has
+the fields of `aoc.runner --json`. `{"command": "ping"}` & `{"command": "shutdown"}`
+control the daemon itself. Jobs run one at a time, since solutions print their answers
+to the process-wide stdout. Only the caches marked with `per_input` (see `aoc.memo`) are
+cleared after every job, the others are keyed by their arguments and stay valid.
+"""
+import argparse
+import json
+import socket
+import socketserver
+import sys
+import threading
+import typing
+from pathlib import Path
+
+from aoc.client import default_socket_path
+from aoc.memo import clear_input_caches
+from aoc.runner import Status, run_solution
+from aoc.solutions import Solution, discover_solutions
+
+SolutionKey = tuple[int, int, int, str]
+
+
+class SolverDaemon(socketserver.UnixStreamServer):
+    def __init__(self, socket_path: Path, solutions: list[Solution]) -> None:
+        self.solutions: dict[SolutionKey, Solution] = {
+            (s.year, s.day, s.part, s.variant): s for s in solutions
+        }
+        super().__init__(str(socket_path), _Handler)
+
+    def preload(self) -> list[str]:
+        """Import all solutions, returns the errors of those that can't be imported"""
+        errors = []
+        for solution in self.solutions.values():
+            try:
+                solution.load()
+            except Exception as e:
+                errors.append(f"{solution.name}: {type(e).__name__}: {e}")
+        return errors
+
+    def run_job(self, message: dict[str, typing.Any]) -> dict[str, typing.Any]:
+        command = message.get("command", "run")
+        if command == "ping":
+            return {"status": str(Status.OK), "answer": "pong"}
+        if command == "shutdown":
+            # shutting down waits for the current request, so from another thread
+            threading.Thread(target=self.shutdown).start()
+            return {"status": str(Status.OK), "answer": "bye"}
+
+        key = (
+            int(message["year"]),
+            int(message["day"]),
+            int(message["part"]),
+            message.get("variant") or "",
+        )
+        if (solution := self.solutions.get(key)) is None:
+            return _error(f"No solution for {key}")
+
+        input_path = Path(message.get("input") or solution.input_path())
+        # the modules stay warm, but the caches that depend on the input are cleared
+        try:
+            result = run_solution(solution, input_path, trace_memory=False)
+        finally:
+            clear_input_caches()
+        return {"input": str(input_path), **result.to_json()}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: SolverDaemon
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                message = json.loads(line)
+                if isinstance(message, dict):
+                    response = self.server.run_job(message)
+                else:
+                    response = _error("request must be a JSON object")
+            except (ValueError, KeyError, TypeError) as e:
+                response = _error(f"Invalid request: {type(e).__name__}: {e}")
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+def _error(message: str) -> dict[str, typing.Any]:
+    return {"status": str(Status.FAILED), "answer": "", "error": message}
+
+
+def remove_stale_socket(socket_path: Path) -> None:
+    """Remove the socket of a daemon that didn't shut down cleanly"""
+    if not socket_path.exists():
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        try:
+            connection.connect(str(socket_path))
+        except ConnectionRefusedError:
+            socket_path.unlink()
+        else:
+            raise SystemExit(f"A daemon is running on {socket_path} already")
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--socket", type=Path, help="default: $AOC_SOCKET")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_arguments(argv)
+    socket_path = args.socket or default_socket_path()
+    remove_stale_socket(socket_path)
+
+    with SolverDaemon(socket_path, discover_solutions()) as daemon:
+        for error in daemon.preload():
+            print(f"can't import {error}", file=sys.stderr)
+        print(
+            f"serving {len(daemon.solutions)} solutions on {socket_path}",
+            file=sys.stderr,
+        )
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            socket_path.unlink(missing_ok=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
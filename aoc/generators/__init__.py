@@ -0,0 +1,30 @@
+"""
+Synthetic puzzle inputs of arbitrary size, which are accepted by the solutions' parsers.
+
+Every generator takes a `size` (what it scales is documented per day, e.g. the number of
+lines or the width of a grid) and a seeded `random.Random`, so inputs are reproducible:
+
+    python -m aoc.generators 2023 12 --size 10000 --seed 1 -o /tmp/springs.txt
+"""
+import random
+
+from aoc.generators import y2022, y2023
+from aoc.generators.registry import GENERATORS, InputGenerator
+
+__all__ = ["GENERATORS", "InputGenerator", "generate", "y2022", "y2023"]
+
+
+def generate(year: int, day: int, size: int | None = None, seed: int = 0) -> str:
+    try:
+        generator = GENERATORS[(year, day)]
+    except KeyError:
+        raise ValueError(f"There's no input generator for {year} day {day}") from None
+
+    if size is None:
+        size = generator.default_size
+    if size < generator.min_size:
+        raise ValueError(
+            f"Size of {year} day {day} must be at least {generator.min_size}"
+        )
+
+    return generator.generate(size, random.Random(seed))
@@ -0,0 +1,25 @@
+import argparse
+import sys
+from pathlib import Path
+
+from aoc.generators import generate
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic puzzle input")
+    parser.add_argument("year", type=int)
+    parser.add_argument("day", type=int)
+    parser.add_argument("--size", type=int, help="defaults to a realistic size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", type=Path, help="defaults to stdout")
+    args = parser.parse_args(argv)
+
+    text = generate(args.year, args.day, args.size, args.seed)
+    if args.output:
+        args.output.write_text(text)
+    else:
+        sys.stdout.write(text)
+
+
+if __name__ == "__main__":
+    main()
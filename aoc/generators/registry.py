@@ -0,0 +1,31 @@
+import dataclasses
+import random
+import typing
+
+GenerateFunction = typing.Callable[[int, random.Random], str]
+
+
+@dataclasses.dataclass(frozen=True)
+class InputGenerator:
+    year: int
+    day: int
+    generate: GenerateFunction
+    # roughly the size of the real puzzle input
+    default_size: int
+    # the smallest size that still produces a valid input
+    min_size: int = 1
+
+
+GENERATORS: dict[tuple[int, int], InputGenerator] = {}
+
+
+def register(
+    year: int, day: int, default_size: int, min_size: int = 1
+) -> typing.Callable[[GenerateFunction], GenerateFunction]:
+    def decorator(func: GenerateFunction) -> GenerateFunction:
+        GENERATORS[(year, day)] = InputGenerator(
+            year, day, func, default_size, min_size
+        )
+        return func
+
+    return decorator
@@ -0,0 +1,504 @@
+"""Input generators for the 2022 puzzles (day 11 has its input hard-coded)"""
+import itertools
+import random
+import string
+
+from aoc.generators.registry import register
+
+SNAFU_DIGITS = "=-012"
+
+
+def _lines(lines: list[str]) -> str:
+    return "\n".join(lines) + "\n"
+
+
+@register(2022, 1, default_size=250)
+def calorie_counting(size: int, rng: random.Random) -> str:
+    """`size` elves carrying 1-15 snacks each"""
+    blocks = [
+        "\n".join(str(rng.randint(1_000, 60_000)) for _ in range(rng.randint(1, 15)))
+        for _ in range(size)
+    ]
+    return "\n\n".join(blocks) + "\n"
+
+
+@register(2022, 2, default_size=2_500)
+def rock_paper_scissors(size: int, rng: random.Random) -> str:
+    """`size` rounds"""
+    return _lines([f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(size)])
+
+
+@register(2022, 3, default_size=100)
+def rucksack_reorganization(size: int, rng: random.Random) -> str:
+    """
+    `size` groups of three rucksacks. Each rucksack has exactly one item in both
+    compartments and each group shares exactly one badge.
+    """
+    letters = string.ascii_letters
+    lines = []
+    for _ in range(size):
+        items = rng.sample(letters, len(letters))
+        badge, items = items[0], items[1:]
+        for elf in range(3):
+            # every elf of the group gets its own letters, so the badge is the only
+            # item they all have in common
+            shared, *own = items[elf * 17 : (elf + 1) * 17]
+            left_items, right_items = own[:8], own[8:]
+
+            half_length = rng.randint(8, 16)
+            left = [shared, badge, *rng.choices(left_items, k=half_length - 2)]
+            right = [shared, *rng.choices(right_items, k=half_length - 1)]
+            rng.shuffle(left)
+            rng.shuffle(right)
+            lines.append("".join(left + right))
+    return _lines(lines)
+
+
+@register(2022, 4, default_size=1_000)
+def camp_cleanup(size: int, rng: random.Random) -> str:
+    """`size` pairs of section assignments"""
+    lines = []
+    for _ in range(size):
+        sections = [sorted(rng.sample(range(1, 100), 2)) for _ in range(2)]
+        lines.append(",".join(f"{start}-{end}" for start, end in sections))
+    return _lines(lines)
+
+
+@register(2022, 5, default_size=500)
+def supply_stacks(size: int, rng: random.Random) -> str:
+    """
+    `size` crane moves. The starting stacks are hard-coded in the solution, so the
+    moves are simulated on their heights to never empty a stack.
+    """
+    heights = [4, 8, 3, 7, 8, 7, 5, 8, 6]
+    lines = []
+    for _ in range(size):
+        source = rng.choice([index for index, h in enumerate(heights) if h > 1])
+        target = rng.choice([index for index in range(9) if index != source])
+        amount = rng.randint(1, min(heights[source] - 1, 20))
+        heights[source] -= amount
+        heights[target] += amount
+        lines.append(f"move {amount} from {source + 1} to {target + 1}")
+    return _lines(lines)
+
+
+@register(2022, 6, default_size=4_096, min_size=20)
+def tuning_trouble(size: int, rng: random.Random) -> str:
+    """
+    A datastream of `size` characters. Before the marker only three different
+    letters are used, so both markers are found in the 14 distinct letters we put.
+    """
+    marker_index = rng.randint(0, size - 14)
+    prefix_letters = rng.sample(string.ascii_lowercase, 3)
+    prefix = "".join(rng.choices(prefix_letters, k=marker_index))
+    marker = "".join(rng.sample(string.ascii_lowercase, 14))
+    suffix_length = size - marker_index - 14
+    suffix = "".join(rng.choices(string.ascii_lowercase, k=suffix_length))
+    return prefix + marker + suffix + "\n"
+
+
+@register(2022, 7, default_size=200)
+def no_space_left_on_device(size: int, rng: random.Random) -> str:
+    """
+    A terminal session exploring a file system of `size` directories. File sizes are
+    scaled so that the update of part 2 needs some space to be freed.
+    """
+    children: dict[int, list[int]] = {0: []}
+    for directory in range(1, size):
+        children[rng.randrange(directory)].append(directory)
+        children[directory] = []
+
+    file_weights = {
+        directory: [rng.random() ** 6 for _ in range(rng.randint(0, 4))]
+        for directory in children
+    }
+    file_weights[0].append(rng.random())
+    total_weight = sum(sum(weights) for weights in file_weights.values())
+    used_space = rng.randint(42_000_000, 48_000_000)
+
+    lines: list[str] = []
+
+    def explore(directory: int) -> None:
+        lines.append("$ ls")
+        for child in children[directory]:
+            lines.append(f"dir d{child}")
+        for file_index, weight in enumerate(file_weights[directory]):
+            file_size = max(1, round(weight / total_weight * used_space))
+            extension = rng.choice(["", ".txt", ".dat", ".log"])
+            lines.append(f"{file_size} f{file_index}{extension}")
+
+        for child in children[directory]:
+            lines.append(f"$ cd d{child}")
+            explore(child)
+            lines.append("$ cd ..")
+
+    lines.append("$ cd /")
+    explore(0)
+    return _lines(lines)
+
+
+def _digit_grid(size: int, rng: random.Random, digits: str) -> str:
+    return _lines(["".join(rng.choices(digits, k=size)) for _ in range(size)])
+
+
+@register(2022, 8, default_size=99)
+def treetop_tree_house(size: int, rng: random.Random) -> str:
+    """A forest of `size` x `size` trees"""
+    return _digit_grid(size, rng, string.digits)
+
+
+@register(2022, 9, default_size=2_000)
+def rope_bridge(size: int, rng: random.Random) -> str:
+    """`size` head motions"""
+    return _lines([f"{rng.choice('UDLR')} {rng.randint(1, 20)}" for _ in range(size)])
+
+
+@register(2022, 10, default_size=140)
+def cathode_ray_tube(size: int, rng: random.Random) -> str:
+    """`size` instructions"""
+    lines = []
+    for _ in range(size):
+        if rng.random() < 0.3:
+            lines.append("noop")
+        else:
+            lines.append(f"addx {rng.choice([-1, 1]) * rng.randint(1, 20)}")
+    return _lines(lines)
+
+
+@register(2022, 12, default_size=160, min_size=26)
+def hill_climbing_algorithm(size: int, rng: random.Random) -> str:
+    """
+    A heightmap `size` columns wide. The elevation rises from 'a' in the west to 'z' in
+    the east, so one row is kept walkable while the others get random dents.
+    """
+    height = max(5, size // 4)
+    path_row = rng.randrange(height)
+    rows = []
+    for row in range(height):
+        chars = []
+        for col in range(size):
+            elevation = col * 25 // (size - 1)
+            if row != path_row:
+                elevation = max(0, elevation - rng.choice([0, 0, 0, 1, 2, 3]))
+            chars.append(string.ascii_lowercase[elevation])
+        rows.append(chars)
+
+    rows[path_row][0] = "S"
+    rows[path_row][size - 1] = "E"
+    return _lines(["".join(chars) for chars in rows])
+
+
+def _packet(rng: random.Random, depth: int) -> list:
+    packet: list = []
+    for _ in range(rng.randint(0, 5)):
+        if depth < 4 and rng.random() < 0.3:
+            packet.append(_packet(rng, depth + 1))
+        else:
+            packet.append(rng.randint(0, 10))
+    return packet
+
+
+@register(2022, 13, default_size=150)
+def distress_signal(size: int, rng: random.Random) -> str:
+    """`size` pairs of different packets"""
+    blocks: list[str] = []
+    while len(blocks) < size:
+        left, right = _packet(rng, depth=0), _packet(rng, depth=0)
+        if left != right:
+            blocks.append(f"{left}\n{right}".replace(" ", ""))
+    # the solution evaluates a pair when reaching the blank line after it
+    return "\n\n".join(blocks) + "\n\n"
+
+
+@register(2022, 14, default_size=150)
+def regolith_reservoir(size: int, rng: random.Random) -> str:
+    """
+    `size` rock paths below the sand source at 500,0. Sand piles up at most half as high
+    as the rocks below it are wide, so the paths start deeper than that. Otherwise the
+    sand would reach the source in part 1, where it never stops.
+    """
+    max_length = 12
+    # paths reach up to two horizontal segments further than where they start
+    spread = 10 + size // 2
+    min_y = spread + 2 * max_length + 1
+    max_y = min_y + size
+
+    lines = []
+    for _ in range(size):
+        x, y = rng.randint(500 - spread, 500 + spread), rng.randint(min_y, max_y)
+        points = [(x, y)]
+        for index in range(rng.randint(1, 4)):
+            length = rng.randint(1, max_length)
+            if index % 2 == 0:
+                x += rng.choice([-length, length])
+            else:
+                y += length if y - length < min_y else rng.choice([-length, length])
+            points.append((x, y))
+        lines.append(" -> ".join(f"{x},{y}" for x, y in points))
+    return _lines(lines)
+
+
+@register(2022, 15, default_size=30)
+def beacon_exclusion_zone(size: int, rng: random.Random) -> str:
+    """
+    `size` sensors, each with its closest beacon. Part 2 expects exactly one uncovered
+    spot, which random sensors don't guarantee.
+    """
+    lines = []
+    for _ in range(size):
+        sensor_x, sensor_y = rng.randint(0, 4_000_000), rng.randint(0, 4_000_000)
+        reach = rng.randint(10_000, 1_000_000)
+        offset_x = rng.randint(-reach, reach)
+        offset_y = rng.choice([-1, 1]) * (reach - abs(offset_x))
+        lines.append(
+            f"Sensor at x={sensor_x}, y={sensor_y}: closest beacon is at "
+            f"x={sensor_x + offset_x}, y={sensor_y + offset_y}"
+        )
+    return _lines(lines)
+
+
+def _valve_ids() -> list[str]:
+    return [
+        "".join(chars)
+        for length in (2, 3)
+        for chars in itertools.product(string.ascii_uppercase, repeat=length)
+    ]
+
+
+@register(2022, 16, default_size=60, min_size=3)
+def proboscidea_volcanium(size: int, rng: random.Random) -> str:
+    """`size` connected valves, about every fourth with a working flow rate"""
+    # the search always starts at AA
+    other_ids = _valve_ids()[1:]
+    valve_ids = ["AA", *rng.sample(other_ids, size - 1)]
+
+    tunnels: dict[str, set[str]] = {valve_id: set() for valve_id in valve_ids}
+
+    def connect(valve1: str, valve2: str) -> None:
+        tunnels[valve1].add(valve2)
+        tunnels[valve2].add(valve1)
+
+    for index, valve_id in enumerate(valve_ids[1:], start=1):
+        connect(valve_id, valve_ids[rng.randrange(index)])
+    # the solutions only understand the plural "tunnels lead to valves"
+    for valve_id in valve_ids:
+        while len(tunnels[valve_id]) < 2:
+            other = rng.choice(valve_ids)
+            if other != valve_id:
+                connect(valve_id, other)
+
+    lines = []
+    for valve_id in valve_ids:
+        flow_rate = 0
+        if valve_id != "AA" and rng.random() < 0.25:
+            flow_rate = rng.randint(3, 25)
+        lines.append(
+            f"Valve {valve_id} has flow rate={flow_rate}; "
+            f"tunnels lead to valves {', '.join(sorted(tunnels[valve_id]))}"
+        )
+    return _lines(lines)
+
+
+@register(2022, 17, default_size=10_000)
+def pyroclastic_flow(size: int, rng: random.Random) -> str:
+    """`size` jets of hot gas"""
+    return "".join(rng.choices("<>", k=size)) + "\n"
+
+
+@register(2022, 18, default_size=2_800)
+def boiling_boulders(size: int, rng: random.Random) -> str:
+    """`size` lava cubes, about a third of the bounding box is filled"""
+    side = max(2, round((size / 0.35) ** (1 / 3)))
+    size = min(size, side**3)
+    cubes = rng.sample(list(itertools.product(range(1, side + 1), repeat=3)), size)
+    return _lines([f"{x},{y},{z}" for x, y, z in cubes])
+
+
+@register(2022, 19, default_size=30)
+def not_enough_minerals(size: int, rng: random.Random) -> str:
+    """`size` blueprints"""
+    lines = []
+    for blueprint_id in range(1, size + 1):
+        lines.append(
+            f"Blueprint {blueprint_id}: "
+            f"Each ore robot costs {rng.randint(2, 4)} ore. "
+            f"Each clay robot costs {rng.randint(2, 4)} ore. "
+            f"Each obsidian robot costs {rng.randint(2, 4)} ore "
+            f"and {rng.randint(5, 20)} clay. "
+            f"Each geode robot costs {rng.randint(2, 4)} ore "
+            f"and {rng.randint(5, 20)} obsidian."
+        )
+    return _lines(lines)
+
+
+@register(2022, 20, default_size=5_000, min_size=2)
+def grove_positioning_system(size: int, rng: random.Random) -> str:
+    """`size` numbers, exactly one of them is 0"""
+    numbers = [rng.choice([-1, 1]) * rng.randint(1, 10_000) for _ in range(size - 1)]
+    numbers.insert(rng.randint(0, size - 1), 0)
+    return _lines([str(number) for number in numbers])
+
+
+def _monkey_ids() -> list[str]:
+    ids = [
+        "".join(chars) for chars in itertools.product(string.ascii_lowercase, repeat=4)
+    ]
+    ids.remove("root")
+    ids.remove("humn")
+    return ids
+
+
+def _pop_random(items: list[tuple[str, int]], rng: random.Random) -> tuple[str, int]:
+    index = rng.randrange(len(items))
+    items[index], items[-1] = items[-1], items[index]
+    return items.pop()
+
+
+@register(2022, 21, default_size=2_000, min_size=3)
+def monkey_math(size: int, rng: random.Random) -> str:
+    """
+    `size` monkeys, one of them is 'humn'. Operations are merged randomly, which keeps
+    the tree shallow, and values are kept integral & reasonably small.
+    """
+    num_leaves = (size + 1) // 2
+    ids = iter(rng.sample(_monkey_ids(), size))
+
+    jobs: dict[str, str] = {}
+    pool: list[tuple[str, int]] = []
+    for index in range(num_leaves):
+        monkey_id = "humn" if index == 0 else next(ids)
+        value = rng.randint(1, 20)
+        jobs[monkey_id] = str(value)
+        pool.append((monkey_id, value))
+
+    while len(pool) > 1:
+        (id1, value1), (id2, value2) = _pop_random(pool, rng), _pop_random(pool, rng)
+        operator = rng.choice("+-*/")
+        if operator == "*" and abs(value1 * value2) > 10**9:
+            operator = "+"
+        if operator == "/" and (value2 == 0 or value1 % value2 != 0):
+            operator = "-"
+        value = {
+            "+": value1 + value2,
+            "-": value1 - value2,
+            "*": value1 * value2,
+            "/": value1 // value2 if value2 else 0,
+        }[operator]
+
+        monkey_id = "root" if not pool else next(ids)
+        jobs[monkey_id] = f"{id1} {operator} {id2}"
+        pool.append((monkey_id, value))
+
+    lines = [f"{monkey_id}: {job}" for monkey_id, job in jobs.items()]
+    rng.shuffle(lines)
+    return _lines(lines)
+
+
+@register(2022, 22, default_size=50, min_size=2)
+def monkey_map(size: int, rng: random.Random) -> str:
+    """
+    The board as cube net with an edge length of `size`, in the layout of the real
+    input. The path instructions are hard-coded in the solutions, and part 2 also
+    hard-codes an edge length of 50.
+    """
+    # face columns per band of rows
+    layout = [(1, 2), (1,), (0, 1), (0,)]
+    lines = []
+    for faces in layout:
+        for _ in range(size):
+            line = ""
+            for face_col in range(max(faces) + 1):
+                if face_col not in faces:
+                    line += " " * size
+                    continue
+                line += "".join(rng.choices(".#", weights=[9, 1], k=size))
+            lines.append(line)
+
+    # the walk starts on the leftmost tile of the first row
+    lines[0] = " " * size + "." + lines[0][size + 1 :]
+    return _lines(lines)
+
+
+@register(2022, 23, default_size=70)
+def unstable_diffusion(size: int, rng: random.Random) -> str:
+    """A `size` x `size` grove, half of it covered by elves"""
+    return _lines(["".join(rng.choices(".#", k=size)) for _ in range(size)])
+
+
+@register(2022, 24, default_size=120, min_size=3)
+def blizzard_basin(size: int, rng: random.Random) -> str:
+    """
+    A valley with `size` columns and a fifth as many rows. Like in the real input, no
+    vertical blizzards pass the entry & exit columns. Blizzards that would hit random
+    staircase routes through the valley are left out, so there's always a way through,
+    back & through again (as in part 2), each trip leaving as soon as the last arrived.
+    """
+    width, height = size, max(2, size // 5)
+    blizzards: dict[tuple[int, int], str] = {}
+    # the solutions take the size of the valley from the blizzards, so one has to remain
+    while not blizzards:
+        for row, col in itertools.product(range(height), range(width)):
+            if rng.random() < 0.7:
+                directions = "<>" if col in {0, width - 1} else "<>^v"
+                blizzards[(row, col)] = rng.choice(directions)
+        _clear_trips(blizzards, width, height, rng)
+
+    lines = ["#." + "#" * width]
+    for row in range(height):
+        cells = "".join(blizzards.get((row, col), ".") for col in range(width))
+        lines.append(f"#{cells}#")
+    lines.append("#" * width + ".#")
+    return _lines(lines)
+
+
+def _clear_trips(
+    blizzards: dict[tuple[int, int], str], width: int, height: int, rng: random.Random
+) -> None:
+    """Removes the blizzards that would hit three trips through the valley & back"""
+    minute = 0
+    for trip in range(3):
+        route = _staircase(width, height, rng)
+        if trip % 2:
+            # from the exit back to the entry
+            route = [(height - 1 - row, width - 1 - col) for row, col in route]
+        for row, col in route:
+            minute += 1
+            # where blizzards would have started to be on the route at this minute
+            origins = {
+                ">": (row, (col - minute) % width),
+                "<": (row, (col + minute) % width),
+                "v": ((row - minute) % height, col),
+                "^": ((row + minute) % height, col),
+            }
+            for direction, origin in origins.items():
+                if blizzards.get(origin) == direction:
+                    del blizzards[origin]
+        # the step out of the valley, which no blizzard reaches
+        minute += 1
+
+
+def _staircase(width: int, height: int, rng: random.Random) -> list[tuple[int, int]]:
+    """The cells of a random route from the top left to the bottom right corner"""
+    moves = [(1, 0)] * (height - 1) + [(0, 1)] * (width - 1)
+    rng.shuffle(moves)
+    route = [(0, 0)]
+    for row_step, col_step in moves:
+        row, col = route[-1]
+        route.append((row + row_step, col + col_step))
+    return route
+
+
+def _to_snafu(value: int) -> str:
+    digits = ""
+    while value:
+        value, remainder = divmod(value + 2, 5)
+        digits = SNAFU_DIGITS[remainder] + digits
+    return digits or "0"
+
+
+@register(2022, 25, default_size=120)
+def full_of_hot_air(size: int, rng: random.Random) -> str:
+    """`size` SNAFU numbers"""
+    return _lines(
+        [_to_snafu(rng.randint(1, 5 ** rng.randint(1, 20))) for _ in range(size)]
+    )
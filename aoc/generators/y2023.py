@@ -0,0 +1,405 @@
+"""Input generators for the 2023 puzzles"""
+import itertools
+import random
+import string
+
+from aoc.generators.registry import register
+
+SPELLED_DIGITS = [
+    "one",
+    "two",
+    "three",
+    "four",
+    "five",
+    "six",
+    "seven",
+    "eight",
+    "nine",
+]
+SYMBOLS = "*#+$@/=%&-"
+CARDS = "AKQJT98765432"
+ALMANAC_CATEGORIES = [
+    "seed",
+    "soil",
+    "fertilizer",
+    "water",
+    "light",
+    "temperature",
+    "humidity",
+    "location",
+]
+
+
+def _lines(lines: list[str]) -> str:
+    return "\n".join(lines) + "\n"
+
+
+def _grid(size: int, rng: random.Random, chars: str, weights: list[int]) -> str:
+    return _lines(
+        ["".join(rng.choices(chars, weights=weights, k=size)) for _ in range(size)]
+    )
+
+
+@register(2023, 1, default_size=1_000)
+def trebuchet(size: int, rng: random.Random) -> str:
+    """`size` lines of letters, digits and spelled-out digits, at least one digit each"""
+    lines = []
+    for _ in range(size):
+        parts = [rng.choice(string.digits[1:])]
+        for _ in range(rng.randint(1, 8)):
+            choice = rng.random()
+            if choice < 0.3:
+                parts.append(rng.choice(string.digits[1:]))
+            elif choice < 0.6:
+                parts.append(rng.choice(SPELLED_DIGITS))
+            else:
+                parts.append("".join(rng.choices(string.ascii_lowercase, k=3)))
+        rng.shuffle(parts)
+        lines.append("".join(parts))
+    return _lines(lines)
+
+
+@register(2023, 2, default_size=100)
+def cube_conundrum(size: int, rng: random.Random) -> str:
+    """`size` games of 1-6 draws"""
+    lines = []
+    for game_id in range(1, size + 1):
+        draws = []
+        for _ in range(rng.randint(1, 6)):
+            colours = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            draws.append(", ".join(f"{rng.randint(1, 20)} {c}" for c in colours))
+        lines.append(f"Game {game_id}: {'; '.join(draws)}")
+    return _lines(lines)
+
+
+@register(2023, 3, default_size=140)
+def gear_ratios(size: int, rng: random.Random) -> str:
+    """A `size` x `size` engine schematic"""
+    lines = []
+    for _ in range(size):
+        line = ""
+        while len(line) < size:
+            choice = rng.random()
+            if choice < 0.1:
+                # numbers are always followed by something else than a digit
+                line += str(rng.randint(1, 999)) + "."
+            elif choice < 0.15:
+                line += rng.choice(SYMBOLS)
+            else:
+                line += "."
+        lines.append(line[:size])
+    # the solutions expect every number to be followed by another character
+    lines[-1] = lines[-1][:-1] + "."
+    return _lines(lines)
+
+
+@register(2023, 4, default_size=200)
+def scratchcards(size: int, rng: random.Random) -> str:
+    """`size` cards, none of them wins copies of cards past the end of the table"""
+    width = len(str(size))
+    lines = []
+    for card_id in range(1, size + 1):
+        numbers = rng.sample(range(1, 100), 35)
+        winning, others = numbers[:10], numbers[10:]
+        num_matches = rng.randint(0, min(10, size - card_id))
+        mine = winning[:num_matches] + others[: 25 - num_matches]
+        rng.shuffle(mine)
+        lines.append(
+            f"Card {card_id:>{width}}: "
+            f"{' '.join(f'{n:>2}' for n in winning)} | "
+            f"{' '.join(f'{n:>2}' for n in mine)}"
+        )
+    return _lines(lines)
+
+
+@register(2023, 5, default_size=40)
+def if_you_give_a_seed_a_fertilizer(size: int, rng: random.Random) -> str:
+    """
+    20 seeds (10 seed ranges in part 2) and maps of `size` ranges each. The source
+    ranges of a map are disjoint and get shuffled to disjoint destinations.
+    """
+    upper_limit = 2**32
+    seeds = []
+    for _ in range(10):
+        start = rng.randrange(upper_limit // 2)
+        seeds += [start, rng.randint(1, upper_limit // 20)]
+
+    blocks = ["seeds: " + " ".join(map(str, seeds))]
+    for source, destination in itertools.pairwise(ALMANAC_CATEGORIES):
+        cuts = sorted(rng.sample(range(1, upper_limit), size + 1))
+        ranges = [(start, end - start) for start, end in itertools.pairwise(cuts)]
+        # leave some gaps, where values are mapped onto themselves
+        ranges = [r for r in ranges if rng.random() < 0.9] or ranges[:1]
+
+        shuffled_ranges = rng.sample(ranges, len(ranges))
+        destination_starts = {}
+        destination_start = cuts[0]
+        for source_start, length in shuffled_ranges:
+            destination_starts[source_start] = destination_start
+            destination_start += length
+
+        lines = [
+            f"{destination_starts[source_start]} {source_start} {length}"
+            for source_start, length in shuffled_ranges
+        ]
+        blocks.append("\n".join([f"{source}-to-{destination} map:", *lines]))
+    return "\n\n".join(blocks) + "\n"
+
+
+@register(2023, 6, default_size=4)
+def wait_for_it(size: int, rng: random.Random) -> str:
+    """
+    `size` races that can be won. Part 2 concatenates the numbers into a single race,
+    which grows by magnitudes with every race.
+    """
+    times, distances = [], []
+    for _ in range(size):
+        time = rng.randint(7, 100)
+        best_distance = (time // 2) * (time - time // 2)
+        times.append(time)
+        distances.append(rng.randint(best_distance // 2, best_distance - 1))
+
+    width = max(len(str(value)) for value in times + distances)
+    return _lines(
+        [
+            "Time:    " + " ".join(f"{value:>{width}}" for value in times),
+            "Distance:" + " ".join(f"{value:>{width}}" for value in distances),
+        ]
+    )
+
+
+@register(2023, 7, default_size=1_000)
+def camel_cards(size: int, rng: random.Random) -> str:
+    """`size` different hands with their bids"""
+    hands: set[str] = set()
+    while len(hands) < size:
+        hands.add("".join(rng.choices(CARDS, k=5)))
+    return _lines([f"{hand} {rng.randint(1, 1_000)}" for hand in hands])
+
+
+def _node_ids(length: int, last_chars: str) -> list[str]:
+    return [
+        "".join(chars) + last_char
+        for chars in itertools.product(string.ascii_uppercase, repeat=length - 1)
+        for last_char in last_chars
+    ]
+
+
+@register(2023, 8, default_size=750, min_size=12)
+def haunted_wasteland(size: int, rng: random.Random) -> str:
+    """
+    About `size` nodes forming six ghost cycles from a '..A' node to a '..Z' node. Both
+    exits of a node lead to the same node, so the cycle lengths are known upfront and
+    the solutions' LCM approach applies.
+    """
+    num_ghosts = 6
+    length = 3 if size < 15_000 else 4
+    inner_chars = string.ascii_uppercase[1:-1]
+    inner_ids = iter(rng.sample(_node_ids(length, inner_chars), size))
+    start_ids = ["AAA", *rng.sample(_node_ids(length, "A")[1:], num_ghosts - 1)]
+    end_ids = ["ZZZ", *rng.sample(_node_ids(length, "Z")[:-1], num_ghosts - 1)]
+
+    successors = {}
+    for start_id, end_id in zip(start_ids, end_ids, strict=True):
+        chain_length = rng.randint(max(1, size // num_ghosts // 2), size // num_ghosts)
+        chain = [next(inner_ids) for _ in range(chain_length)]
+        path = [start_id, *chain, end_id]
+        for node_id, next_id in itertools.pairwise(path):
+            successors[node_id] = next_id
+        # ghosts continue after the end node, closing the cycle
+        successors[end_id] = chain[0]
+
+    instructions = "".join(rng.choices("LR", k=rng.randint(50, 300)))
+    lines = [
+        f"{node_id} = ({next_id}, {next_id})" for node_id, next_id in successors.items()
+    ]
+    rng.shuffle(lines)
+    return instructions + "\n\n" + _lines(lines)
+
+
+@register(2023, 9, default_size=200)
+def mirage_maintenance(size: int, rng: random.Random) -> str:
+    """`size` histories of 21 values, each following a polynomial of degree <= 5"""
+    lines = []
+    for _ in range(size):
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 6))]
+        values = [
+            sum(c * x**power for power, c in enumerate(coefficients)) for x in range(21)
+        ]
+        lines.append(" ".join(map(str, values)))
+    return _lines(lines)
+
+
+@register(2023, 10, default_size=70)
+def pipe_maze(size: int, rng: random.Random) -> str:
+    """
+    A single pipe loop on a grid of about (2 * `size`) x (2 * `size`) tiles, surrounded
+    by junk pipes. The loop is the outline of a random histogram, scaled by two so
+    parallel pipes never touch.
+    """
+    heights = [rng.randint(1, size) for _ in range(size)]
+    corners = [(0, 0), (0, size)]
+    for col in range(size - 1, -1, -1):
+        corners += [(heights[col], col + 1), (heights[col], col)]
+    corners.append((0, 0))
+
+    loop = []
+    for (row1, col1), (row2, col2) in itertools.pairwise(corners):
+        row_step, col_step = (
+            (row2 > row1) - (row2 < row1),
+            (col2 > col1) - (col2 < col1),
+        )
+        for step in range(2 * max(abs(row2 - row1), abs(col2 - col1))):
+            loop.append((2 * row1 + step * row_step, 2 * col1 + step * col_step))
+
+    pipes = {
+        frozenset({(-1, 0), (1, 0)}): "|",
+        frozenset({(0, -1), (0, 1)}): "-",
+        frozenset({(-1, 0), (0, 1)}): "L",
+        frozenset({(-1, 0), (0, -1)}): "J",
+        frozenset({(1, 0), (0, -1)}): "7",
+        frozenset({(1, 0), (0, 1)}): "F",
+    }
+    num_rows, num_cols = 2 * size + 1, 2 * size + 1
+    grid = [rng.choices(".|-LJ7F", k=num_cols) for _ in range(num_rows)]
+    for index, (row, col) in enumerate(loop):
+        previous_row, previous_col = loop[index - 1]
+        next_row, next_col = loop[(index + 1) % len(loop)]
+        directions = frozenset(
+            {(previous_row - row, previous_col - col), (next_row - row, next_col - col)}
+        )
+        grid[row][col] = pipes[directions]
+
+    # junk next to the start must not look connected to it
+    start_row, start_col = loop[rng.randrange(len(loop))]
+    for row_offset, col_offset in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+        row, col = start_row + row_offset, start_col + col_offset
+        if 0 <= row < num_rows and 0 <= col < num_cols and (row, col) not in loop:
+            grid[row][col] = "."
+    grid[start_row][start_col] = "S"
+    return _lines(["".join(chars) for chars in grid])
+
+
+@register(2023, 11, default_size=140)
+def cosmic_expansion(size: int, rng: random.Random) -> str:
+    """A `size` x `size` image with some empty rows and columns"""
+    empty_rows = set(rng.sample(range(size), size // 10))
+    empty_cols = set(rng.sample(range(size), size // 10))
+    lines = []
+    for row in range(size):
+        line = ""
+        for col in range(size):
+            is_empty = row in empty_rows or col in empty_cols
+            line += "#" if not is_empty and rng.random() < 0.03 else "."
+        lines.append(line)
+    return _lines(lines)
+
+
+@register(2023, 12, default_size=1_000)
+def hot_springs(size: int, rng: random.Random) -> str:
+    """
+    `size` condition records. Each is derived from an actual row of springs, so there's
+    at least one arrangement, and long stretches of it are replaced with '?'.
+    """
+    lines = []
+    for _ in range(size):
+        springs = rng.choices("#.", k=rng.randint(5, 20))
+        springs[rng.randrange(len(springs))] = "#"
+        counts = [len(group) for group in "".join(springs).split(".") if group]
+
+        start = rng.randrange(len(springs))
+        end = rng.randint(start + 1, len(springs))
+        for index in range(len(springs)):
+            if start <= index < end or rng.random() < 0.2:
+                springs[index] = "?"
+        lines.append(f"{''.join(springs)} {','.join(map(str, counts))}")
+    return _lines(lines)
+
+
+def _transpose(rows: list[list[str]]) -> list[list[str]]:
+    return [list(column) for column in zip(*rows, strict=True)]
+
+
+def _reflection_differences(rows: list[list[str]]) -> list[int]:
+    """Number of differing tiles for every reflection line between two rows"""
+    differences = []
+    for index in range(1, len(rows)):
+        mirrored_pairs = zip(reversed(rows[:index]), rows[index:], strict=False)
+        differences.append(
+            sum(
+                char1 != char2
+                for row1, row2 in mirrored_pairs
+                for char1, char2 in zip(row1, row2, strict=True)
+            )
+        )
+    return differences
+
+
+@register(2023, 13, default_size=100)
+def point_of_incidence(size: int, rng: random.Random) -> str:
+    """
+    `size` patterns. Each has a perfect reflection at its first two columns (part 1)
+    and a reflection across rows that is off by a single smudge (part 2).
+    """
+    patterns: list[str] = []
+    while len(patterns) < size:
+        height, width = rng.randint(3, 8), rng.randint(5, 17)
+        rows = []
+        for _ in range(height):
+            row = rng.choices(".#", k=width - 1)
+            rows.append(row[:1] + row)
+        # mirror the rows, so the reflection lies between the last two of them
+        rows += [row.copy() for row in reversed(rows)]
+
+        smudge_row = rng.randrange(len(rows))
+        smudge_col = rng.randrange(2, width)
+        rows[smudge_row][smudge_col] = ".#"[rows[smudge_row][smudge_col] == "."]
+
+        # random rows can accidentally mirror each other, e.g. at the edges
+        differences = _reflection_differences(rows) + _reflection_differences(
+            _transpose(rows)
+        )
+        if differences.count(0) != 1 or differences.count(1) != 1:
+            continue
+
+        if rng.random() < 0.5:
+            rows = _transpose(rows)
+        if rng.random() < 0.5:
+            rows = [row[::-1] for row in rows]
+        patterns.append("\n".join("".join(row) for row in rows))
+    return "\n\n".join(patterns) + "\n"
+
+
+@register(2023, 14, default_size=100)
+def parabolic_reflector_dish(size: int, rng: random.Random) -> str:
+    """A `size` x `size` platform of round and cube-shaped rocks"""
+    return _grid(size, rng, ".O#", weights=[15, 5, 3])
+
+
+@register(2023, 15, default_size=4_000)
+def lens_library(size: int, rng: random.Random) -> str:
+    """`size` initialization steps on a few hundred lens labels"""
+    labels = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6)))
+        for _ in range(max(1, size // 10))
+    ]
+    steps = []
+    for _ in range(size):
+        label = rng.choice(labels)
+        steps.append(
+            f"{label}-" if rng.random() < 0.3 else f"{label}={rng.randint(1, 9)}"
+        )
+    # the solutions split the whole file by commas, so there's no trailing line break
+    return ",".join(steps)
+
+
+@register(2023, 16, default_size=110)
+def the_floor_will_be_lava(size: int, rng: random.Random) -> str:
+    """A `size` x `size` contraption of mirrors and splitters"""
+    return _grid(size, rng, "./\\|-", weights=[90, 3, 3, 2, 2])
+
+
+@register(2023, 17, default_size=141)
+def clumsy_crucible(size: int, rng: random.Random) -> str:
+    """A `size` x `size` map of heat losses"""
+    return _grid(size, rng, string.digits[1:], weights=[1] * 9)
@@ -0,0 +1,174 @@
+"""
+A dense grid of byte values, shared by the grid puzzles.
+
+Dictionaries or sets of position tuples cost a hash and an object allocation on every
+neighbour lookup. `Grid` stores one byte per cell in a flat `bytearray` instead, and
+cells are addressed by a single integer index:
+
+    grid = Grid.from_lines(["#..", ".#."], padding=1, border=ord("#"))
+    index = grid.index(0, 1)
+    neighbours = [index + offset for offset in grid.orthogonal_offsets]
+
+The optional padding surrounds the grid with `border` cells, so walkers can stop at the
+border value instead of checking bounds. It also makes every neighbour index of an inner
+cell valid, without wrapping around to the other side of the grid.
+"""
+import copy
+import typing
+
+
+class Grid:
+    __slots__ = (
+        "height",
+        "width",
+        "padding",
+        "stride",
+        "cells",
+        "up",
+        "right",
+        "down",
+        "left",
+        "orthogonal_offsets",
+        "adjacent_offsets",
+    )
+
+    def __init__(  # noqa: PLR0913
+        self,
+        height: int,
+        width: int,
+        fill: int = 0,
+        padding: int = 0,
+        border: int | None = None,
+    ) -> None:
+        self.height = height
+        self.width = width
+        self.padding = padding
+        self.stride = width + 2 * padding
+
+        border = fill if border is None else border
+        self.cells = bytearray([border]) * (self.stride * (height + 2 * padding))
+        if fill != border:
+            inner_row = bytes([fill]) * width
+            for row in range(height):
+                start = self.index(row, 0)
+                self.cells[start : start + width] = inner_row
+
+        self.up, self.right, self.down, self.left = -self.stride, 1, self.stride, -1
+        # going clockwise, starting at 12
+        self.orthogonal_offsets = (self.up, self.right, self.down, self.left)
+        self.adjacent_offsets = (
+            self.up,
+            self.up + self.right,
+            self.right,
+            self.down + self.right,
+            self.down,
+            self.down + self.left,
+            self.left,
+            self.up + self.left,
+        )
+
+    @classmethod
+    def from_lines(
+        cls,
+        lines: typing.Iterable[str],
+        padding: int = 0,
+        border: int = ord(" "),
+        table: bytes | None = None,
+    ) -> "Grid":
+        """
+        The characters of equally long lines as byte values. The optional `table` is a
+        `bytes.maketrans` translation, e.g. to store digits as their numeric values.
+        """
+        rows = [line.encode() for line in lines]
+        if not rows:
+            raise ValueError("Empty grid")
+        grid = cls(len(rows), len(rows[0]), padding=padding, border=border)
+        for row_index, row in enumerate(rows):
+            if len(row) != grid.width:
+                raise ValueError(f"Line {row_index} doesn't have {grid.width} chars")
+            start = grid.index(row_index, 0)
+            grid.cells[start : start + grid.width] = row
+
+        if table is not None:
+            grid.translate(table)
+        return grid
+
+    def index(self, row: int, col: int) -> int:
+        return (row + self.padding) * self.stride + col + self.padding
+
+    def position(self, index: int) -> tuple[int, int]:
+        """The (row, col) of an index, negative or beyond the size in the padding"""
+        row, col = divmod(index, self.stride)
+        return row - self.padding, col - self.padding
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        self.cells[index] = value
+
+    def is_inside(self, index: int) -> bool:
+        """Whether the index is part of the grid, i.e. neither padding nor beyond it"""
+        row, col = self.position(index)
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def indexes(self) -> typing.Iterator[int]:
+        """All indexes inside the grid, row by row"""
+        for row in range(self.height):
+            start = self.index(row, 0)
+            yield from range(start, start + self.width)
+
+    def find(self, value: int) -> int:
+        """The first index with this value, padding included"""
+        index = self.cells.find(value)
+        if index < 0:
+            raise ValueError(f"Value {value} isn't part of the grid")
+        return index
+
+    def find_all(self, value: int) -> typing.Iterator[int]:
+        """All indexes with this value in ascending order, padding included"""
+        index = self.cells.find(value)
+        while index >= 0:
+            yield index
+            index = self.cells.find(value, index + 1)
+
+    def count(self, value: int) -> int:
+        """Number of cells with this value, padding included"""
+        return self.cells.count(value)
+
+    def translate(self, table: bytes) -> None:
+        """Map all cell values in place with a `bytes.maketrans` table"""
+        self.cells = self.cells.translate(table)
+
+    def copy(self) -> "Grid":
+        grid = copy.copy(self)
+        grid.cells = self.cells.copy()
+        return grid
+
+    def crop(  # noqa: PLR0913
+        self,
+        top: int,
+        left: int,
+        height: int,
+        width: int,
+        padding: int = 0,
+        border: int = 0,
+    ) -> "Grid":
+        """
+        A new grid of the given area, which may reach into the padding. That's e.g. how
+        grids whose content grows over time can be shrunk to fit & padded again.
+        """
+        grid = Grid(height, width, padding=padding, border=border)
+        for row in range(height):
+            source = self.index(top + row, left)
+            target = grid.index(row, 0)
+            grid.cells[target : target + width] = self.cells[source : source + width]
+        return grid
+
+    def to_lines(self) -> list[str]:
+        """The inner rows as text, e.g. for visualisations"""
+        lines = []
+        for row in range(self.height):
+            start = self.index(row, 0)
+            lines.append(self.cells[start : start + self.width].decode("latin-1"))
+        return lines
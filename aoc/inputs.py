@@ -0,0 +1,104 @@
+"""
+Streaming access to puzzle inputs through a memory map, instead of reading them at once.
+
+`f.read().split(...)` holds the whole file plus all its pieces in memory. `map_input`
+maps the file read-only instead, and the iterators yield `memoryview` slices of the map,
+so only the pages that are currently parsed have to be resident:
+
+    with map_input(file_name) as data:
+        answer = sum(int(line) for line in iter_lines(data) if line)
+
+The slices are only valid inside the `with` block, and the map can't be closed while
+slices are still referenced. Convert them (`int(view)`, `bytes(view).decode()`) if
+they're needed for longer.
+
+Inputs too big for one pass are cut by `iter_chunk_spans` into chunks that end at a
+separator, e.g. a blank line, so that no record is split across two chunks. Each chunk
+can then be copied & parsed on its own, or be handed to another process.
+"""
+import contextlib
+import mmap
+import os
+import typing
+
+Buffer = bytes | mmap.mmap
+
+_CARRIAGE_RETURN = ord("\r")
+_WHITESPACE = frozenset(b" \t\r\n")
+
+
+@contextlib.contextmanager
+def map_input(file_name: str | os.PathLike[str]) -> typing.Iterator[Buffer]:
+    with open(file_name, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # empty files can't be mapped
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+def iter_lines(data: Buffer) -> typing.Iterator[memoryview]:
+    """The lines without their line endings, blank lines included"""
+    spans = (
+        (start, end - 1 if end > start and data[end - 1] == _CARRIAGE_RETURN else end)
+        for start, end in _split(data, b"\n")
+    )
+    yield from _slices(data, spans)
+
+
+def iter_blocks(data: Buffer) -> typing.Iterator[memoryview]:
+    """Groups of lines separated by blank lines, without the surrounding newlines"""
+    spans = (_strip(data, start, end) for start, end in _split(data, b"\n\n"))
+    yield from _slices(data, (span for span in spans if span[0] < span[1]))
+
+
+def iter_records(data: Buffer, separator: bytes = b",") -> typing.Iterator[memoryview]:
+    """Separated records without surrounding whitespace, e.g. of a single long line"""
+    spans = (_strip(data, start, end) for start, end in _split(data, separator))
+    yield from _slices(data, spans)
+
+
+def iter_chunk_spans(
+    data: Buffer,
+    chunk_size: int,
+    separator: bytes = b"\n\n",
+    start: int = 0,
+    end: int | None = None,
+) -> typing.Iterator[tuple[int, int]]:
+    """
+    Consecutive `(start, end)` spans of at least `chunk_size` bytes (except for the last
+    one), which end right after a separator or at the end of the data
+    """
+    end = len(data) if end is None else end
+    while start < end:
+        boundary = data.find(separator, min(start + chunk_size, end), end)
+        stop = end if boundary < 0 else boundary + len(separator)
+        yield start, stop
+        start = stop
+
+
+def _split(data: Buffer, separator: bytes) -> typing.Iterator[tuple[int, int]]:
+    start = 0
+    while (end := data.find(separator, start)) >= 0:
+        yield start, end
+        start = end + len(separator)
+    if start < len(data):
+        yield start, len(data)
+
+
+def _strip(data: Buffer, start: int, end: int) -> tuple[int, int]:
+    while start < end and data[start] in _WHITESPACE:
+        start += 1
+    while end > start and data[end - 1] in _WHITESPACE:
+        end -= 1
+    return start, end
+
+
+def _slices(
+    data: Buffer, spans: typing.Iterable[tuple[int, int]]
+) -> typing.Iterator[memoryview]:
+    # releasing the view on early exits, so the map can be closed afterwards
+    with memoryview(data) as view:
+        for start, end in spans:
+            yield view[start:end]
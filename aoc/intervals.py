@@ -0,0 +1,100 @@
+"""
+An index of closed integer intervals, e.g. section assignments, for questions across all
+of them instead of within pairs.
+
+Comparing every interval with every other one takes O(n^2). The index sorts the intervals
+by their start once, then answers with a sweep line or a search tree over the sorted
+intervals in O((n + k) log n), for k results:
+
+    index = IntervalIndex([(2, 4), (6, 8), (3, 7)])
+    list(index.overlapping_pairs())  # [(0, 2), (2, 1)]
+    index.max_depth()                # Depth(section=3, depth=2)
+    index.stab(7)                    # [2, 1]
+
+Intervals are referred to by their position in the list the index was built from.
+"""
+import bisect
+import heapq
+import itertools
+import math
+import operator
+import typing
+
+Interval = tuple[int, int]
+
+
+class Depth(typing.NamedTuple):
+    section: int
+    # the number of intervals covering the section
+    depth: int
+
+
+class IntervalIndex:
+    def __init__(self, intervals: typing.Iterable[Interval]) -> None:
+        self.intervals = list(intervals)
+        for start, end in self.intervals:
+            if start > end:
+                raise ValueError(f"The interval {start}-{end} ends before it starts")
+        # the positions of the intervals, by their start
+        self.order = sorted(range(len(self.intervals)), key=self.intervals.__getitem__)
+        self.starts = [self.intervals[index][0] for index in self.order]
+
+        # a segment tree over the sorted intervals, with the biggest end in every subtree
+        self.num_leaves = 1 << max(len(self.order) - 1, 0).bit_length()
+        self.max_ends = [-math.inf] * (2 * self.num_leaves)
+        for position, index in enumerate(self.order):
+            self.max_ends[self.num_leaves + position] = self.intervals[index][1]
+        for node in range(self.num_leaves - 1, 0, -1):
+            self.max_ends[node] = max(
+                self.max_ends[2 * node], self.max_ends[2 * node + 1]
+            )
+
+    def __len__(self) -> int:
+        return len(self.intervals)
+
+    def overlapping_pairs(self) -> typing.Iterator[tuple[int, int]]:
+        """Every pair of intervals with a common section once, the earlier start first"""
+        # the intervals that started already, by their end
+        active: list[tuple[int, int]] = []
+        for index in self.order:
+            start, end = self.intervals[index]
+            while active and active[0][0] < start:
+                heapq.heappop(active)
+            for _, other in active:
+                yield other, index
+            heapq.heappush(active, (end, index))
+
+    def depths(self) -> typing.Iterator[Depth]:
+        """The depth from every section on where it changes, in order of the sections"""
+        changes = sorted(
+            itertools.chain(
+                ((start, 1) for start, _ in self.intervals),
+                ((end + 1, -1) for _, end in self.intervals),
+            )
+        )
+        depth = 0
+        for section, group in itertools.groupby(changes, key=operator.itemgetter(0)):
+            depth += sum(change for _, change in group)
+            yield Depth(section, depth)
+
+    def max_depth(self) -> Depth | None:
+        """The first of the sections covered by the most intervals, None without any"""
+        return max(self.depths(), key=operator.attrgetter("depth"), default=None)
+
+    def stab(self, section: int) -> list[int]:
+        """The intervals covering the section, by their start"""
+        # only intervals that start before can cover it, the tree skips the ended ones
+        num_started = bisect.bisect_right(self.starts, section)
+        found = []
+        stack = [(1, 0, self.num_leaves)]
+        while stack:
+            node, first, stop = stack.pop()
+            if first >= num_started or self.max_ends[node] < section:
+                continue
+            if node >= self.num_leaves:
+                found.append(self.order[first])
+                continue
+            middle = (first + stop) // 2
+            stack.append((2 * node + 1, middle, stop))
+            stack.append((2 * node, first, middle))
+        return found
@@ -0,0 +1,191 @@
+"""
+Bounded memoization with hit/miss/eviction counters, for the recursive solutions.
+
+`functools.cache` keeps every result for the lifetime of the process, which adds up when
+many inputs are solved in a row. `memoize` evicts the least recently used results once
+the cache holds more than `max_size` entries, or once the summed `cost` of its values
+exceeds `max_cost` (e.g. bytes via `sys.getsizeof`):
+
+    @memoize(max_size=2**16)
+    def get_num_solutions(symbols: str, counts: tuple[int, ...]) -> int: ...
+
+    get_num_solutions.cache_info()  # CacheStats(hits=..., misses=..., evictions=...)
+
+A `key` function replaces the default key of all arguments, e.g. to skip arguments that
+are the same for every call. Without `key` & `max_cost`, the entries are kept by
+`functools.lru_cache`, which is faster than the Python bookkeeping the others need.
+
+Like with `functools.cache`, `cache_clear()` resets a cache (which
+`aoc.solutions.clear_caches` does between inputs), and `clear_all_caches()` resets every
+memoized function at once. Caches whose entries only help with the input they were
+computed for, e.g. keyed by the whole input, are marked with `per_input=True`:
+`clear_input_caches()` resets only those, so long-lived processes keep the rest warm.
+"""
+import collections
+import dataclasses
+import functools
+import typing
+import weakref
+
+P = typing.ParamSpec("P")
+R = typing.TypeVar("R")
+
+KeyFunction = typing.Callable[..., typing.Hashable]
+CostFunction = typing.Callable[[typing.Any], int]
+
+# separates positional from keyword arguments in the default keys
+_KWARGS_MARK = object()
+
+_caches: "weakref.WeakSet[Memoized[typing.Any, typing.Any]]" = weakref.WeakSet()
+
+
+@dataclasses.dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    # current number of entries & their summed cost
+    size: int = 0
+    cost: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+
+def _default_key(*args: typing.Any, **kwargs: typing.Any) -> typing.Hashable:
+    if not kwargs:
+        return args
+    return (*args, _KWARGS_MARK, *kwargs.items())
+
+
+class Memoized(typing.Generic[P, R]):
+    """A function whose results are kept in a bounded LRU cache"""
+
+    # copied from the function by `functools.update_wrapper`
+    __qualname__: str
+
+    def __init__(  # noqa: PLR0913
+        self,
+        func: typing.Callable[P, R],
+        max_size: int | None = None,
+        max_cost: int | None = None,
+        key: KeyFunction | None = None,
+        cost: CostFunction | None = None,
+        per_input: bool = False,
+    ) -> None:
+        if max_cost is not None and cost is None:
+            raise ValueError("A cost budget needs a cost function")
+        self.func = func
+        self.max_size = max_size
+        self.max_cost = max_cost
+        self.key = key or _default_key
+        self.cost = cost
+        self.per_input = per_input
+        # ordered from least to most recently used, values with their cost
+        self.entries: collections.OrderedDict[
+            typing.Hashable, tuple[R, int]
+        ] = collections.OrderedDict()
+        self.stats = CacheStats()
+        # set by `memoize` for caches that only have a `max_size`
+        self.lru: "functools._lru_cache_wrapper[R] | None" = None
+        functools.update_wrapper(self, func)
+        _caches.add(self)
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        key = self.key(*args, **kwargs)
+        try:
+            value, _ = self.entries[key]
+        except KeyError:
+            pass
+        else:
+            self.entries.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+        self.stats.misses += 1
+        value = self.func(*args, **kwargs)
+        self._store(key, value)
+        return value
+
+    def _store(self, key: typing.Hashable, value: R) -> None:
+        cost = self.cost(value) if self.cost else 0
+        if key in self.entries:
+            # a recursive call computed the same key in the meantime
+            self.stats.cost -= self.entries.pop(key)[1]
+        self.entries[key] = (value, cost)
+        self.stats.cost += cost
+
+        while self.entries and (
+            (self.max_size is not None and len(self.entries) > self.max_size)
+            or (self.max_cost is not None and self.stats.cost > self.max_cost)
+        ):
+            _, (_, evicted_cost) = self.entries.popitem(last=False)
+            self.stats.cost -= evicted_cost
+            self.stats.evictions += 1
+        self.stats.size = len(self.entries)
+
+    def cache_info(self) -> CacheStats:
+        if self.lru is None:
+            return dataclasses.replace(self.stats)
+        info = self.lru.cache_info()
+        # every miss adds an entry, so the ones that aren't there anymore were evicted
+        return CacheStats(
+            hits=info.hits,
+            misses=info.misses,
+            evictions=info.misses - info.currsize,
+            size=info.currsize,
+        )
+
+    def cache_clear(self) -> None:
+        """Drop all entries & reset the counters"""
+        if self.lru is not None:
+            self.lru.cache_clear()
+        self.entries.clear()
+        self.stats = CacheStats()
+
+    def __reduce__(self) -> str:
+        # pickle by reference like plain functions, e.g. for worker processes
+        return self.__qualname__
+
+
+def memoize(
+    max_size: int | None = None,
+    max_cost: int | None = None,
+    key: KeyFunction | None = None,
+    cost: CostFunction | None = None,
+    per_input: bool = False,
+) -> typing.Callable[[typing.Callable[P, R]], Memoized[P, R]]:
+    """Decorator for `Memoized` functions, unbounded without `max_size` & `max_cost`"""
+
+    def decorator(func: typing.Callable[P, R]) -> Memoized[P, R]:
+        if max_cost is None and key is None and cost is None:
+            return _lru_memoized(func, max_size, per_input)
+        return Memoized(func, max_size, max_cost, key, cost, per_input)
+
+    return decorator
+
+
+def _lru_memoized(
+    func: typing.Callable[P, R], max_size: int | None, per_input: bool
+) -> Memoized[P, R]:
+    """A `Memoized` function whose calls go straight to `functools.lru_cache`"""
+    lru = functools.lru_cache(maxsize=max_size)(func)
+    # a `__call__` method that forwards to it would cost a Python frame for every call
+    subclass = type(Memoized.__name__, (Memoized,), {"__call__": staticmethod(lru)})
+    memoized: Memoized[P, R] = subclass(func, max_size, per_input=per_input)
+    memoized.lru = lru
+    return memoized
+
+
+def clear_all_caches() -> None:
+    for cache in list(_caches):
+        cache.cache_clear()
+
+
+def clear_input_caches() -> None:
+    """Reset the caches marked with `per_input`"""
+    for cache in list(_caches):
+        if cache.per_input:
+            cache.cache_clear()
@@ -0,0 +1,384 @@
+"""
+Differential testing of the fast solvers against slow reference solvers on random inputs.
+
+Each pair generates small random cases, runs both implementations and compares their
+outcomes, where raising an exception is an outcome too. A disagreement is shrunk to a
+minimal counterexample by retrying smaller variants of the case for as long as they
+still disagree:
+
+    python -m aoc.oracle                             # all pairs
+    python -m aoc.oracle --pair 2023/day12 --cases 1000 --seed 7
+
+Cases are reproducible from the seed. A solver raises `Unsupported` for valid cases it
+doesn't handle by design, e.g. a cycle detection that gives up; those are skipped.
+"""
+import argparse
+import contextlib
+import dataclasses
+import io
+import itertools
+import random
+import sys
+import tempfile
+import typing
+from pathlib import Path
+
+from aoc.runner import call_main, extract_answer
+from aoc.solutions import clear_caches, load_module
+
+C = typing.TypeVar("C")
+
+DEFAULT_CASES = 100
+# smaller variants tried before the counterexample counts as minimal
+MAX_SHRINK_STEPS = 1_000
+
+
+class Unsupported(Exception):
+    """The case is outside of what the solver handles by design"""
+
+
+@dataclasses.dataclass(frozen=True)
+class OraclePair(typing.Generic[C]):
+    name: str
+    generate: typing.Callable[[random.Random], C]
+    reference: typing.Callable[[C], object]
+    fast: typing.Callable[[C], object]
+    # smaller variants of a case, the most promising first
+    shrink: typing.Callable[[C], typing.Iterable[C]]
+
+
+@dataclasses.dataclass(frozen=True)
+class Disagreement(typing.Generic[C]):
+    case: C
+    expected: str
+    actual: str
+    # the steps that shrunk the originally generated case
+    shrink_steps: int
+
+    def __str__(self) -> str:
+        return (
+            f"case:      {self.case!r}\n"
+            f"reference: {self.expected}\n"
+            f"fast:      {self.actual}\n"
+            f"(shrunk in {self.shrink_steps} steps)"
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class Report(typing.Generic[C]):
+    pair: str
+    compared: int
+    # cases a solver doesn't support
+    skipped: int
+    # the first one, shrunk to a minimal counterexample
+    disagreement: Disagreement[C] | None
+
+    def __str__(self) -> str:
+        skipped = f", {self.skipped} skipped" if self.skipped else ""
+        if self.disagreement is None:
+            return f"{self.pair}: {self.compared} cases agree{skipped}"
+        return (
+            f"{self.pair}: disagreement after {self.compared} cases{skipped}\n"
+            f"{self.disagreement}"
+        )
+
+
+def outcome(solver: typing.Callable[[C], object], case: C) -> str:
+    """The result or the raised exception, except for `Unsupported`"""
+    try:
+        return repr(solver(case))
+    except Unsupported:
+        raise
+    except Exception as e:
+        return f"raised {type(e).__name__}: {e}"
+
+
+def compare(pair: OraclePair[C], case: C) -> tuple[str, str] | None:
+    """Both outcomes if they differ, raises `Unsupported` for skipped cases"""
+    expected, actual = outcome(pair.reference, case), outcome(pair.fast, case)
+    return None if expected == actual else (expected, actual)
+
+
+def check(
+    pair: OraclePair[C], num_cases: int = DEFAULT_CASES, seed: int = 0
+) -> Report[C]:
+    """Compares random cases until the first disagreement"""
+    rng = random.Random(f"{pair.name}:{seed}")
+    compared = skipped = 0
+    for _ in range(num_cases):
+        case = pair.generate(rng)
+        try:
+            outcomes = compare(pair, case)
+        except Unsupported:
+            skipped += 1
+            continue
+        compared += 1
+        if outcomes is not None:
+            disagreement = shrink(pair, case, *outcomes)
+            return Report(pair.name, compared, skipped, disagreement)
+    return Report(pair.name, compared, skipped, None)
+
+
+def shrink(pair: OraclePair[C], case: C, expected: str, actual: str) -> Disagreement[C]:
+    """Greedily replaces the case by the first smaller variant that still disagrees"""
+    steps = 0
+    while steps < MAX_SHRINK_STEPS:
+        for candidate in pair.shrink(case):
+            with contextlib.suppress(Unsupported):
+                if (outcomes := compare(pair, candidate)) is not None:
+                    case, (expected, actual) = candidate, outcomes
+                    steps += 1
+                    break
+        else:
+            break
+    return Disagreement(case, expected, actual, steps)
+
+
+def shorter_strings(text: str, min_length: int = 0) -> typing.Iterator[str]:
+    """The text with chunks removed, from halves down to single characters"""
+    chunk = len(text) // 2
+    while chunk >= 1:
+        for start in range(0, len(text) - chunk + 1, chunk):
+            if len(text) - chunk >= min_length:
+                yield text[:start] + text[start + chunk :]
+        chunk //= 2
+
+
+def smaller_ints(value: int, minimum: int = 0) -> typing.Iterator[int]:
+    """Values towards the minimum, the biggest steps first"""
+    seen = set()
+    for smaller in (minimum, minimum + (value - minimum) // 2, value - 1):
+        if minimum <= smaller < value and smaller not in seen:
+            seen.add(smaller)
+            yield smaller
+
+
+def _without(items: tuple[C, ...], index: int) -> tuple[C, ...]:
+    return items[:index] + items[index + 1 :]
+
+
+def _replaced(items: tuple[C, ...], index: int, item: C) -> tuple[C, ...]:
+    return items[:index] + (item,) + items[index + 1 :]
+
+
+def solve_text(module_name: str, text: str) -> str:
+    """The answer a solution prints for an input, the end-to-end view of a solver"""
+    module = load_module(module_name)
+    clear_caches(module)
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = Path(directory) / "input.txt"
+        input_path.write_text(text)
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            call_main(module, input_path)
+    return extract_answer(output.getvalue())
+
+
+# 2023/day12: the exhaustive enumeration against the memoized recursion
+
+SpringRow = tuple[str, tuple[int, ...]]
+
+
+def _generate_spring_row(rng: random.Random) -> SpringRow:
+    springs = "".join(rng.choice(".#") for _ in range(rng.randint(1, 12)))
+    counts = tuple(len(group) for group in springs.split(".") if group)
+    if not counts or rng.random() < 0.2:
+        # rows without any arrangement
+        counts = tuple(rng.randint(1, 4) for _ in range(rng.randint(1, 3)))
+    symbols = "".join("?" if rng.random() < 0.5 else char for char in springs)
+    if "?" not in symbols:
+        index = rng.randrange(len(symbols))
+        symbols = symbols[:index] + "?" + symbols[index + 1 :]
+    return symbols, counts
+
+
+def _shrink_spring_row(row: SpringRow) -> typing.Iterator[SpringRow]:
+    symbols, counts = row
+    for index in range(len(counts)):
+        if len(counts) > 1:
+            yield symbols, _without(counts, index)
+        for count in smaller_ints(counts[index], minimum=1):
+            yield symbols, _replaced(counts, index, count)
+    for shorter in shorter_strings(symbols, min_length=1):
+        if "?" in shorter:
+            yield shorter, counts
+    for index, char in enumerate(symbols):
+        if char == "#":
+            yield symbols[:index] + "." + symbols[index + 1 :], counts
+
+
+def _count_arrangements_exhaustively(row: SpringRow) -> int:
+    symbols, counts = row
+    module = load_module("2023.day12.part1")
+    return module.get_num_solutions(symbols, list(counts))
+
+
+def _count_arrangements_memoized(row: SpringRow) -> int:
+    symbols, counts = row
+    module = load_module("2023.day12.part2")
+    clear_caches(module)
+    return module.get_num_solutions(symbols, counts)
+
+
+# 2023/day05: the seeds of the ranges one by one against the bruteforce over the ranges
+
+# destination start, source start, range
+MapEntry = tuple[int, int, int]
+Almanac = tuple[tuple[tuple[int, int], ...], tuple[tuple[MapEntry, ...], ...]]
+
+
+def _generate_almanac(rng: random.Random) -> Almanac:
+    seed_ranges = tuple(
+        (rng.randint(0, 60), rng.randint(1, 10)) for _ in range(rng.randint(1, 3))
+    )
+    maps = []
+    for _ in range(rng.randint(1, 4)):
+        # the source ranges of a map don't overlap
+        bounds = sorted(rng.sample(range(70), 2 * rng.randint(0, 3)))
+        entries = [
+            (rng.randint(0, 70), start, end - start)
+            for start, end in itertools.batched(bounds, 2)
+        ]
+        rng.shuffle(entries)
+        maps.append(tuple(entries))
+    return seed_ranges, tuple(maps)
+
+
+def _shrink_almanac(almanac: Almanac) -> typing.Iterator[Almanac]:
+    seed_ranges, maps = almanac
+    for index, (start, length) in enumerate(seed_ranges):
+        if len(seed_ranges) > 1:
+            yield _without(seed_ranges, index), maps
+        for smaller in smaller_ints(length, minimum=1):
+            yield _replaced(seed_ranges, index, (start, smaller)), maps
+        for smaller in smaller_ints(start):
+            yield _replaced(seed_ranges, index, (smaller, length)), maps
+    for index, entries in enumerate(maps):
+        if len(maps) > 1:
+            yield seed_ranges, _without(maps, index)
+        for variant in _shrink_map(entries):
+            yield seed_ranges, _replaced(maps, index, variant)
+
+
+def _shrink_map(entries: tuple[MapEntry, ...]) -> typing.Iterator[tuple[MapEntry, ...]]:
+    for index, (destination, source, length) in enumerate(entries):
+        yield _without(entries, index)
+        # the sources stay, since moving them could make them overlap
+        for smaller in smaller_ints(length, minimum=1):
+            yield _replaced(entries, index, (destination, source, smaller))
+        for smaller in smaller_ints(destination):
+            yield _replaced(entries, index, (smaller, source, length))
+
+
+def _format_almanac(almanac: Almanac, seeds: typing.Iterable[int]) -> str:
+    blocks = ["seeds: " + " ".join(map(str, seeds))]
+    for index, entries in enumerate(almanac[1]):
+        lines = [f"map{index}-to-map{index + 1} map:"]
+        lines.extend(" ".join(map(str, entry)) for entry in entries)
+        blocks.append("\n".join(lines))
+    return "\n\n".join(blocks) + "\n"
+
+
+def _lowest_location_per_seed(almanac: Almanac) -> int:
+    seeds = [
+        seed for start, length in almanac[0] for seed in range(start, start + length)
+    ]
+    return int(solve_text("2023.day05.part1", _format_almanac(almanac, seeds)))
+
+
+def _lowest_location_per_range(almanac: Almanac) -> int:
+    seeds = itertools.chain.from_iterable(almanac[0])
+    text = _format_almanac(almanac, seeds)
+    return int(solve_text("2023.day05.part2-bruteforce", text))
+
+
+# 2022/day17: the rock by rock simulation against the extrapolation from the cycle
+
+Jets = tuple[str, int]
+# rocks before the cycle detection gives up, the surface of some jet patterns never repeats
+MAX_CYCLE_ROCKS = 300
+
+
+def _generate_jets(rng: random.Random) -> Jets:
+    pushes = "".join(rng.choice("<>") for _ in range(rng.randint(20, 60)))
+    return pushes, rng.randint(0, 1_000)
+
+
+def _shrink_jets(jets: Jets) -> typing.Iterator[Jets]:
+    pushes, num_rocks = jets
+    for smaller in smaller_ints(num_rocks):
+        yield pushes, smaller
+    for shorter in shorter_strings(pushes, min_length=1):
+        yield shorter, num_rocks
+
+
+def _simulate_tower(jets: Jets) -> int:
+    module = load_module("2022.day17_pyroclastic_flow.part2")
+    return module.simulate(*jets)
+
+
+def _extrapolate_tower(jets: Jets) -> int:
+    pushes, num_rocks = jets
+    module = load_module("2022.day17_pyroclastic_flow.part2")
+    try:
+        return module.get_tower_height(pushes, num_rocks, max_rocks=MAX_CYCLE_ROCKS)
+    except ValueError as e:
+        raise Unsupported(str(e)) from e
+
+
+PAIRS: list[OraclePair[typing.Any]] = [
+    OraclePair(
+        name="2023/day12",
+        generate=_generate_spring_row,
+        reference=_count_arrangements_exhaustively,
+        fast=_count_arrangements_memoized,
+        shrink=_shrink_spring_row,
+    ),
+    OraclePair(
+        name="2023/day05",
+        generate=_generate_almanac,
+        reference=_lowest_location_per_seed,
+        fast=_lowest_location_per_range,
+        shrink=_shrink_almanac,
+    ),
+    OraclePair(
+        name="2022/day17",
+        generate=_generate_jets,
+        reference=_simulate_tower,
+        fast=_extrapolate_tower,
+        shrink=_shrink_jets,
+    ),
+]
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--pair",
+        action="append",
+        choices=[pair.name for pair in PAIRS],
+        help="repeatable, default: all",
+    )
+    parser.add_argument(
+        "--cases",
+        type=int,
+        default=DEFAULT_CASES,
+        help="random cases per pair (default: %(default)s)",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_arguments(argv)
+    failed = 0
+    for pair in PAIRS:
+        if args.pair and pair.name not in args.pair:
+            continue
+        report = check(pair, args.cases, args.seed)
+        print(report, flush=True)
+        failed += report.disagreement is not None
+    return int(failed > 0)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
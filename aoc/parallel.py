@@ -0,0 +1,100 @@
+"""
+Map independent work items over a process pool, with results in input order.
+
+The solutions are pure functions of their input, so e.g. every blueprint or every start
+position can be handled by another core:
+
+    scores = parallel_map(get_max_geode_score, blueprints)
+
+Big inputs are reduced chunk by chunk with `map_file_chunks`, where every worker maps
+the file itself and only gets the bounds of its chunk:
+
+    partials = map_file_chunks(get_top_calories, file_name)
+
+Without multiple cores (or inside a worker process) the items are mapped serially in
+the current process. The `AOC_WORKERS` environment variable overrides the number of
+workers, e.g. `AOC_WORKERS=1` for serial runs that are easier to profile.
+"""
+import concurrent.futures
+import itertools
+import math
+import multiprocessing
+import os
+import typing
+
+from aoc.inputs import Buffer, iter_chunk_spans, map_input
+
+WORKERS_VARIABLE = "AOC_WORKERS"
+# more chunks than workers, so workers that got cheap items don't run idle
+CHUNKS_PER_WORKER = 4
+# smaller files aren't worth the start-up of the workers
+MIN_FILE_CHUNK_SIZE = 1 << 24
+
+R = typing.TypeVar("R")
+
+
+def available_workers() -> int:
+    if multiprocessing.parent_process() is not None:
+        # we're a worker already, don't spawn pools recursively
+        return 1
+    if value := os.environ.get(WORKERS_VARIABLE):
+        return max(1, int(value))
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def parallel_map(
+    func: typing.Callable[..., R],
+    *iterables: typing.Iterable[typing.Any],
+    chunk_size: int | None = None,
+    max_workers: int | None = None,
+) -> list[R]:
+    """
+    Like `list(map(func, *iterables))`, but spread over processes. `func` and the items
+    must be picklable, i.e. functions have to be defined at module level.
+    """
+    items = list(zip(*iterables, strict=True))
+    num_workers = min(max_workers or available_workers(), len(items))
+    if num_workers <= 1:
+        return [func(*item) for item in items]
+
+    if chunk_size is None:
+        chunk_size = math.ceil(len(items) / (num_workers * CHUNKS_PER_WORKER))
+    with concurrent.futures.ProcessPoolExecutor(num_workers) as executor:
+        return list(executor.map(func, *zip(*items, strict=True), chunksize=chunk_size))
+
+
+def map_file_chunks(
+    func: typing.Callable[[Buffer, int, int], R],
+    file_name: str | os.PathLike[str],
+    separator: bytes = b"\n\n",
+    min_chunk_size: int = MIN_FILE_CHUNK_SIZE,
+) -> list[R]:
+    """
+    `func(data, start, end)` for chunks of the memory-mapped file that end at a separator
+    (see `aoc.inputs.iter_chunk_spans`), spread over processes. The chunks are
+    independent, so the results only need to be merged.
+    """
+    with map_input(file_name) as data:
+        chunk_size = max(
+            min_chunk_size,
+            math.ceil(len(data) / (available_workers() * CHUNKS_PER_WORKER)),
+        )
+        spans = list(iter_chunk_spans(data, chunk_size, separator))
+    return parallel_map(
+        _map_file_chunk,
+        itertools.repeat(func, len(spans)),
+        itertools.repeat(file_name, len(spans)),
+        spans,
+        chunk_size=1,
+    )
+
+
+def _map_file_chunk(
+    func: typing.Callable[[Buffer, int, int], R],
+    file_name: str | os.PathLike[str],
+    span: tuple[int, int],
+) -> R:
+    with map_input(file_name) as data:
+        return func(data, *span)
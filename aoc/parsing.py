@@ -0,0 +1,81 @@
+"""
+Whole-input parsing with precompiled patterns, instead of a regex or split chain per line.
+
+Most inputs are just numbers in a fixed arrangement, so `ints` scans the whole input for
+signed ints in one pass and `int_rows` groups them into records of a fixed size:
+
+    for sensor_x, sensor_y, beacon_x, beacon_y in int_rows(f.read(), 4): ...
+
+Converting to ints costs more than the scan itself, so `word_rows` groups the plain
+whitespace-separated words instead, for inputs whose numbers only need to be compared.
+
+Inputs with names or lists in them are parsed by a `RecordParser`, which compiles its
+line pattern once and builds a typed record from the groups of every line:
+
+    VALVES = RecordParser(r"Valve (\\w+) has flow rate=(\\d+); .* valves? (.+)", make_valve)
+    valves = VALVES.parse(f.read())
+
+All functions take the input as text, or as bytes & memory maps from `aoc.inputs`.
+"""
+import itertools
+import re
+import typing
+
+from aoc.inputs import Buffer
+
+R = typing.TypeVar("R")
+
+Text = str | Buffer
+
+SIGNED_INT = re.compile(r"-?\d+")
+_SIGNED_INT_BYTES = re.compile(rb"-?\d+")
+
+
+def ints(data: Text) -> list[int]:
+    """All signed ints, in the order they appear"""
+    if isinstance(data, str):
+        return list(map(int, SIGNED_INT.findall(data)))
+    return list(map(int, _SIGNED_INT_BYTES.findall(data)))
+
+
+def int_rows(data: Text, width: int) -> list[tuple[int, ...]]:
+    """The ints in groups of `width`, e.g. one group for every line"""
+    values = ints(data)
+    if len(values) % width:
+        raise ValueError(f"{len(values)} ints can't be split into rows of {width}")
+    return list(itertools.batched(values, width))
+
+
+def word_rows(data: Text, width: int) -> list[tuple[str, ...]]:
+    """The whitespace-separated words in groups of `width`"""
+    words = _text(data).split()
+    if len(words) % width:
+        raise ValueError(f"{len(words)} words can't be split into rows of {width}")
+    return list(itertools.batched(words, width))
+
+
+def _text(data: Text) -> str:
+    return data if isinstance(data, str) else bytes(data).decode()
+
+
+class RecordParser(typing.Generic[R]):
+    """
+    Parses every non-blank line with a precompiled pattern, which must match the whole
+    line, and builds a record from the groups of each match.
+    """
+
+    __slots__ = ("pattern", "build")
+
+    def __init__(self, pattern: str, build: typing.Callable[..., R]) -> None:
+        self.pattern = re.compile(rf"^(?:{pattern})[ \t\r]*$", re.MULTILINE)
+        self.build = build
+
+    def parse(self, data: Text) -> list[R]:
+        text = _text(data)
+        records = [self.build(*match.groups()) for match in self.pattern.finditer(text)]
+        num_lines = sum(1 for line in text.splitlines() if line.strip())
+        if len(records) != num_lines:
+            raise ValueError(
+                f"{num_lines - len(records)} lines don't match {self.pattern.pattern!r}"
+            )
+        return records
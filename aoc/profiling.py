@@ -0,0 +1,178 @@
+"""
+Opt-in profilers for whole solution runs, so hot paths can be found without editing them.
+
+`aoc.runner --profile MODE` wraps each solution's `main` with one or more of:
+
+- `cprofile`: deterministic profile as `<solution>.pstats`, e.g. for `snakeviz` or
+  `python -m pstats`
+- `memory`: the top allocation sites by size, at the point where the most memory was
+  traced, as `<solution>.allocations.txt`
+- `sample`: the main thread's stack, sampled periodically, in the collapsed format of
+  `flamegraph.pl` & speedscope as `<solution>.folded`
+
+    python -m aoc.runner --year 2022 --day 19 --part 1 --profile cprofile
+    python -m aoc.runner --day 17 --profile sample --profile memory --top 30
+
+Only the current process is profiled, so set `AOC_WORKERS=1` for solutions that use
+`aoc.parallel`. Since Python 3.12, cProfile sees all threads, so it also records the
+waiting threads of the other modes if they're combined.
+"""
+import collections
+import contextlib
+import cProfile
+import dataclasses
+import enum
+import sys
+import threading
+import tracemalloc
+import types
+import typing
+from pathlib import Path
+
+from aoc.solutions import ROOT_DIR
+
+DEFAULT_OUTPUT_DIR = ROOT_DIR / "profiles"
+# seconds between checks whether the traced memory reached a new peak
+MEMORY_POLL_INTERVAL = 0.05
+
+
+class Mode(enum.StrEnum):
+    CPROFILE = "cprofile"
+    MEMORY = "memory"
+    SAMPLE = "sample"
+
+
+@dataclasses.dataclass(frozen=True)
+class Settings:
+    modes: frozenset[Mode]
+    output_dir: Path = DEFAULT_OUTPUT_DIR
+    # number of allocation sites in the memory report
+    top: int = 20
+    # seconds between stack samples
+    sample_interval: float = 0.005
+
+
+@contextlib.contextmanager
+def profile(settings: Settings, name: str) -> typing.Iterator[list[Path]]:
+    """Profile the block with all modes; yields the paths, which are written on exit"""
+    settings.output_dir.mkdir(parents=True, exist_ok=True)
+    stem = settings.output_dir / name
+    paths: list[Path] = []
+    with contextlib.ExitStack() as stack:
+        if Mode.MEMORY in settings.modes:
+            path = stem.with_suffix(".allocations.txt")
+            stack.enter_context(_allocations(path, settings.top, paths))
+        if Mode.SAMPLE in settings.modes:
+            path = stem.with_suffix(".folded")
+            stack.enter_context(_samples(path, settings.sample_interval, paths))
+        # innermost, so the other profilers' bookkeeping isn't part of the profile
+        if Mode.CPROFILE in settings.modes:
+            stack.enter_context(_cprofile(stem.with_suffix(".pstats"), paths))
+        yield paths
+
+
+@contextlib.contextmanager
+def _cprofile(path: Path, paths: list[Path]) -> typing.Iterator[None]:
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+        paths.append(path)
+
+
+class _PeakSnapshot:
+    """Keeps a tracemalloc snapshot of the largest traced memory seen while polling"""
+
+    def __init__(self) -> None:
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self.size = -1
+        self.stopped = threading.Event()
+
+    def poll(self) -> None:
+        while not self.stopped.wait(MEMORY_POLL_INTERVAL):
+            self.update()
+
+    def update(self) -> None:
+        size, _ = tracemalloc.get_traced_memory()
+        if size > self.size:
+            self.snapshot, self.size = tracemalloc.take_snapshot(), size
+
+
+@contextlib.contextmanager
+def _allocations(path: Path, top: int, paths: list[Path]) -> typing.Iterator[None]:
+    # the runner may trace memory already, then it also stops tracing afterwards
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    peak = _PeakSnapshot()
+    poller = threading.Thread(target=peak.poll, daemon=True)
+    poller.start()
+    try:
+        yield
+    finally:
+        peak.stopped.set()
+        poller.join()
+        peak.update()
+        if started:
+            tracemalloc.stop()
+        assert peak.snapshot is not None
+        path.write_text(_format_allocations(peak.snapshot, peak.size, top))
+        paths.append(path)
+
+
+def _format_allocations(snapshot: tracemalloc.Snapshot, size: int, top: int) -> str:
+    snapshot = snapshot.filter_traces(_IGNORED_ALLOCATIONS)
+    lines = [f"# top {top} allocation sites at {size / 2**20:.2f} MiB traced"]
+    for statistic in snapshot.statistics("lineno")[:top]:
+        frame = statistic.traceback[0]
+        lines.append(
+            f"{statistic.size / 2**10:>12.1f} KiB {statistic.count:>10} blocks  "
+            f"{frame.filename}:{frame.lineno}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+# the profilers' own bookkeeping
+_IGNORED_ALLOCATIONS = [
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, threading.__file__),
+    tracemalloc.Filter(False, __file__),
+]
+
+
+@contextlib.contextmanager
+def _samples(path: Path, interval: float, paths: list[Path]) -> typing.Iterator[None]:
+    thread_id = threading.get_ident()
+    counts: collections.Counter[str] = collections.Counter()
+    stopped = threading.Event()
+
+    def sample() -> None:
+        while not stopped.wait(interval):
+            if frame := sys._current_frames().get(thread_id):
+                counts[_collapse_stack(frame)] += 1
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        yield
+    finally:
+        stopped.set()
+        sampler.join()
+        path.write_text("".join(f"{stack} {n}\n" for stack, n in counts.items()))
+        paths.append(path)
+
+
+def _collapse_stack(frame: types.FrameType | None) -> str:
+    """The frames from the outermost to the current one, separated by semicolons"""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(
+            f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+        )
+        frame = frame.f_back
+    return ";".join(reversed(names))
@@ -0,0 +1,156 @@
+"""
+On-disk cache of answers, keyed by the input's content and the solution's source code.
+
+An entry is only found again while both the input bytes and the source (the solution
+file and the `aoc` modules it imports, directly or through other `aoc` modules) are
+unchanged, so edits invalidate the cached answers automatically:
+
+    python -m aoc.runner --cache
+    AOC_CACHE_DIR=/tmp/aoc-cache python -m aoc.runner --cache --year 2022
+
+Every entry is a small JSON file that's written atomically (via a rename), so several
+processes can share the cache without locking. Once the entries exceed `max_bytes`, the
+least recently used ones are removed; reading an entry marks it as used.
+"""
+import ast
+import dataclasses
+import functools
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from aoc.solutions import ROOT_DIR, Solution
+
+CACHE_DIR_VARIABLE = "AOC_CACHE_DIR"
+DEFAULT_CACHE_DIR = ROOT_DIR / ".cache" / "results"
+DEFAULT_MAX_BYTES = 16 * 2**20
+# bumped when the entries change their format
+VERSION = 1
+
+
+@dataclasses.dataclass(frozen=True)
+class CachedResult:
+    answer: str
+    # of the run that computed the answer
+    wall_time: float
+
+
+def default_cache_dir() -> Path:
+    return Path(os.environ.get(CACHE_DIR_VARIABLE) or DEFAULT_CACHE_DIR)
+
+
+@functools.lru_cache
+def _hash_file(path: Path, _modified: int, _size: int) -> str:
+    # the modification time & size are only part of the key to notice changes
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def hash_file(path: Path) -> str:
+    stat = path.stat()
+    return _hash_file(path, stat.st_mtime_ns, stat.st_size)
+
+
+def _imported_aoc_modules(path: Path) -> list[Path]:
+    """The files of the `aoc` modules that a file imports directly"""
+    module_names: set[str] = set()
+    for node in ast.walk(ast.parse(path.read_bytes())):
+        if isinstance(node, ast.Import):
+            module_names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            module_names.add(node.module)
+            # `from aoc import grid` imports a module, too
+            module_names.update(f"{node.module}.{alias.name}" for alias in node.names)
+
+    paths = []
+    for name in sorted(module_names):
+        if name != "aoc" and not name.startswith("aoc."):
+            continue
+        module_path = ROOT_DIR.joinpath(*name.split("."))
+        for candidate in (module_path.with_suffix(".py"), module_path / "__init__.py"):
+            if candidate.is_file():
+                paths.append(candidate)
+    return paths
+
+
+def _aoc_dependencies(path: Path) -> list[Path]:
+    """The files of all `aoc` modules that a solution depends on, also indirectly"""
+    found: set[Path] = set()
+    pending = _imported_aoc_modules(path)
+    while pending:
+        module_path = pending.pop()
+        if module_path not in found:
+            found.add(module_path)
+            pending.extend(_imported_aoc_modules(module_path))
+    return sorted(found)
+
+
+def source_hash(solution: Solution) -> str:
+    digest = hashlib.sha256()
+    for path in [solution.path, *_aoc_dependencies(solution.path)]:
+        digest.update(hash_file(path).encode())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    def __init__(
+        self, directory: Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+
+    def key(self, solution: Solution, input_path: Path) -> str:
+        digest = hashlib.sha256(f"{VERSION}:{solution.name}".encode())
+        digest.update(source_hash(solution).encode())
+        digest.update(hash_file(input_path).encode())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> CachedResult | None:
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_text())
+            # the access time isn't reliable on all file systems, the modification is
+            os.utime(path)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return CachedResult(data["answer"], data["wall_time"])
+
+    def put(self, key: str, result: CachedResult) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, suffix=".tmp", delete=False
+        ) as f:
+            json.dump(dataclasses.asdict(result), f)
+        Path(f.name).replace(path)
+        self.evict()
+
+    def evict(self) -> int:
+        """Remove the least recently used entries above the size limit"""
+        entries = []
+        for path in self.directory.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # removed by another process in the meantime
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*/*.json"):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,315 @@
+"""
+Run the solutions in a single process and report wall time, CPU time & peak memory per part.
+
+Inputs are resolved next to each solution file, so this works from any directory:
+
+    python -m aoc.runner --year 2023 --day 12 --part 2
+    python -m aoc.runner --input-name example_input.txt
+    python -m aoc.runner --year 2022 --day 19 --part 1 --profile cprofile
+
+See `aoc.profiling` for the profiling modes.
+"""
+import argparse
+import contextlib
+import dataclasses
+import enum
+import inspect
+import io
+import json
+import sys
+import time
+import tracemalloc
+import types
+import typing
+from pathlib import Path
+
+from aoc import anytime, checkpoint, profiling, telemetry
+from aoc.results import CachedResult, ResultCache
+from aoc.solutions import DEFAULT_INPUT_NAME, Solution, discover_solutions
+
+ANSWER_MARKER = "ANSWER"
+
+
+class Status(enum.StrEnum):
+    OK = "ok"
+    MISSING_INPUT = "missing input"
+    FAILED = "failed"
+
+
+@dataclasses.dataclass
+class RunResult:
+    solution: Solution
+    status: Status
+    answer: str = ""
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    peak_memory: int | None = None
+    error: str = ""
+    # files written by the profilers
+    profiles: list[Path] = dataclasses.field(default_factory=list)
+    # the answer comes from the result cache, the times are the ones of the cached run
+    cached: bool = False
+
+    def to_json(self) -> dict[str, typing.Any]:
+        return {
+            "solution": self.solution.name,
+            "status": str(self.status),
+            "answer": self.answer,
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "peak_memory": self.peak_memory,
+            "error": self.error,
+            "profiles": [str(path) for path in self.profiles],
+            "cached": self.cached,
+        }
+
+
+def takes_input(module: types.ModuleType) -> bool:
+    return bool(inspect.signature(module.main).parameters)
+
+
+def call_main(module: types.ModuleType, input_path: Path) -> None:
+    if takes_input(module):
+        module.main(str(input_path))
+    else:
+        module.main()
+
+
+def extract_answer(output: str) -> str:
+    """Text after the last "THE ANSWER IS:" line, or the whole output for drawn answers"""
+    lines = output.strip().splitlines()
+    for line in reversed(lines):
+        if ANSWER_MARKER in line:
+            return line.split(":", 1)[-1].strip()
+    return "\n".join(lines)
+
+
+def run_solution(
+    solution: Solution,
+    input_path: Path,
+    trace_memory: bool = True,
+    profile: profiling.Settings | None = None,
+    cache: ResultCache | None = None,
+) -> RunResult:
+    try:
+        module = solution.load()
+    except Exception as e:
+        return RunResult(solution, Status.FAILED, error=f"{type(e).__name__}: {e}")
+
+    if takes_input(module) and not input_path.exists():
+        return RunResult(solution, Status.MISSING_INPUT, error=str(input_path))
+
+    cache_key = None
+    if cache is not None and input_path.exists():
+        cache_key = cache.key(solution, input_path)
+        # profiles are only useful for real runs
+        if profile is None and (cached := cache.get(cache_key)) is not None:
+            return RunResult(
+                solution,
+                Status.OK,
+                cached.answer,
+                wall_time=cached.wall_time,
+                cached=True,
+            )
+
+    stdout = io.StringIO()
+    status, error = Status.OK, ""
+    peak_memory = None
+    profiles: list[Path] = []
+
+    if trace_memory:
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.ExitStack() as stack:
+            if profile is not None:
+                profiles = stack.enter_context(
+                    profiling.profile(profile, solution.slug)
+                )
+            call_main(module, input_path)
+    except Exception as e:
+        status, error = Status.FAILED, f"{type(e).__name__}: {e}"
+    finally:
+        wall_time = time.perf_counter() - wall_start
+        cpu_time = time.process_time() - cpu_start
+        if trace_memory:
+            _, peak_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+    answer = extract_answer(stdout.getvalue())
+    if cache is not None and cache_key is not None and status == Status.OK:
+        cache.put(cache_key, CachedResult(answer, wall_time))
+
+    return RunResult(
+        solution,
+        status,
+        answer,
+        wall_time,
+        cpu_time,
+        peak_memory,
+        error,
+        profiles,
+    )
+
+
+def format_result(result: RunResult) -> str:
+    if result.status != Status.OK:
+        details = f"{result.status}: {result.error}"
+        return f"{result.solution.name:<32} {details}"
+
+    answer_lines = result.answer.splitlines() or [""]
+    answer = answer_lines[0] + (" ..." if len(answer_lines) > 1 else "")
+    memory = "-" if result.peak_memory is None else f"{result.peak_memory / 2**20:.2f}"
+    line = (
+        f"{result.solution.name:<32} {answer:<20.20} "
+        f"{result.wall_time:>10.3f} {result.cpu_time:>10.3f} {memory:>14}"
+    )
+    return line + ("  (cached)" if result.cached else "")
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--year", type=int, action="append", help="repeatable")
+    parser.add_argument("--day", type=int, action="append", help="repeatable")
+    parser.add_argument("--part", type=int, action="append", help="repeatable")
+    parser.add_argument(
+        "--input-name",
+        default=DEFAULT_INPUT_NAME,
+        help="input file name next to each solution (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="skip tracemalloc, which slows allocation-heavy solutions down",
+    )
+    parser.add_argument("--json", action="store_true", help="emit JSON lines")
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="reuse answers for unchanged inputs & sources (see aoc.results)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="default: $AOC_CACHE_DIR or .cache/results in the repository",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="checkpoint long runs & continue interrupted ones (see aoc.checkpoint)",
+    )
+
+    parser.add_argument(
+        "--telemetry",
+        type=telemetry.Level.parse,
+        help="emit progress of the solutions' loops: info or debug (see aoc.telemetry)",
+    )
+    parser.add_argument(
+        "--telemetry-file", help="append the telemetry JSON lines here, not to stderr"
+    )
+
+    group = parser.add_argument_group("anytime searches (see aoc.anytime)")
+    group.add_argument(
+        "--budget-seconds",
+        type=float,
+        help="stop every search after this many seconds with its best answer & bound",
+    )
+    group.add_argument(
+        "--budget-expansions",
+        type=int,
+        help="stop every search after this many expansions with its best answer & bound",
+    )
+
+    group = parser.add_argument_group("profiling")
+    group.add_argument(
+        "--profile",
+        type=profiling.Mode,
+        choices=list(profiling.Mode),
+        action="append",
+        help="repeatable, see aoc.profiling",
+    )
+    group.add_argument(
+        "--profile-dir",
+        type=Path,
+        default=profiling.DEFAULT_OUTPUT_DIR,
+        help="where the profiles are written (default: %(default)s)",
+    )
+    group.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="allocation sites in the memory report (default: %(default)s)",
+    )
+    group.add_argument(
+        "--sample-interval",
+        type=float,
+        default=0.005,
+        help="seconds between stack samples (default: %(default)s)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_arguments(argv)
+    solutions = discover_solutions(
+        years=set(args.year) if args.year else None,
+        days=set(args.day) if args.day else None,
+        parts=set(args.part) if args.part else None,
+    )
+
+    if not args.json:
+        print(
+            f"{'solution':<32} {'answer':<20} "
+            f"{'wall [s]':>10} {'cpu [s]':>10} {'peak mem [MiB]':>14}"
+        )
+
+    if args.resume:
+        checkpoint.enable_resume()
+    if args.telemetry is not None:
+        telemetry.configure(args.telemetry, args.telemetry_file)
+    budgeted = args.budget_seconds is not None or args.budget_expansions is not None
+    if budgeted:
+        anytime.configure(args.budget_seconds, args.budget_expansions)
+
+    profile = None
+    if args.profile:
+        profile = profiling.Settings(
+            frozenset(args.profile), args.profile_dir, args.top, args.sample_interval
+        )
+
+    # the answers of stopped searches may not be optimal, so they aren't cached
+    cache = ResultCache(args.cache_dir) if args.cache and not budgeted else None
+    results = []
+    for solution in solutions:
+        result = run_solution(
+            solution,
+            solution.input_path(args.input_name),
+            trace_memory=not args.no_memory,
+            profile=profile,
+            cache=cache,
+        )
+        results.append(result)
+        if args.json:
+            print(json.dumps(result.to_json()), flush=True)
+        else:
+            print(format_result(result), flush=True)
+            for path in result.profiles:
+                print(f"    profile: {path}")
+
+    ok = [result for result in results if result.status == Status.OK]
+    ran = [result for result in ok if not result.cached]
+    if not args.json:
+        print(
+            f"\n{len(ran)} ran, {len(ok) - len(ran)} cached, "
+            f"{sum(r.status == Status.MISSING_INPUT for r in results)} missing input, "
+            f"{sum(r.status == Status.FAILED for r in results)} failed; "
+            f"total {sum(r.wall_time for r in ran):.3f}s wall, "
+            f"{sum(r.cpu_time for r in ran):.3f}s cpu"
+        )
+
+    return int(any(result.status == Status.FAILED for result in results))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
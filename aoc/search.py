@@ -0,0 +1,358 @@
+"""
+Graph searches over states encoded as ints, shared by the path-finding puzzles.
+
+Solutions describe their state space with a `neighbours` function and a goal test, and
+encode their states as ints (e.g. a `Grid` index, or `position * 4 + direction`), which
+keeps the visited bookkeeping and the frontiers compact:
+
+    result = bfs([start], lambda index: reachable_neighbours(grid, index), is_target)
+    print(result.cost, result.stats.expanded)
+
+If the states are bounded by a known `num_states`, visited states are tracked in a
+bitmap instead of a set.
+
+Every search fills `SearchStats` with how many states it generated, deduplicated, pruned
+& expanded, the high-water mark of its frontier and the time spent in bound functions.
+The hand-written searches of the solutions take a `stats` argument to fill as well, so
+pruning can be tuned with data:
+
+    stats = SearchStats()
+    get_max_geode_score(blueprint, stats)
+    print(stats.summary())
+"""
+import dataclasses
+import functools
+import heapq
+import time
+import typing
+
+from aoc.anytime import Budget
+from aoc.checkpoint import Checkpoints
+
+P = typing.ParamSpec("P")
+R = typing.TypeVar("R")
+
+Neighbours = typing.Callable[[int], typing.Iterable[int]]
+# neighbours together with the cost to move there
+WeightedNeighbours = typing.Callable[[int], typing.Iterable[tuple[int, int]]]
+IsGoal = typing.Callable[[int], bool]
+# a lower bound of the remaining cost to a goal
+Heuristic = typing.Callable[[int], int]
+
+
+class BitSet:
+    """A set of ints in `range(size)`, stored as one bit each"""
+
+    __slots__ = ("bits", "length")
+
+    def __init__(self, size: int) -> None:
+        self.bits = bytearray((size + 7) // 8)
+        self.length = 0
+
+    def add(self, value: int) -> None:
+        index, mask = value >> 3, 1 << (value & 7)
+        if not self.bits[index] & mask:
+            self.bits[index] |= mask
+            self.length += 1
+
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, int):
+            return False
+        return bool(self.bits[value >> 3] & (1 << (value & 7)))
+
+    def __len__(self) -> int:
+        return self.length
+
+
+Visited = set[int] | BitSet
+
+
+def new_visited(num_states: int | None = None) -> Visited:
+    return set() if num_states is None else BitSet(num_states)
+
+
+@dataclasses.dataclass
+class SearchStats:
+    # states produced by expansions, i.e. the candidates for the frontier
+    generated: int = 0
+    # states whose neighbours were generated
+    expanded: int = 0
+    # states added to the frontier
+    pushed: int = 0
+    # generated states dropped, since they were reached (as cheaply) before
+    deduplicated: int = 0
+    # generated states dropped, since their bound can't beat the best result so far
+    pruned: int = 0
+    # the most states that waited in the frontier at once
+    max_frontier: int = 0
+    # seconds spent in the bound functions & heuristics wrapped by `timed`
+    bound_time: float = 0.0
+
+    @property
+    def dedup_rate(self) -> float:
+        return self.deduplicated / self.generated if self.generated else 0.0
+
+    @property
+    def prune_rate(self) -> float:
+        return self.pruned / self.generated if self.generated else 0.0
+
+    def track_frontier(self, size: int) -> None:
+        if size > self.max_frontier:
+            self.max_frontier = size
+
+    def timed(self, bound: typing.Callable[P, R]) -> typing.Callable[P, R]:
+        """Wrap a bound function, so that the time spent in it is added up"""
+
+        @functools.wraps(bound)
+        def timed_bound(*args: P.args, **kwargs: P.kwargs) -> R:
+            started = time.perf_counter()
+            try:
+                return bound(*args, **kwargs)
+            finally:
+                self.bound_time += time.perf_counter() - started
+
+        return timed_bound
+
+    def merge(self, other: "SearchStats") -> "SearchStats":
+        """The combined stats of two searches, e.g. of the parts of a puzzle"""
+        return SearchStats(
+            generated=self.generated + other.generated,
+            expanded=self.expanded + other.expanded,
+            pushed=self.pushed + other.pushed,
+            deduplicated=self.deduplicated + other.deduplicated,
+            pruned=self.pruned + other.pruned,
+            max_frontier=max(self.max_frontier, other.max_frontier),
+            bound_time=self.bound_time + other.bound_time,
+        )
+
+    def summary(self) -> str:
+        return (
+            f"{self.generated} generated, {self.expanded} expanded, "
+            f"{self.pushed} pushed, {self.deduplicated} deduplicated "
+            f"({self.dedup_rate:.1%}), {self.pruned} pruned ({self.prune_rate:.1%}), "
+            f"frontier of up to {self.max_frontier}, {self.bound_time:.3f}s in bounds"
+        )
+
+
+@dataclasses.dataclass
+class SearchResult:
+    # the goal state that was reached, None if no goal is reachable
+    goal: int | None
+    # of the best path to the goal, i.e. the number of steps for unweighted searches
+    cost: int
+    visited: Visited
+    stats: SearchStats
+    # if the budget ran out first: no goal can be reached more cheaply than this
+    lower_bound: int | None = None
+
+    @property
+    def found(self) -> bool:
+        return self.goal is not None
+
+
+def bfs(
+    starts: typing.Iterable[int],
+    neighbours: Neighbours,
+    is_goal: IsGoal,
+    num_states: int | None = None,
+    stats: SearchStats | None = None,
+) -> SearchResult:
+    """Breadth-first search for the closest goal, expanding one layer at a time"""
+    stats = stats or SearchStats()
+    visited = new_visited(num_states)
+
+    layer = []
+    for start in starts:
+        if start in visited:
+            continue
+        if is_goal(start):
+            visited.add(start)
+            return SearchResult(start, 0, visited, stats)
+        visited.add(start)
+        layer.append(start)
+    stats.pushed += len(layer)
+    stats.track_frontier(len(layer))
+
+    distance = 0
+    while layer:
+        distance += 1
+        next_layer = []
+        # counted in locals, which is cheaper in this hot loop
+        expanded = generated = duplicates = 0
+        try:
+            for state in layer:
+                expanded += 1
+                for neighbour in neighbours(state):
+                    generated += 1
+                    if neighbour in visited:
+                        duplicates += 1
+                        continue
+                    visited.add(neighbour)
+                    if is_goal(neighbour):
+                        return SearchResult(neighbour, distance, visited, stats)
+                    next_layer.append(neighbour)
+        finally:
+            stats.expanded += expanded
+            stats.generated += generated
+            stats.deduplicated += duplicates
+            stats.pushed += len(next_layer)
+            stats.track_frontier(len(next_layer))
+        layer = next_layer
+    return SearchResult(None, -1, visited, stats)
+
+
+def a_star(  # noqa: PLR0913
+    starts: typing.Iterable[int],
+    neighbours: WeightedNeighbours,
+    is_goal: IsGoal,
+    heuristic: Heuristic | None = None,
+    num_states: int | None = None,
+    stats: SearchStats | None = None,
+    budget: Budget | None = None,
+    checkpoints: Checkpoints | None = None,
+) -> SearchResult:
+    """
+    Best-first search on a binary heap for the cheapest path to a goal. The heuristic has
+    to be consistent, i.e. never drop by more than the cost of a move, so that a state is
+    final once it got expanded. Without a heuristic, this is Dijkstra's algorithm.
+
+    Once a budget runs out, the search stops without a goal, but with the lowest estimate
+    in the frontier as a lower bound of the cost. With checkpoints, the frontier & the
+    visited states are saved periodically, and a resumed search continues from them.
+    """
+    stats = stats or SearchStats()
+    deadline = budget.start() if budget else None
+    if checkpoints and (snapshot := checkpoints.load()) is not None:
+        frontier, best_costs, visited, saved_stats = snapshot
+        vars(stats).update(vars(saved_stats))
+    else:
+        frontier, best_costs = _start_frontier(starts, heuristic)
+        visited = new_visited(num_states)
+        stats.pushed += len(frontier)
+
+    goal, goal_cost = None, -1
+    while frontier:
+        if deadline and deadline.exceeded(stats.expanded):
+            return SearchResult(None, -1, visited, stats, lower_bound=frontier[0][0])
+        if checkpoints and checkpoints.due(stats.expanded):
+            checkpoints.save((frontier, best_costs, visited, stats))
+        _, cost, state = heapq.heappop(frontier)
+        if state in visited:
+            # an outdated entry, the state was reached more cheaply in the meantime
+            continue
+        visited.add(state)
+        if is_goal(state):
+            goal, goal_cost = state, cost
+            break
+
+        stats.expanded += 1
+        for neighbour, move_cost in neighbours(state):
+            stats.generated += 1
+            new_cost = cost + move_cost
+            if neighbour in visited or new_cost >= best_costs.get(
+                neighbour, new_cost + 1
+            ):
+                stats.deduplicated += 1
+                continue
+            best_costs[neighbour] = new_cost
+            estimate = new_cost + (heuristic(neighbour) if heuristic else 0)
+            heapq.heappush(frontier, (estimate, new_cost, neighbour))
+            stats.pushed += 1
+        stats.track_frontier(len(frontier))
+    if checkpoints:
+        checkpoints.clear()
+    return SearchResult(goal, goal_cost, visited, stats)
+
+
+def _start_frontier(
+    starts: typing.Iterable[int], heuristic: Heuristic | None
+) -> tuple[list[tuple[int, int, int]], dict[int, int]]:
+    best_costs = {}
+    frontier = []
+    for start in starts:
+        best_costs[start] = 0
+        estimate = heuristic(start) if heuristic else 0
+        frontier.append((estimate, 0, start))
+    heapq.heapify(frontier)
+    return frontier, best_costs
+
+
+def dijkstra(
+    starts: typing.Iterable[int],
+    neighbours: WeightedNeighbours,
+    is_goal: IsGoal,
+    num_states: int | None = None,
+    stats: SearchStats | None = None,
+) -> SearchResult:
+    return a_star(starts, neighbours, is_goal, num_states=num_states, stats=stats)
+
+
+def bidirectional_bfs(
+    start: int,
+    goal: int,
+    neighbours: Neighbours,
+    reverse_neighbours: Neighbours | None = None,
+    stats: SearchStats | None = None,
+) -> SearchResult:
+    """
+    Breadth-first search from both ends, always growing the smaller frontier by a layer.
+    `reverse_neighbours` are the states that lead to a state, which can be omitted for
+    undirected graphs.
+    """
+    reverse_neighbours = reverse_neighbours or neighbours
+    stats = stats or SearchStats()
+    stats.pushed += 2 if start != goal else 1
+    forward_distances = {start: 0}
+    backward_distances = {goal: 0}
+    forward_layer, backward_layer = [start], [goal]
+
+    best = 0 if start == goal else None
+    while best is None and forward_layer and backward_layer:
+        stats.track_frontier(len(forward_layer) + len(backward_layer))
+        if len(forward_layer) <= len(backward_layer):
+            forward_layer, best = _expand_layer(
+                forward_layer, neighbours, forward_distances, backward_distances, stats
+            )
+        else:
+            backward_layer, best = _expand_layer(
+                backward_layer,
+                reverse_neighbours,
+                backward_distances,
+                forward_distances,
+                stats,
+            )
+
+    visited = set(forward_distances) | set(backward_distances)
+    if best is None:
+        return SearchResult(None, -1, visited, stats)
+    return SearchResult(goal, best, visited, stats)
+
+
+def _expand_layer(
+    layer: list[int],
+    neighbours: Neighbours,
+    distances: dict[int, int],
+    other_distances: dict[int, int],
+    stats: SearchStats,
+) -> tuple[list[int], int | None]:
+    """
+    The next layer, and the shortest connection to the other side if there's one. The
+    whole layer is expanded, since its first connection isn't necessarily the shortest.
+    """
+    best: int | None = None
+    next_layer = []
+    for state in layer:
+        stats.expanded += 1
+        distance = distances[state] + 1
+        for neighbour in neighbours(state):
+            stats.generated += 1
+            if neighbour in distances:
+                stats.deduplicated += 1
+                continue
+            distances[neighbour] = distance
+            next_layer.append(neighbour)
+            if neighbour in other_distances:
+                total = distance + other_distances[neighbour]
+                best = total if best is None else min(best, total)
+    stats.pushed += len(next_layer)
+    return next_layer, best
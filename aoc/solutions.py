@@ -0,0 +1,117 @@
+"""
+Discovery & loading of the puzzle solutions, independent of the working directory.
+
+Solutions live in `<year>/day<XX>[_<title>]/part<N>[-<variant>].py` and are imported as
+regular modules (e.g. `2023.day05.part2-bruteforce`) with the repository root on the
+import path. That way they can be pickled by reference and shared with worker processes.
+"""
+import dataclasses
+import importlib
+import re
+import sys
+import types
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_INPUT_NAME = "input.txt"
+
+_YEAR_DIR_PATTERN = re.compile(r"^\d{4}$")
+_DAY_DIR_PATTERN = re.compile(r"^day(\d{2})(?:_\w+)?$")
+_PART_FILE_PATTERN = re.compile(r"^part(\d)(?:-(\w+))?\.py$")
+
+
+@dataclasses.dataclass(frozen=True, order=True)
+class Solution:
+    year: int
+    day: int
+    part: int
+    variant: str
+    path: Path = dataclasses.field(compare=False)
+
+    @property
+    def name(self) -> str:
+        name = f"{self.year}/day{self.day:02d} part{self.part}"
+        if self.variant:
+            name += f" ({self.variant})"
+        return name
+
+    @property
+    def slug(self) -> str:
+        """The name as a file name, e.g. for reports"""
+        slug = f"{self.year}-day{self.day:02d}-part{self.part}"
+        if self.variant:
+            slug += f"-{self.variant}"
+        return slug
+
+    @property
+    def module_name(self) -> str:
+        return ".".join(self.path.relative_to(ROOT_DIR).with_suffix("").parts)
+
+    @classmethod
+    def from_path(cls, path: str | Path) -> "Solution":
+        """The solution of a part's file, e.g. its `__file__`"""
+        path = Path(path).resolve()
+        day_match = _DAY_DIR_PATTERN.match(path.parent.name)
+        part_match = _PART_FILE_PATTERN.match(path.name)
+        year_match = _YEAR_DIR_PATTERN.match(path.parent.parent.name)
+        if not (year_match and day_match and part_match):
+            raise ValueError(f"{path} isn't the file of a solution")
+        return cls(
+            int(path.parent.parent.name),
+            int(day_match.group(1)),
+            int(part_match.group(1)),
+            part_match.group(2) or "",
+            path,
+        )
+
+    def input_path(self, input_name: str = DEFAULT_INPUT_NAME) -> Path:
+        return self.path.with_name(input_name)
+
+    def load(self) -> types.ModuleType:
+        return load_module(self.module_name)
+
+
+def load_module(module_name: str) -> types.ModuleType:
+    if str(ROOT_DIR) not in sys.path:
+        sys.path.insert(0, str(ROOT_DIR))
+    return importlib.import_module(module_name)
+
+
+def clear_caches(module: types.ModuleType) -> None:
+    """Reset all cached functions of a solution (`cache_clear`), so runs don't share state"""
+    for value in vars(module).values():
+        if callable(cache_clear := getattr(value, "cache_clear", None)):
+            cache_clear()
+
+
+def discover_solutions(
+    years: set[int] | None = None,
+    days: set[int] | None = None,
+    parts: set[int] | None = None,
+) -> list[Solution]:
+    solutions = []
+    for year_dir in ROOT_DIR.iterdir():
+        if not (year_dir.is_dir() and _YEAR_DIR_PATTERN.match(year_dir.name)):
+            continue
+
+        year = int(year_dir.name)
+        for day_dir in year_dir.iterdir():
+            if not (day_match := _DAY_DIR_PATTERN.match(day_dir.name)):
+                continue
+
+            day = int(day_match.group(1))
+            for path in day_dir.iterdir():
+                if not (part_match := _PART_FILE_PATTERN.match(path.name)):
+                    continue
+
+                part = int(part_match.group(1))
+                variant = part_match.group(2) or ""
+                solutions.append(Solution(year, day, part, variant, path))
+
+    return sorted(
+        solution
+        for solution in solutions
+        if (years is None or solution.year in years)
+        and (days is None or solution.day in days)
+        and (parts is None or solution.part in parts)
+    )
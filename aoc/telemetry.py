@@ -0,0 +1,144 @@
+"""
+Progress telemetry for long-running loops, instead of printing on every iteration.
+
+Solutions create a `Channel` and update counters & gauges in their loops. Nothing is
+recorded unless telemetry is enabled for the channel's level, and enabled channels emit
+at most one JSON line per interval, with the counters, their rates per second & the
+latest gauge values:
+
+    progress = telemetry.Channel("2022/day15 perimeter")
+    for sensor in sensors:
+        ...
+        progress.count("sensors")
+        progress.gauge("candidates", len(candidates))
+    progress.emit("done")
+
+Telemetry is configured with `AOC_TELEMETRY=info|debug` and `AOC_TELEMETRY_FILE=<path>`
+(JSON lines are appended to it, stderr otherwise), which worker processes inherit, or
+with `aoc.runner --telemetry LEVEL --telemetry-file PATH`.
+"""
+import dataclasses
+import enum
+import json
+import os
+import sys
+import time
+import typing
+
+LEVEL_VARIABLE = "AOC_TELEMETRY"
+FILE_VARIABLE = "AOC_TELEMETRY_FILE"
+# seconds between the records of a channel
+DEFAULT_INTERVAL = 1.0
+
+
+class Level(enum.IntEnum):
+    OFF = 0
+    INFO = 1
+    DEBUG = 2
+
+    @classmethod
+    def parse(cls, value: str) -> "Level":
+        try:
+            return cls[value.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown telemetry level: {value}") from None
+
+
+@dataclasses.dataclass
+class _Config:
+    level: Level = Level.OFF
+    interval: float = DEFAULT_INTERVAL
+    file_name: str | None = None
+    sink: typing.TextIO | None = None
+
+    def write(self, record: dict[str, typing.Any]) -> None:
+        if self.sink is None:
+            if self.file_name:
+                self.sink = open(self.file_name, "a")  # noqa: SIM115
+            else:
+                self.sink = sys.stderr
+        self.sink.write(json.dumps(record) + "\n")
+        self.sink.flush()
+
+
+_config = _Config(
+    level=Level.parse(os.environ.get(LEVEL_VARIABLE) or "off"),
+    file_name=os.environ.get(FILE_VARIABLE),
+)
+
+
+def configure(
+    level: Level,
+    file_name: str | None = None,
+    interval: float = DEFAULT_INTERVAL,
+) -> None:
+    """Reconfigure this process and the worker processes it starts afterwards"""
+    if _config.sink is not None and _config.sink is not sys.stderr:
+        _config.sink.close()
+    _config.level, _config.interval, _config.file_name = level, interval, file_name
+    _config.sink = None
+
+    os.environ[LEVEL_VARIABLE] = level.name.lower()
+    if file_name:
+        os.environ[FILE_VARIABLE] = file_name
+    else:
+        os.environ.pop(FILE_VARIABLE, None)
+
+
+class Channel:
+    """Counters & gauges of one loop, emitted together"""
+
+    __slots__ = ("name", "level", "counters", "gauges", "started", "next_emit")
+
+    def __init__(self, name: str, level: Level = Level.INFO) -> None:
+        self.name = name
+        self.level = level
+        self.counters: dict[str, int] = {}
+        self.gauges: dict[str, float] = {}
+        self.started = time.monotonic()
+        self.next_emit = self.started + _config.interval
+
+    @property
+    def enabled(self) -> bool:
+        """For guarding expensive gauge values, e.g. `if progress.enabled: ...`"""
+        return _config.level >= self.level
+
+    def count(self, name: str, increment: int = 1) -> None:
+        if _config.level < self.level:
+            return
+        self.counters[name] = self.counters.get(name, 0) + increment
+        self._maybe_emit()
+
+    def gauge(self, name: str, value: float) -> None:
+        if _config.level < self.level:
+            return
+        self.gauges[name] = value
+        self._maybe_emit()
+
+    def emit(self, event: str = "progress", **fields: typing.Any) -> None:
+        """Write a record right away, e.g. at the end of a loop"""
+        if _config.level < self.level:
+            return
+        now = time.monotonic()
+        elapsed = now - self.started
+        self.next_emit = now + _config.interval
+        _config.write(
+            {
+                "time": time.time(),
+                "pid": os.getpid(),
+                "channel": self.name,
+                "event": event,
+                "elapsed": round(elapsed, 3),
+                "counters": self.counters,
+                "rates": {
+                    name: round(value / elapsed, 1) if elapsed else None
+                    for name, value in self.counters.items()
+                },
+                "gauges": self.gauges,
+                **fields,
+            }
+        )
+
+    def _maybe_emit(self) -> None:
+        if time.monotonic() >= self.next_emit:
+            self.emit()
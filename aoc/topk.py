@@ -0,0 +1,47 @@
+"""
+The k largest values of a stream in O(k) memory, on a bounded min-heap.
+
+The smallest kept value sits at the root, so a new value is compared to it once and
+replaces it only if it's bigger. Partial results of independent chunks combine with
+`merge`, which makes the reduction parallel:
+
+    top = TopK(3)
+    for calories in calories_per_elf:
+        top.push(calories)
+    print(sum(top.largest()))
+"""
+import heapq
+import typing
+
+
+class TopK:
+    __slots__ = ("k", "heap")
+
+    def __init__(self, k: int, values: typing.Iterable[int] = ()) -> None:
+        if k < 1:
+            raise ValueError(f"k must be positive, not {k}")
+        self.k = k
+        self.heap: list[int] = []
+        self.extend(values)
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def push(self, value: int) -> None:
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, value)
+        elif value > self.heap[0]:
+            heapq.heapreplace(self.heap, value)
+
+    def extend(self, values: typing.Iterable[int]) -> None:
+        for value in values:
+            self.push(value)
+
+    def merge(self, other: "TopK") -> "TopK":
+        """Adds the values kept by another one, e.g. of another chunk"""
+        self.extend(other.heap)
+        return self
+
+    def largest(self) -> list[int]:
+        """The kept values, the largest first"""
+        return sorted(self.heap, reverse=True)